@@ -11,47 +11,47 @@ router = APIRouter()
 #/api/v1/prod/generation/
 
 @router.get("/gender-options", response_model=List[GenderOption], status_code=status.HTTP_200_OK)
-def get_gender_options(
+async def get_gender_options(
         _: int = Depends(validate_user_token),
         service: HairModelOptionApplicationService = Depends(get_hair_model_option_application_service)
 ) -> List[GenderOption]:
-    return service.get_gender_options()
+    return await service.get_gender_options()
 
 @router.get("/hairstyle-options", response_model=List[HairStyleOption], status_code=status.HTTP_200_OK)
-def get_hair_style_options(
+async def get_hair_style_options(
         gender_id: int,
         _: int = Depends(validate_user_token),
         service: HairModelOptionApplicationService = Depends(get_hair_model_option_application_service)
 ) -> List[HairStyleOption]:
-    return service.get_hair_style_options(gender_id=gender_id)
+    return await service.get_hair_style_options(gender_id=gender_id)
 
 @router.get("/hairstyle-length-options", response_model=List[HairStyleLengthOption], status_code=status.HTTP_200_OK)
-def get_hair_style_length_options(
+async def get_hair_style_length_options(
         hair_style_id: int,
         _: int = Depends(validate_user_token),
         service: HairModelOptionApplicationService = Depends(get_hair_model_option_application_service)
 ) -> List[HairStyleLengthOption]:
-    return service.get_hair_style_length_options(hair_style_id)
+    return await service.get_hair_style_length_options(hair_style_id)
 
 @router.get("/hair-design-color-options", response_model=List[HairDesignColorOption], status_code=status.HTTP_200_OK)
-def get_hair_design_color_options(
+async def get_hair_design_color_options(
         hair_style_id: int,
         length_id: Optional[int] = None,
         _: int = Depends(validate_user_token),
         service: HairModelOptionApplicationService = Depends(get_hair_model_option_application_service)
 ) -> List[HairDesignColorOption]:
-    return service.get_hair_design_color_options(hair_style_id=hair_style_id, length_id=length_id)
+    return await service.get_hair_design_color_options(hair_style_id=hair_style_id, length_id=length_id)
 
 @router.get("/background-options")
-def get_background_options(
+async def get_background_options(
         _: int = Depends(validate_user_token),
         service: HairModelOptionApplicationService = Depends(get_hair_model_option_application_service)
 ) -> List[BackgroundOption]:
-    return service.get_background_options()
+    return await service.get_background_options()
 
 @router.get("/image-resolution-options")
-def get_image_resolution_options(
+async def get_image_resolution_options(
         _: int = Depends(validate_user_token),
         service: HairModelOptionApplicationService = Depends(get_hair_model_option_application_service)
 ) -> List[ImageResolutionOption]:
-    return service.get_image_resolution_options()
+    return await service.get_image_resolution_options()
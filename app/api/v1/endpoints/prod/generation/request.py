@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
 
 from app.application.services.generation.dto.query import GenerationRequestStatusResponse, GenerationRequestDetails, \
     GenerationRequestStatusWithDetails
@@ -23,33 +24,47 @@ async def request_generation(
     return await service.request_generation(request, user_id)
 
 @router.post("/{generation_request_id}/cancel", status_code=status.HTTP_200_OK)
-def cancel_generation(
+async def cancel_generation(
         generation_request_id: int,
         user_id: int = Depends(validate_user_token),
         service: RequestGenerationApplicationService = Depends(get_request_generation_application_service)
 ):
-    service.cancel_generation(generation_request_id, user_id)
+    await service.cancel_generation(generation_request_id, user_id)
 
 @router.get("/{generation_request_id}/details", response_model=GenerationRequestDetails, status_code=status.HTTP_200_OK)
-def get_generation_request_details(
+async def get_generation_request_details(
         generation_request_id: int,
         user_id: int = Depends(validate_user_token),
         service: GenerationRequestQueryService = Depends(get_generation_request_query_service)
 ) -> GenerationRequestDetails:
-    return service.get_generated_request_details(generation_request_id, user_id)
+    return await service.get_generated_request_details(generation_request_id, user_id)
 
 @router.get("/{generation_request_id}/status", response_model=GenerationRequestStatusResponse, status_code=status.HTTP_200_OK)
-def get_generation_request_status(
+async def get_generation_request_status(
         generation_request_id: int,
         user_id: int = Depends(validate_user_token),
         service: GenerationRequestQueryService = Depends(get_generation_request_query_service)
 ) -> GenerationRequestStatusResponse:
-    return service.get_generation_request_status(generation_request_id, user_id)
+    return await service.get_generation_request_status(generation_request_id, user_id)
+
+@router.get("/{generation_request_id}/events", status_code=status.HTTP_200_OK)
+async def stream_generation_progress(
+        generation_request_id: int,
+        user_id: int = Depends(validate_user_token),
+        service: GenerationRequestQueryService = Depends(get_generation_request_query_service)
+) -> StreamingResponse:
+    """생성 진행 상황 SSE 스트림 - job 완료마다 progress, 마지막에 result 이벤트를 보낸다."""
+    events = await service.open_generation_progress_stream(generation_request_id, user_id)
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @router.get("/latest_with_details", response_model=GenerationRequestStatusWithDetails, status_code=status.HTTP_200_OK)
-def get_generation_request_status_with_details(
+async def get_generation_request_status_with_details(
         user_id: int = Depends(validate_user_token),
         service: GenerationRequestQueryService = Depends(get_generation_request_query_service)
 ) -> GenerationRequestStatusWithDetails:
-    return service.get_latest_generation_request_status_with_details(user_id)
+    return await service.get_latest_generation_request_status_with_details(user_id)
 
@@ -1,44 +1,66 @@
-from fastapi import Depends, APIRouter
-from typing import List
+from fastapi import Depends, APIRouter, Query, Response
+from typing import List, Optional
 
 from app.application.services.image.dto.query import GeneratedImageData, GeneratedImageGroupData
 from app.application.services.image.management import ImageManagementApplicationService, get_image_management_application_service
 from app.application.services.image.query import ImageQueryApplicationService, \
     get_image_query_application_service
 from app.application.services.user.auth import validate_user_token
+from app.core.enums.image_size import ImageSizeEnum
 
 router = APIRouter()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_IMAGE_GROUP_PAGE_SIZE = 20
+
 # /api/v1/prod/image/
 
 @router.get("/images/by-group")
-def get_image_by_group(
+async def get_image_by_group(
         generated_image_group_id: int,
+        size: ImageSizeEnum = ImageSizeEnum.FULL,
         user_id: int = Depends(validate_user_token),
         service: ImageQueryApplicationService = Depends(get_image_query_application_service)
 ) -> List[GeneratedImageData]:
-    return service.get_generated_image_list_by_image_group(
+    return await service.get_generated_image_list_by_image_group(
         generated_image_group_id=generated_image_group_id,
-        user_id=user_id
+        user_id=user_id,
+        size=size
     )
 
 @router.get("/images/by-request")
-def get_image_by_request(
+async def get_image_by_request(
         generation_request_id: int,
+        size: ImageSizeEnum = ImageSizeEnum.FULL,
         user_id: int = Depends(validate_user_token),
         service: ImageQueryApplicationService = Depends(get_image_query_application_service)
 ) -> List[GeneratedImageData]:
-    return service.get_generated_image_list_by_generation_request(
+    return await service.get_generated_image_list_by_generation_request(
         generation_request_id=generation_request_id,
-        user_id=user_id
+        user_id=user_id,
+        size=size
     )
 
+# 응답 body 는 기존과 같은 배열이고, 다음 페이지 cursor 는 X-Next-Cursor header 로 준다. (마지막 페이지면 header 없음)
+# cursor / limit 를 모두 생략한 기존 client 는 전체 목록을 받는다.
 @router.get("/image_groups")
-def get_image_groups_by_user(
+async def get_image_groups_by_user(
+        response: Response,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = Query(default=None, ge=1, le=100),
         user_id: int = Depends(validate_user_token),
         service: ImageQueryApplicationService = Depends(get_image_query_application_service)
 ) -> List[GeneratedImageGroupData]:
-    return service.get_generated_image_group_list_by_user(user_id=user_id)
+    if cursor is not None and limit is None:
+        limit = DEFAULT_IMAGE_GROUP_PAGE_SIZE
+    page = await service.get_generated_image_group_page_by_user(
+        user_id=user_id,
+        limit=limit,
+        cursor=cursor
+    )
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
 
 @router.patch("/{generated_image_group_id}/rating")
 def update_rating_on_generated_image_group(
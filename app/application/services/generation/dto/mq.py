@@ -5,6 +5,8 @@ class MQConsumeMessage(BaseModel):
     image_generation_job_id: int
     webui_png_info: str
     s3_key: str
+    # 추론 서버가 발행 메시지의 값을 그대로 돌려주는 경우에만 존재
+    generation_request_id: Optional[int] = None
 
     def to_str(self) -> str:
         return self.model_dump_json()
@@ -16,6 +16,14 @@ class GenerationRequestStatusResponse(BaseModel):
     remaining_sec: int
     generated_image_group_id: Optional[int] = None
 
+class GenerationProgressEvent(BaseModel):
+    generation_request_id: int
+    generation_status: GenerationResultEnum
+    remaining_sec: int
+    completed_count: int
+    total_count: int
+    generated_image_group_id: Optional[int] = None
+
 class GenerationRequestDetails(BaseModel):
     generation_request_id: int
     gender: GenderInDB
@@ -1,13 +1,14 @@
 import json
 import logging
-from typing import List
+from datetime import datetime, UTC
+from typing import List, Optional
 
 from app.application.services.generation.dto.mq import MQConsumeMessage
 from app.application.services.transactional_service import TransactionalService
-from app.core.config import aws_s3_setting, fcm_setting
-from app.core.db.base import get_db
+from app.core.config import fcm_setting
+from app.core.db.base import get_db, AsyncSessionLocal
 from app.core.enums.generation_status import GenerationStatusEnum, GenerationResultEnum
-from app.core.utils import generate_unique_datatime_uuid_key, concatenate_images_horizontally, compress_and_resize_image
+from app.core.enums.thumbnail_status import ThumbnailStatusEnum
 from app.domain.generation.models.generation import ImageGenerationJob, GenerationRequest
 from app.domain.generation.models.image import GeneratedImage
 from app.domain.generation.schemas.generated_image import GeneratedImageCreate
@@ -16,20 +17,24 @@ from app.domain.generation.schemas.generation_request import GenerationRequestUp
 from app.domain.generation.schemas.image_generation_job import ImageGenerationJobUpdate
 from app.domain.generation.services.generation_domain_service import should_create_image_group
 from app.domain.hair_model.models.hair import HairStyle
+from app.domain.notification.schemas.notification_outbox import NotificationOutboxCreate
 from app.domain.user.models.user import User
+from app.infrastructure.cache.generation_status_cache import GenerationStatusCache, GenerationStatusDocument, \
+    get_generation_status_cache
+from app.infrastructure.cache.job_expiry_schedule import JobExpirySchedule, get_job_expiry_schedule
 from app.infrastructure.database.transaction import transactional
 from app.infrastructure.database.unit_of_work import UnitOfWork, get_unit_of_work
 from app.infrastructure.fcm.dto.fcm_message import FCMGenerationResultData
-from app.infrastructure.fcm.fcm_service import FCMService, get_fcm_service
 from app.infrastructure.repositories.generation.generation import (
     GenerationRequestRepository,
     ImageGenerationJobRepository,
     GeneratedImageRepository,
     GeneratedImageGroupRepository, get_generation_request_repository, get_image_generation_job_repository,
-    get_generated_image_repository, get_generated_image_group_repository
+    get_generated_image_repository, get_generated_image_group_repository, AsyncImageGenerationJobRepository
 )
+from app.infrastructure.repositories.notification.notification_outbox import NotificationOutboxRepository, \
+    get_notification_outbox_repository
 from app.infrastructure.repositories.user.user import UserRepository, get_user_repository
-from app.infrastructure.s3.s3_client import S3Client, get_s3_client
 
 logger = logging.getLogger(__name__)
 
@@ -43,8 +48,9 @@ class MessageHandler(TransactionalService):
             generated_image_repo: GeneratedImageRepository,
             generated_image_group_repo: GeneratedImageGroupRepository,
             user_repo: UserRepository,
-            s3_client: S3Client,
-            fcm_service: FCMService,
+            notification_outbox_repo: NotificationOutboxRepository,
+            generation_status_cache: GenerationStatusCache,
+            job_expiry_schedule: JobExpirySchedule,
             unit_of_work: UnitOfWork,
     ):
         super().__init__(unit_of_work)
@@ -53,26 +59,54 @@ class MessageHandler(TransactionalService):
         self.generated_image_repo = generated_image_repo
         self.generated_image_group_repo = generated_image_group_repo
         self.user_repo = user_repo
-        self.s3_client = s3_client
-        self.fcm_service = fcm_service
+        self.notification_outbox_repo = notification_outbox_repo
+        self.generation_status_cache = generation_status_cache
+        self.job_expiry_schedule = job_expiry_schedule
 
     @transactional
-    def process_message(self, body: bytes) -> None:
-        """메시지 처리의 메인 엔트리포인트"""
+    def process_message(self, body: bytes) -> Optional[int]:
+        """
+        메시지 처리의 메인 엔트리포인트
+        마지막 job 으로 이미지 그룹이 생성된 경우 그 id 를 반환한다. (썸네일은 트랜잭션 밖에서 만든다.)
+        """
         try:
             data_dict = json.loads(body)
             message = MQConsumeMessage(**data_dict)
 
             logger.info(f"[MQ] Consumed Job ID: {message.image_generation_job_id}. DETAILS: {message.to_str()}")
 
-            image_generation_job = self._update_generation_job(message)
+            generation_request_id = message.generation_request_id
+            if generation_request_id is None:
+                generation_request_id = self.image_generation_job_repo.get(message.image_generation_job_id).generation_request_id
+
+            # 같은 request 의 마지막 job 을 여러 consumer 가 동시에 처리해도 그룹이 한 번만 생성되도록 row lock 을 먼저 잡는다.
+            generation_request = self.generation_request_repo.get_for_update(generation_request_id)
+
+            self._update_generation_job(message)
 
-            generation_request = self.generation_request_repo.get(image_generation_job.generation_request_id)
             image_generation_job_list = self.image_generation_job_repo.get_all_by_generation_request(
-                generation_request_id=image_generation_job.generation_request_id
+                generation_request_id=generation_request_id
             )
+            generated_image_group_id = None
             if should_create_image_group(generation_request, image_generation_job_list):
-                self._create_and_notify_image_group(generation_request.id, image_generation_job_list)
+                generated_image_group_id = self._create_and_notify_image_group(generation_request.id, image_generation_job_list)
+                status_document = GenerationStatusDocument.of(
+                    generation_request, image_generation_job_list, GenerationResultEnum.SUCCEED, generated_image_group_id
+                )
+            else:
+                status_document = GenerationStatusDocument.of(generation_request, image_generation_job_list)
+
+            # 상태 조회용 read model 은 commit 이후에 기록한다.
+            self.unit_of_work.on_commit(
+                lambda: self.generation_status_cache.save_sync(
+                    status_document, set_latest=generated_image_group_id is not None
+                )
+            )
+            # 완료된 job 은 더 이상 만료 타이머가 필요 없다.
+            self.unit_of_work.on_commit(
+                lambda: self.job_expiry_schedule.unschedule_sync([message.image_generation_job_id])
+            )
+            return generated_image_group_id
 
         except Exception as e:
             logger.error(f"Error processing message: {e}", exc_info=True)
@@ -91,13 +125,13 @@ class MessageHandler(TransactionalService):
             self,
             generation_request_id: int,
             image_generation_jobs: List[ImageGenerationJob]
-    ) -> None:
+    ) -> int:
         """이미지 그룹 생성 및 알림 처리"""
 
         generation_request_with_relation = self.generation_request_repo.get_with_all_relations(generation_request_id)
 
         # 이미지 및 그룹 생성
-        self._create_generated_images(
+        generated_image_group_id = self._create_generated_images(
             generation_request_with_relation,
             image_generation_jobs,
         )
@@ -112,35 +146,39 @@ class MessageHandler(TransactionalService):
 
         user: User = self.user_repo.get(generation_request_with_relation.user_id)
 
-        # FCM 알림 전송
-        # TODO: user fcm token null 값이면 어떻게 동작하지?
-        fcm_data = FCMGenerationResultData(generation_status=GenerationResultEnum.SUCCEED)
-        self.fcm_service.send_to_token(
-            token=user.fcm_token,
-            title=fcm_setting.SUCCESS_TITLE,
-            body=fcm_setting.SUCCESS_BODY,
-            category=fcm_setting.CATEGORY,
-            identifier=fcm_setting.IDENTIFIER_PREFIX + str(generation_request_id),
-            data=fcm_data.to_fcm_data(),
-        )
+        # FCM 알림은 outbox 에 기록만 하고, 전송은 commit 이후 sender task 가 한다.
+        if user.fcm_token:
+            fcm_data = FCMGenerationResultData(generation_status=GenerationResultEnum.SUCCEED)
+            self.notification_outbox_repo.create(
+                obj_in=NotificationOutboxCreate(
+                    token=user.fcm_token,
+                    title=fcm_setting.SUCCESS_TITLE,
+                    body=fcm_setting.SUCCESS_BODY,
+                    category=fcm_setting.CATEGORY,
+                    identifier=fcm_setting.IDENTIFIER_PREFIX + str(generation_request_id),
+                    data=fcm_data.to_fcm_data(),
+                    next_attempt_at=datetime.now(UTC),
+                    user_id=user.id,
+                )
+            )
+        return generated_image_group_id
 
     def _create_generated_images(
             self,
             generation_request_with_relation: GenerationRequest,
             image_generation_jobs: List[ImageGenerationJob],
-    ):
+    ) -> int:
         """생성된 이미지 처리 및 저장"""
 
-        # 썸네일 이미지 생성 및 업로드
-        thumbnail_s3_key = self._create_thumbnail(image_generation_jobs[:3])
         hair_style: HairStyle = generation_request_with_relation.hair_variant_model.hair_style
 
-        # 이미지 그룹 생성
+        # 이미지 그룹 생성 - 썸네일은 썸네일 파이프라인에서 채워지기 전까지 첫 번째 이미지를 사용한다.
         image_group = self.generated_image_group_repo.create_with_flush(
             obj_in=GeneratedImageGroupCreate(
                 user_id=generation_request_with_relation.user_id,
                 generation_request_id=generation_request_with_relation.id,
-                thumbnail_image_s3_key=thumbnail_s3_key,
+                thumbnail_image_s3_key=min(image_generation_jobs, key=lambda job: job.id).s3_key,
+                thumbnail_status=ThumbnailStatusEnum.PENDING,
                 title=hair_style.title
             )
         )
@@ -156,26 +194,27 @@ class MessageHandler(TransactionalService):
                     image_generation_job_id=job.id
                 )
             )
+        return image_group.id
 
-    def _create_thumbnail(self, jobs: List[ImageGenerationJob]) -> str:
-        """썸네일 이미지 생성"""
-        image_urls = [
-            self.s3_client.create_presigned_url(job.s3_key)
-            for job in jobs
-        ]
 
-        img_bytes, img_format = concatenate_images_horizontally(image_urls)
-        compressed_bytes, img_format = compress_and_resize_image(img_bytes)
+async def resolve_generation_request_id(body: bytes) -> Optional[int]:
+    """
+    consume 메시지의 ordering key (generation_request_id) 를 구한다.
+    메시지에 없으면 job 으로부터 조회하고, 파싱할 수 없는 메시지는 None (순서 보장 없이 처리) 을 반환한다.
+    """
+    try:
+        message = MQConsumeMessage(**json.loads(body))
+    except Exception:
+        return None
 
-        thumbnail_key = generate_unique_datatime_uuid_key(
-            prefix=aws_s3_setting.GENERATED_IMAGE_GROUP_S3KEY_PREFIX
-        )
+    if message.generation_request_id is not None:
+        return message.generation_request_id
 
-        self.s3_client.upload_to_s3(thumbnail_key, compressed_bytes, img_format)
-        return thumbnail_key
+    async with AsyncSessionLocal() as db:
+        return await AsyncImageGenerationJobRepository(db=db).get_generation_request_id(message.image_generation_job_id)
 
 
-def handle_message(body: bytes) -> None:
+def handle_message(body: bytes) -> Optional[int]:
     db = next(get_db())
     try:
         message_handler = MessageHandler(
@@ -184,10 +223,11 @@ def handle_message(body: bytes) -> None:
             generated_image_repo=get_generated_image_repository(db),
             generated_image_group_repo=get_generated_image_group_repository(db),
             user_repo=get_user_repository(db),
-            s3_client=get_s3_client(),
-            fcm_service=get_fcm_service(),
+            notification_outbox_repo=get_notification_outbox_repository(db),
+            generation_status_cache=get_generation_status_cache(),
+            job_expiry_schedule=get_job_expiry_schedule(),
             unit_of_work=get_unit_of_work(db),
         )
-        message_handler.process_message(body)
+        return message_handler.process_message(body)
     finally:
         db.close()
@@ -0,0 +1,85 @@
+import logging
+import math
+from datetime import datetime, UTC
+from typing import List
+
+from app.application.services.generation.dto.mq import MQPublishMessage
+from app.application.services.transactional_service import TransactionalService
+from app.core.config import mq_outbox_setting, MQOutboxSetting
+from app.core.db.base import AsyncSessionLocal
+from app.domain.generation.models.mq_outbox import MQOutbox
+from app.infrastructure.database.transaction import async_transactional
+from app.infrastructure.database.unit_of_work import AsyncUnitOfWork
+from app.infrastructure.mq.rabbit_mq_service import RabbitMQService
+from app.infrastructure.repositories.generation.mq_outbox import AsyncMQOutboxRepository
+
+logger = logging.getLogger(__name__)
+
+
+class MQOutboxRelayService(TransactionalService):
+    """
+    mq_outbox 에 기록된 추론 요청을 RabbitMQ 로 발행한다.
+    메시지는 SKIP LOCKED 로 잠근 채 publisher confirms 로 동시에 발행하고, broker 가 받은 메시지만 삭제한다.
+    발행에 실패한 메시지는 그대로 남아 다음 relay 에서 다시 발행된다.
+    """
+    def __init__(
+            self,
+            mq_outbox_repo: AsyncMQOutboxRepository,
+            rabbit_mq_service: RabbitMQService,
+            unit_of_work: AsyncUnitOfWork,
+            setting: MQOutboxSetting = mq_outbox_setting,
+    ):
+        super().__init__(unit_of_work)
+        self.mq_outbox_repo = mq_outbox_repo
+        self.rabbit_mq_service = rabbit_mq_service
+        self.setting = setting
+
+    @async_transactional
+    async def relay_pending(self) -> int:
+        """한 배치를 발행하고, outbox 에서 정리된 (발행 또는 만료) 메시지 수를 반환한다."""
+        mq_outbox_list: List[MQOutbox] = await self.mq_outbox_repo.get_pending_for_update(limit=self.setting.BATCH_SIZE)
+        if not mq_outbox_list:
+            return 0
+
+        now = datetime.now(UTC)
+        publishable_list: List[MQOutbox] = []
+        expired_id_list: List[int] = []
+        for mq_outbox in mq_outbox_list:
+            # 발행 전에 만료된 job 은 retry task 가 다시 발행하므로 버린다.
+            if mq_outbox.expires_at <= now:
+                expired_id_list.append(mq_outbox.id)
+            else:
+                publishable_list.append(mq_outbox)
+
+        published = await self.rabbit_mq_service.publish_each(
+            messages=[
+                (
+                    MQPublishMessage(**mq_outbox.payload),
+                    math.ceil((mq_outbox.expires_at - now).total_seconds()),
+                    mq_outbox.priority
+                )
+                for mq_outbox in publishable_list
+            ]
+        )
+        published_id_list = [
+            mq_outbox.id for mq_outbox, is_published in zip(publishable_list, published) if is_published
+        ]
+        await self.mq_outbox_repo.delete_all_in(published_id_list + expired_id_list)
+
+        if len(published_id_list) < len(publishable_list):
+            logger.warning(
+                f"[MQOutbox] {len(publishable_list) - len(published_id_list)} messages failed to publish, will retry"
+            )
+        if expired_id_list:
+            logger.info(f"[MQOutbox] dropped {len(expired_id_list)} expired messages")
+        return len(published_id_list) + len(expired_id_list)
+
+
+async def relay_mq_outbox_batch(rabbit_mq_service: RabbitMQService) -> int:
+    async with AsyncSessionLocal() as db:
+        service = MQOutboxRelayService(
+            mq_outbox_repo=AsyncMQOutboxRepository(db=db),
+            rabbit_mq_service=rabbit_mq_service,
+            unit_of_work=AsyncUnitOfWork(db),
+        )
+        return await service.relay_pending()
@@ -1,71 +1,142 @@
+import asyncio
 from fastapi.params import Depends
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from app.domain.hair_model.models.hair import HairVariantModel
 from app.application.services.generation.dto.query import GenerationRequestStatusResponse, GenerationRequestDetails, \
-    GenerationRequestStatusWithDetails
+    GenerationRequestStatusWithDetails, GenerationProgressEvent
+from app.core.config import generation_event_setting
 from app.core.enums.generation_status import GenerationResultEnum
 from app.core.errors.http_exceptions import AccessUnauthorizedException
 from app.domain.generation.models.generation import GenerationRequest, ImageGenerationJob
-from app.domain.generation.services.generation_domain_service import calculate_remaining_generation_sec, \
-    is_generation_in_progress
+from app.domain.generation.services.generation_domain_service import calculate_remaining_sec_until
 from app.domain.hair_model.schemas.hair.gender import GenderInDB
 from app.domain.hair_model.schemas.hair.hair_style import HairStyleInDB
 from app.domain.hair_model.schemas.hair.length import LengthInDB
 from app.domain.hair_model.schemas.hair.color import ColorInDB
 from app.domain.hair_model.schemas.scene.background import BackgroundInDB
 from app.domain.hair_model.schemas.scene.image_resolution import ImageResolutionInDB
-from app.domain.user.models.user import User
-from app.infrastructure.repositories.generation.generation import GenerationRequestRepository, \
-    get_generation_request_repository, ImageGenerationJobRepository, get_image_generation_job_repository, \
-    GeneratedImageGroupRepository, get_generated_image_group_repository
-from app.infrastructure.repositories.user.user import UserRepository, get_user_repository
+from app.infrastructure.cache.generation_event_broker import GenerationEventBroker, get_generation_event_broker
+from app.infrastructure.cache.generation_status_cache import GenerationStatusCache, GenerationStatusDocument, \
+    get_generation_status_cache
+from app.infrastructure.repositories.generation.generation import AsyncGenerationRequestRepository, \
+    get_async_generation_request_repository, AsyncImageGenerationJobRepository, \
+    get_async_image_generation_job_repository, AsyncGeneratedImageGroupRepository, \
+    get_async_generated_image_group_repository
 
 
 class GenerationRequestQueryService:
     def __init__(
             self,
-            user_repo: UserRepository,
-            generation_request_repo: GenerationRequestRepository,
-            generated_image_group_repo: GeneratedImageGroupRepository,
-            image_generation_job_repo: ImageGenerationJobRepository,
+            generation_request_repo: AsyncGenerationRequestRepository,
+            generated_image_group_repo: AsyncGeneratedImageGroupRepository,
+            image_generation_job_repo: AsyncImageGenerationJobRepository,
+            generation_status_cache: GenerationStatusCache,
+            generation_event_broker: GenerationEventBroker,
     ):
-        self.user_repo = user_repo
         self.generation_request_repo = generation_request_repo
         self.generated_image_group_repo = generated_image_group_repo
         self.image_generation_job_repo = image_generation_job_repo
+        self.generation_status_cache = generation_status_cache
+        self.generation_event_broker = generation_event_broker
 
-    def get_generation_request_status(self, generation_request_id: int, user_id: int):
-        generation_request: GenerationRequest = self.generation_request_repo.get(generation_request_id)
-        if generation_request.user_id != user_id:
+    async def get_generation_request_status(self, generation_request_id: int, user_id: int):
+        status_document = await self._get_status_document(generation_request_id)
+        if status_document.user_id != user_id:
             raise AccessUnauthorizedException()
-        return self._get_generation_request_status(generation_request)
-
-    def _get_generation_request_status(self, generation_request: GenerationRequest):
-        remaining_sec: int = 0
+        return self._to_status_response(status_document)
+
+    async def open_generation_progress_stream(self, generation_request_id: int, user_id: int) -> AsyncIterator[str]:
+        """
+        소유자 확인은 스트림을 열기 전에 끝낸다. (응답이 시작된 뒤에는 에러 status 를 줄 수 없다.)
+        스트림 안에서는 DB 를 쓰지 않고 Redis 만 읽는다.
+        """
+        status_document = await self._get_status_document(generation_request_id)
+        if status_document.user_id != user_id:
+            raise AccessUnauthorizedException()
+        return self._generation_progress_events(status_document)
+
+    async def _generation_progress_events(self, status_document: GenerationStatusDocument) -> AsyncIterator[str]:
+        """
+        job 이 완료될 때마다 progress, 요청이 끝나면 (그룹 생성 / 실패 / 취소) result 이벤트를 보내고 스트림을 닫는다.
+        이벤트가 없는 동안에는 heartbeat 마다 Redis 의 최신 문서를 다시 확인한다. (놓친 publish 보정)
+        """
+        generation_request_id = status_document.generation_request_id
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + generation_event_setting.STREAM_TIMEOUT_SEC
+
+        async with self.generation_event_broker.subscribe(generation_request_id) as queue:
+            # 구독 이후의 문서부터 보내야 그 사이 publish 를 놓치지 않는다.
+            status_document = await self.generation_status_cache.get(generation_request_id) or status_document
+            yield self._to_progress_event(status_document)
+
+            while status_document.generation_result == GenerationResultEnum.PENDING:
+                timeout = min(generation_event_setting.HEARTBEAT_SEC, deadline - loop.time())
+                if timeout <= 0:
+                    break
+
+                try:
+                    next_document = await asyncio.wait_for(queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    next_document = await self.generation_status_cache.get(generation_request_id)
+                    if next_document is None or next_document == status_document:
+                        yield ": keep-alive\n\n"
+                        continue
+
+                status_document = next_document
+                yield self._to_progress_event(status_document)
+
+    def _to_progress_event(self, status_document: GenerationStatusDocument) -> str:
+        status = self._to_status_response(status_document)
+        progress_event = GenerationProgressEvent(
+            **status.model_dump(),
+            generation_request_id=status_document.generation_request_id,
+            completed_count=status_document.completed_count,
+            total_count=status_document.total_count,
+        )
+        event = "progress" if status_document.generation_result == GenerationResultEnum.PENDING else "result"
+        return f"event: {event}\ndata: {progress_event.model_dump_json()}\n\n"
+
+    async def _get_status_document(self, generation_request_id: int) -> GenerationStatusDocument:
+        """
+        polling 은 Redis 의 상태 문서만 읽는다.
+        문서가 없으면 (만료 / Redis 장애 / 배포 이전 요청) DB 에서 계산해 다시 채운다.
+        """
+        status_document = await self.generation_status_cache.get(generation_request_id)
+        if status_document is not None:
+            return status_document
+
+        generation_request: GenerationRequest = await self.generation_request_repo.get(generation_request_id)
+        image_generation_job_list: List[ImageGenerationJob] = (
+            await self.image_generation_job_repo.get_all_by_generation_request(generation_request.id)
+        )
         generated_image_group_id: Optional[int] = None
-
-        if generation_request.generation_result == GenerationResultEnum.PENDING:
-            image_generation_job_list: List[ImageGenerationJob] = (
-                self.image_generation_job_repo.get_all_by_generation_request(generation_request.id)
-            )
-            remaining_sec = calculate_remaining_generation_sec(image_generation_job_list)
-        elif generation_request.generation_result == GenerationResultEnum.SUCCEED:
-            generated_image_group = self.generated_image_group_repo.get_by_generation_request(generation_request.id)
+        if generation_request.generation_result == GenerationResultEnum.SUCCEED:
+            generated_image_group = await self.generated_image_group_repo.get_by_generation_request(generation_request.id)
             generated_image_group_id = generated_image_group.id
 
-        print(f"generation result : {generation_request.generation_result}")
-        print(f"remaining sec : {remaining_sec}")
+        status_document = GenerationStatusDocument.of(
+            generation_request, image_generation_job_list, generated_image_group_id=generated_image_group_id
+        )
+        # 그 사이 consumer 가 더 최신 문서를 썼을 수 있으므로 없을 때만 채운다.
+        await self.generation_status_cache.save(status_document, only_if_absent=True)
+        return status_document
+
+    @staticmethod
+    def _to_status_response(status_document: GenerationStatusDocument) -> GenerationRequestStatusResponse:
+        remaining_sec: int = 0
+        if status_document.generation_result == GenerationResultEnum.PENDING:
+            remaining_sec = calculate_remaining_sec_until(status_document.expires_at)
 
         return GenerationRequestStatusResponse(
-            generation_status=generation_request.generation_result,
+            generation_status=status_document.generation_result,
             remaining_sec=remaining_sec,
-            generated_image_group_id=generated_image_group_id
+            generated_image_group_id=status_document.generated_image_group_id
         )
 
-    def get_generated_request_details(self, generation_request_id: int, user_id: int):
+    async def get_generated_request_details(self, generation_request_id: int, user_id: int):
         generation_request_with_relation: GenerationRequest = (
-            self.generation_request_repo.get_with_all_relations(generation_request_id)
+            await self.generation_request_repo.get_with_all_relations(generation_request_id)
         )
 
         if generation_request_with_relation.user_id != user_id:
@@ -85,34 +156,53 @@ class GenerationRequestQueryService:
             image_resolution=ImageResolutionInDB.model_validate(generation_request_with_relation.image_resolution)
         )
 
-    def get_latest_generation_request_status_with_details(self, user_id: int) -> GenerationRequestStatusWithDetails:
-        latest_generation_request: Optional[GenerationRequest] = (
-            self.generation_request_repo.get_latest_generation_request_by_user(user_id)
-        )
-        if latest_generation_request is None:
-            return GenerationRequestStatusWithDetails()
+    async def get_latest_generation_request_status_with_details(self, user_id: int) -> GenerationRequestStatusWithDetails:
+        latest_generation_request_id: Optional[int] = await self.generation_status_cache.get_latest_request_id(user_id)
+        if latest_generation_request_id is None:
+            latest_generation_request: Optional[GenerationRequest] = (
+                await self.generation_request_repo.get_latest_generation_request_by_user(user_id)
+            )
+            if latest_generation_request is None:
+                return GenerationRequestStatusWithDetails()
+            latest_generation_request_id = latest_generation_request.id
+            await self.generation_status_cache.set_latest_request_id(user_id, latest_generation_request_id, only_if_absent=True)
 
-        generation_request_with_relation: GenerationRequest = (
-            self.generation_request_repo.get_with_all_relations(latest_generation_request.id)
-        )
+        status_document = await self._get_status_document(latest_generation_request_id)
+        if status_document.user_id != user_id:
+            raise AccessUnauthorizedException()
 
-        status: GenerationRequestStatusResponse = self._get_generation_request_status(generation_request_with_relation)
-        details: GenerationRequestDetails = self._get_generated_request_details(generation_request_with_relation)
+        status: GenerationRequestStatusResponse = self._to_status_response(status_document)
+        details: GenerationRequestDetails = await self._get_cached_request_details(latest_generation_request_id)
 
         return GenerationRequestStatusWithDetails(
             **status.model_dump(),
             **details.model_dump(),
         )
 
-def get_generation_request_query_service(
-        user_repo: UserRepository = Depends(get_user_repository),
-        generation_request_repo: GenerationRequestRepository = Depends(get_generation_request_repository),
-        generated_image_group_repo: GeneratedImageGroupRepository = Depends(get_generated_image_group_repository),
-        image_generation_job_repo: ImageGenerationJobRepository = Depends(get_image_generation_job_repository),
+    async def _get_cached_request_details(self, generation_request_id: int) -> GenerationRequestDetails:
+        # 요청 상세는 생성 이후 바뀌지 않으므로 한 번 만든 결과를 재사용한다.
+        cached_details: Optional[dict] = await self.generation_status_cache.get_details(generation_request_id)
+        if cached_details is not None:
+            return GenerationRequestDetails.model_validate(cached_details)
+
+        generation_request_with_relation: GenerationRequest = (
+            await self.generation_request_repo.get_with_all_relations(generation_request_id)
+        )
+        details: GenerationRequestDetails = self._get_generated_request_details(generation_request_with_relation)
+        await self.generation_status_cache.save_details(generation_request_id, details.model_dump(mode="json"))
+        return details
+
+async def get_generation_request_query_service(
+        generation_request_repo: AsyncGenerationRequestRepository = Depends(get_async_generation_request_repository),
+        generated_image_group_repo: AsyncGeneratedImageGroupRepository = Depends(get_async_generated_image_group_repository),
+        image_generation_job_repo: AsyncImageGenerationJobRepository = Depends(get_async_image_generation_job_repository),
+        generation_status_cache: GenerationStatusCache = Depends(get_generation_status_cache),
+        generation_event_broker: GenerationEventBroker = Depends(get_generation_event_broker),
 ) -> GenerationRequestQueryService:
     return GenerationRequestQueryService(
-        user_repo=user_repo,
         generation_request_repo=generation_request_repo,
         generated_image_group_repo=generated_image_group_repo,
         image_generation_job_repo=image_generation_job_repo,
+        generation_status_cache=generation_status_cache,
+        generation_event_broker=generation_event_broker,
     )
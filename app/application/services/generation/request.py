@@ -8,43 +8,55 @@ from app.application.services.generation.dto.request import CreateGenerationRequ
 from app.application.services.generation.dto.mq import MQPublishMessage
 from app.core.config import image_generation_setting, aws_s3_setting
 from app.core.enums.generation_status import GenerationStatusEnum, GenerationResultEnum
+from app.core.enums.message_priority import MessagePriority
 from app.core.errors.exceptions import NoInferenceConsumerException
 from app.core.errors.http_exceptions import AccessUnauthorizedException, ConcurrentGenerationRequestError, \
     UserHasNotEnoughTokenException
 from app.core.utils import generate_unique_datatime_uuid_key
 from app.domain.generation.models.generation import GenerationRequest
 from app.domain.generation.schemas.generation_request import GenerationRequestCreate, GenerationRequestUpdate
-from app.domain.generation.schemas.image_generation_job import ImageGenerationJobCreate, ImageGenerationJobInDB, \
-    ImageGenerationJobUpdate
+from app.domain.generation.schemas.image_generation_job import ImageGenerationJobCreate, ImageGenerationJobInDB
+from app.domain.generation.schemas.mq_outbox import MQOutboxCreate
 from app.domain.generation.services.generation_domain_service import estimate_normal_priority_message_wait_sec, \
     calculate_normal_message_ttl_sec, is_generation_in_progress
 from app.domain.hair_model.models.hair import HairVariantModel, Length, SpecificColor
 from app.domain.hair_model.services.hair_model_prompt import create_prompts
 from app.domain.user.models.user import User
 from app.domain.user.schemas.user import UserUpdate
-from app.infrastructure.database.transaction import transactional
-from app.infrastructure.database.unit_of_work import UnitOfWork, get_unit_of_work
+from app.infrastructure.cache.generation_status_cache import GenerationStatusCache, GenerationStatusDocument, \
+    get_generation_status_cache
+from app.infrastructure.cache.job_expiry_schedule import JobExpirySchedule, get_job_expiry_schedule
+from app.infrastructure.database.transaction import async_transactional
+from app.infrastructure.database.unit_of_work import AsyncUnitOfWork, get_async_unit_of_work
 from app.infrastructure.mq.rabbit_mq_service import RabbitMQService, get_rabbit_mq_service
-from app.infrastructure.repositories.generation.generation import GenerationRequestRepository, \
-    ImageGenerationJobRepository, get_generation_request_repository, get_image_generation_job_repository
-from app.infrastructure.repositories.hair_model.hair_model import HairVariantModelRepository, \
-    PostureAndClothingRepository, SpecificColorRepository, get_specific_color_repository, \
-    get_posture_and_clothing_repository, get_hair_variant_model_repository
-from app.infrastructure.repositories.user.user import UserRepository, get_user_repository
+from app.infrastructure.repositories.generation.generation import AsyncGenerationRequestRepository, \
+    AsyncImageGenerationJobRepository, get_async_generation_request_repository, \
+    get_async_image_generation_job_repository
+from app.infrastructure.repositories.generation.mq_outbox import AsyncMQOutboxRepository, \
+    get_async_mq_outbox_repository
+from app.infrastructure.repositories.hair_model.hair_model import AsyncHairVariantModelRepository, \
+    AsyncPostureAndClothingRepository, AsyncSpecificColorRepository, get_async_specific_color_repository, \
+    get_async_posture_and_clothing_repository, get_async_hair_variant_model_repository
+from app.infrastructure.repositories.user.user import AsyncUserRepository, get_async_user_repository
+from app.infrastructure.task.mq_outbox import MQOutboxRelayTaskManager, get_mq_outbox_relay
 from datetime import datetime, UTC, timedelta
 
 # TODO: DB 접근마다 에러처리 / TRANSACTION
 class RequestGenerationApplicationService(TransactionalService):
     def __init__(
             self,
-            user_repo: UserRepository,
-            specific_color_repo: SpecificColorRepository,
-            posture_and_clothing_repo: PostureAndClothingRepository,
-            hair_variant_model_repo: HairVariantModelRepository,
-            generation_request_repo: GenerationRequestRepository,
-            image_generation_job_repo: ImageGenerationJobRepository,
+            user_repo: AsyncUserRepository,
+            specific_color_repo: AsyncSpecificColorRepository,
+            posture_and_clothing_repo: AsyncPostureAndClothingRepository,
+            hair_variant_model_repo: AsyncHairVariantModelRepository,
+            generation_request_repo: AsyncGenerationRequestRepository,
+            image_generation_job_repo: AsyncImageGenerationJobRepository,
+            mq_outbox_repo: AsyncMQOutboxRepository,
             rabbit_mq_service: RabbitMQService,
-            unit_of_work: UnitOfWork,
+            mq_outbox_relay: Optional[MQOutboxRelayTaskManager],
+            generation_status_cache: GenerationStatusCache,
+            job_expiry_schedule: JobExpirySchedule,
+            unit_of_work: AsyncUnitOfWork,
 
     ):
         super().__init__(unit_of_work)
@@ -54,62 +66,67 @@ class RequestGenerationApplicationService(TransactionalService):
         self.hair_variant_model_repo = hair_variant_model_repo
         self.generation_request_repo = generation_request_repo
         self.image_generation_job_repo = image_generation_job_repo
+        self.mq_outbox_repo = mq_outbox_repo
         self.rabbit_mq_service = rabbit_mq_service
+        self.mq_outbox_relay = mq_outbox_relay
+        self.generation_status_cache = generation_status_cache
+        self.job_expiry_schedule = job_expiry_schedule
 
-    @transactional
-    def cancel_generation(
+    @async_transactional
+    async def cancel_generation(
             self,
             generation_request_id: int,
             user_id: int,
     ):
-        generation_request: GenerationRequest = self.generation_request_repo.get(generation_request_id)
+        generation_request: GenerationRequest = await self.generation_request_repo.get(generation_request_id)
         if generation_request.user_id != user_id:
             raise AccessUnauthorizedException()
-        self.generation_request_repo.update(
+        await self.generation_request_repo.update(
             obj_id=generation_request.id,
             obj_in=GenerationRequestUpdate(
                 generation_result=GenerationResultEnum.CANCELED
             )
         )
+        status_document = GenerationStatusDocument.of(generation_request, [], GenerationResultEnum.CANCELED)
+        self.unit_of_work.on_commit(lambda: self.generation_status_cache.save(status_document, set_latest=True))
 
-    # TODO: 1회 메서드 실행 시 db 9 + 10 회 (10번은 job create x 10)
-    @transactional
+    @async_transactional
     async def request_generation(
             self,
             request: CreateGenerationRequestRequest,
             user_id: int
     ) -> GenerationRequestResponse:
 
-        if self._is_generation_in_progress(user_id):
+        if await self._is_generation_in_progress(user_id):
             raise ConcurrentGenerationRequestError()
 
         # TODO: (urgent) id에 해당하는 user 존재하는 레코드인지 에러 처리필요
-        user: User = self.user_repo.get(user_id)
+        user: User = await self.user_repo.get(user_id)
         if not user.has_enough_token():
             raise UserHasNotEnoughTokenException()
 
-        generation_request: GenerationRequest = self._create_generation_request(request, user_id)
+        generation_request: GenerationRequest = await self._create_generation_request(request, user_id)
         return await self._start_generation(generation_request.id, user)
 
-    def _is_generation_in_progress(self, user_id: int) -> bool:
+    async def _is_generation_in_progress(self, user_id: int) -> bool:
         latest_generation_request: Optional[GenerationRequest] = (
-            self.generation_request_repo.get_latest_generation_request_by_user(user_id=user_id)
+            await self.generation_request_repo.get_latest_generation_request_by_user(user_id=user_id)
         )
         return is_generation_in_progress(latest_generation_request)
 
-    def _create_generation_request(
+    async def _create_generation_request(
             self,
             request: CreateGenerationRequestRequest,
             user_id: int
     ) -> GenerationRequest:
         hair_variant_model: HairVariantModel = (
-            self.hair_variant_model_repo.get_by_hair_style_length_color(
+            await self.hair_variant_model_repo.get_by_hair_style_length_color(
                 hair_style_id=request.hair_style_id,
                 length_id=request.length_id,
                 color_id=request.color_id,
             )
         )
-        return self.generation_request_repo.create_with_flush(
+        return await self.generation_request_repo.create_with_flush(
             obj_in=GenerationRequestCreate(
                 user_id=user_id,
                 hair_variant_model_id=hair_variant_model.id,
@@ -126,17 +143,16 @@ class RequestGenerationApplicationService(TransactionalService):
     ) -> GenerationRequestResponse:
         """
         1. Prompt 를 n개 생성한다.
-        2. image_generation_job 을 생성한다.
-        3. mq 서버에 생성 요청을 보낸다.
-        4. 2 - 3 프롬프트 갯수만큼 반복
+        2. image_generation_job n개를 PROCESSING 상태로 한 번에 생성한다. (multi-row INSERT ... RETURNING)
+        3. n개의 생성 요청 메시지를 같은 트랜잭션에서 mq outbox 에 기록한다. (발행은 commit 이후 relay 가 한다.)
         """
 
         generation_request_with_relation: GenerationRequest = (
-            self.generation_request_repo.get_with_all_relations(generation_request_id)
+            await self.generation_request_repo.get_with_all_relations(generation_request_id)
         )
 
         # create prompt list
-        prompt_list = self._create_prompts(generation_request_with_relation)
+        prompt_list = await self._create_prompts(generation_request_with_relation)
 
         # queue 상태 확인
         message_count, consumer_count = await self.rabbit_mq_service.get_queue_info()
@@ -148,20 +164,35 @@ class RequestGenerationApplicationService(TransactionalService):
             processor_count=consumer_count
         )
 
-        for idx, prompt in enumerate(prompt_list):
+        time_to_live_sec_list: List[int] = []
+        for _ in prompt_list:
             message_time_to_live_sec += calculate_normal_message_ttl_sec()
-            # job 생성
-            image_generation_job = self._create_image_generation_job(
-                prompt=prompt,
-                image_resolution=generation_request_with_relation.image_resolution,
-                time_to_live_sec=message_time_to_live_sec,
-                generation_request_id=generation_request_with_relation.id
-            )
-            # MQ 요청 보내기
-            await self._publish_job_as_mq_message(image_generation_job, message_time_to_live_sec)
+            time_to_live_sec_list.append(message_time_to_live_sec)
+
+        # job 일괄 생성
+        image_generation_job_list = await self._create_image_generation_jobs(
+            prompt_list=prompt_list,
+            image_resolution=generation_request_with_relation.image_resolution,
+            time_to_live_sec_list=time_to_live_sec_list,
+            generation_request_id=generation_request_with_relation.id
+        )
+        # MQ 요청 outbox 기록
+        self._add_jobs_to_mq_outbox(image_generation_job_list)
+        if self.mq_outbox_relay is not None:
+            self.unit_of_work.on_commit(self.mq_outbox_relay.notify)
 
         # 사용자 토큰 감소
-        self.user_repo.update(obj_id=user.id, obj_in=UserUpdate(token=user.token - 1))
+        await self.user_repo.update(obj_id=user.id, obj_in=UserUpdate(token=user.token - 1))
+
+        # 상태 조회용 read model 은 commit 이후에 기록한다.
+        status_document = GenerationStatusDocument.of(
+            generation_request_with_relation, image_generation_job_list, GenerationResultEnum.PENDING
+        )
+        self.unit_of_work.on_commit(lambda: self.generation_status_cache.save(status_document, set_latest=True))
+        # 만료 시점에 retry 경로가 깨어나도록 job 만료 타이머 등록
+        self.unit_of_work.on_commit(
+            lambda: self.job_expiry_schedule.schedule({job.id: job.expires_at for job in image_generation_job_list})
+        )
 
         message_count, consumer_count = await self.rabbit_mq_service.get_queue_info()
         return GenerationRequestResponse(
@@ -170,15 +201,15 @@ class RequestGenerationApplicationService(TransactionalService):
             generated_image_cnt_per_request=image_generation_setting.GENERATED_IMAGE_CNT_PER_REQUEST
         )
 
-    def _create_prompts(self, generation_request_with_relations: GenerationRequest) -> List[str]:
+    async def _create_prompts(self, generation_request_with_relations: GenerationRequest) -> List[str]:
 
         hair_variant_model_with_relations: HairVariantModel = generation_request_with_relations.hair_variant_model
 
-        posture_and_clothing_list = self.posture_and_clothing_repo.get_random_records_in_gender(
+        posture_and_clothing_list = await self.posture_and_clothing_repo.get_random_records_in_gender(
             gender_id=generation_request_with_relations.hair_variant_model.gender.id,
             limit=image_generation_setting.GENERATED_IMAGE_CNT_PER_REQUEST
         )
-        specific_color_list: List[SpecificColor] = self.specific_color_repo.get_all_by_color_limit(
+        specific_color_list: List[SpecificColor] = await self.specific_color_repo.get_all_by_color_limit(
             hair_variant_model_with_relations.color_id,
             limit=image_generation_setting.GENERATED_IMAGE_CNT_PER_REQUEST
         )
@@ -199,54 +230,62 @@ class RequestGenerationApplicationService(TransactionalService):
             count=image_generation_setting.GENERATED_IMAGE_CNT_PER_REQUEST
         )
 
-    def _create_image_generation_job(
+    async def _create_image_generation_jobs(
             self,
-            prompt: str,
+            prompt_list: List[str],
             image_resolution: ImageResolution,
-            time_to_live_sec: int,
+            time_to_live_sec_list: List[int],
             generation_request_id: int,
-    ) -> ImageGenerationJobInDB:
-        s3_key = generate_unique_datatime_uuid_key(prefix=aws_s3_setting.GENERATED_IMAGE_S3KEY_PREFIX)
-        return ImageGenerationJobInDB.model_validate(
-            self.image_generation_job_repo.create_with_flush(
-                obj_in=ImageGenerationJobCreate(
+    ) -> List[ImageGenerationJobInDB]:
+        now = datetime.now(UTC)
+        # outbox 기록과 같은 트랜잭션이므로 생성 시점부터 PROCESSING 으로 둔다. (발행되지 않은 job 은 retry task 가 재발행)
+        db_image_generation_job_list = await self.image_generation_job_repo.bulk_create_with_returning(
+            obj_in_list=[
+                ImageGenerationJobCreate(
+                    status=GenerationStatusEnum.PROCESSING,
                     retry_count=0,
-                    expires_at=datetime.now(UTC) + timedelta(seconds=time_to_live_sec),
+                    expires_at=now + timedelta(seconds=time_to_live_sec),
                     prompt=prompt,
                     distilled_cfg_scale=image_generation_setting.DISTILLED_CFG_SCALE,
                     width=image_resolution.width,
                     height=image_resolution.height,
                     generation_request_id=generation_request_id,
-                    s3_key=s3_key
+                    s3_key=generate_unique_datatime_uuid_key(prefix=aws_s3_setting.GENERATED_IMAGE_S3KEY_PREFIX)
                 )
-            )
+                for prompt, time_to_live_sec in zip(prompt_list, time_to_live_sec_list)
+            ]
         )
+        return [ImageGenerationJobInDB.model_validate(db_job) for db_job in db_image_generation_job_list]
 
-    async def _publish_job_as_mq_message(
-            self,
-            image_generation_job: ImageGenerationJobInDB,
-            time_to_live_sec: int
-    ):
-        message = MQPublishMessage(
-            **image_generation_job.model_dump(),
-            image_generation_job_id=image_generation_job.id,
-        )
-        await self.rabbit_mq_service.publish(message=message, expiration_sec=time_to_live_sec)
-        self.image_generation_job_repo.update(
-            obj_id=image_generation_job.id,
-            obj_in=ImageGenerationJobUpdate(status=GenerationStatusEnum.PROCESSING)
-        )
+    def _add_jobs_to_mq_outbox(self, image_generation_job_list: List[ImageGenerationJobInDB]):
+        for image_generation_job in image_generation_job_list:
+            message = MQPublishMessage(
+                **image_generation_job.model_dump(),
+                image_generation_job_id=image_generation_job.id,
+            )
+            self.mq_outbox_repo.create(
+                obj_in=MQOutboxCreate(
+                    payload=message.model_dump(),
+                    priority=MessagePriority.LOW,
+                    expires_at=image_generation_job.expires_at,
+                    image_generation_job_id=image_generation_job.id,
+                )
+            )
 
 
-def get_request_generation_application_service(
-        user_repo: UserRepository = Depends(get_user_repository),
-        specific_color_repo: SpecificColorRepository = Depends(get_specific_color_repository),
-        posture_and_clothing_repo: PostureAndClothingRepository = Depends(get_posture_and_clothing_repository),
-        hair_variant_model_repo: HairVariantModelRepository = Depends(get_hair_variant_model_repository),
-        generation_request_repo: GenerationRequestRepository = Depends(get_generation_request_repository),
-        image_generation_job_repo: ImageGenerationJobRepository = Depends(get_image_generation_job_repository),
+async def get_request_generation_application_service(
+        user_repo: AsyncUserRepository = Depends(get_async_user_repository),
+        specific_color_repo: AsyncSpecificColorRepository = Depends(get_async_specific_color_repository),
+        posture_and_clothing_repo: AsyncPostureAndClothingRepository = Depends(get_async_posture_and_clothing_repository),
+        hair_variant_model_repo: AsyncHairVariantModelRepository = Depends(get_async_hair_variant_model_repository),
+        generation_request_repo: AsyncGenerationRequestRepository = Depends(get_async_generation_request_repository),
+        image_generation_job_repo: AsyncImageGenerationJobRepository = Depends(get_async_image_generation_job_repository),
+        mq_outbox_repo: AsyncMQOutboxRepository = Depends(get_async_mq_outbox_repository),
         rabbit_mq_service: RabbitMQService = Depends(get_rabbit_mq_service),
-        unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+        mq_outbox_relay: Optional[MQOutboxRelayTaskManager] = Depends(get_mq_outbox_relay),
+        generation_status_cache: GenerationStatusCache = Depends(get_generation_status_cache),
+        job_expiry_schedule: JobExpirySchedule = Depends(get_job_expiry_schedule),
+        unit_of_work: AsyncUnitOfWork = Depends(get_async_unit_of_work),
 ) -> RequestGenerationApplicationService:
     return RequestGenerationApplicationService(
         user_repo=user_repo,
@@ -255,7 +294,11 @@ def get_request_generation_application_service(
         hair_variant_model_repo=hair_variant_model_repo,
         generation_request_repo=generation_request_repo,
         image_generation_job_repo=image_generation_job_repo,
+        mq_outbox_repo=mq_outbox_repo,
         rabbit_mq_service=rabbit_mq_service,
+        mq_outbox_relay=mq_outbox_relay,
+        generation_status_cache=generation_status_cache,
+        job_expiry_schedule=job_expiry_schedule,
         unit_of_work=unit_of_work
     )
 
@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime, timedelta, UTC
-from typing import List
+from typing import Dict, List, Set
 
 from sqlalchemy.orm import Session
 
@@ -15,15 +15,20 @@ from app.domain.generation.schemas.generation_request import GenerationRequestUp
 from app.domain.generation.schemas.image_generation_job import ImageGenerationJobUpdate, ImageGenerationJobInDB
 from app.domain.generation.services.generation_domain_service import estimate_high_priority_message_wait_sec, calculate_retry_message_ttl_sec
 from app.domain.user.models.user import User
+from app.domain.notification.schemas.notification_outbox import NotificationOutboxCreate
 from app.domain.user.schemas.user import UserUpdate
+from app.infrastructure.cache.generation_status_cache import GenerationStatusCache, GenerationStatusDocument, \
+    get_generation_status_cache
+from app.infrastructure.cache.job_expiry_schedule import JobExpirySchedule, get_job_expiry_schedule
 from app.infrastructure.database.transaction import transactional
 from app.infrastructure.database.unit_of_work import UnitOfWork
 from app.infrastructure.fcm.dto.fcm_message import FCMGenerationResultData
-from app.infrastructure.fcm.fcm_service import FCMService
 from app.infrastructure.mq.rabbit_mq_service import RabbitMQService
 from app.infrastructure.repositories.generation.generation import ImageGenerationJobRepository, \
     GenerationRequestRepository, get_image_generation_job_repository, get_generation_request_repository
 from app.core.config import image_generation_setting, fcm_setting
+from app.infrastructure.repositories.notification.notification_outbox import NotificationOutboxRepository, \
+    get_notification_outbox_repository
 from app.infrastructure.repositories.user.user import UserRepository, get_user_repository
 
 logger = logging.getLogger()
@@ -35,7 +40,9 @@ class ImageGenerationRetryService(TransactionalService):
             generation_request_repo: GenerationRequestRepository,
             user_repo: UserRepository,
             rabbit_mq_service: RabbitMQService,
-            fcm_service: FCMService,
+            notification_outbox_repo: NotificationOutboxRepository,
+            generation_status_cache: GenerationStatusCache,
+            job_expiry_schedule: JobExpirySchedule,
             unit_of_work: UnitOfWork,
     ):
         super().__init__(unit_of_work)
@@ -43,15 +50,27 @@ class ImageGenerationRetryService(TransactionalService):
         self.generation_request_repo = generation_request_repo
         self.user_repo = user_repo
         self.rabbit_mq_service = rabbit_mq_service
-        self.fcm_service = fcm_service
+        self.notification_outbox_repo = notification_outbox_repo
+        self.generation_status_cache = generation_status_cache
+        self.job_expiry_schedule = job_expiry_schedule
 
-    @transactional
     async def retry_expired_jobs(self):
-        expired_jobs: List[ImageGenerationJob] = self.image_generation_job_repo.get_all_expired_but_to_process_jobs()
+        """만료 job 을 RETRY_SCAN_BATCH_SIZE 씩 나눠, batch 마다 별도 트랜잭션으로 처리한다."""
+        while True:
+            processed_count = await self.retry_expired_job_batch()
+            if processed_count < image_generation_setting.RETRY_SCAN_BATCH_SIZE:
+                return
+
+    @transactional
+    async def retry_expired_job_batch(self) -> int:
+        expired_jobs: List[ImageGenerationJob] = self.image_generation_job_repo.get_expired_active_jobs_for_update(
+            now=datetime.now(UTC),
+            limit=image_generation_setting.RETRY_SCAN_BATCH_SIZE
+        )
 
         logger.info(f"Found {len(expired_jobs)} expired jobs to process...")
         if not expired_jobs:
-            return
+            return 0
 
         message_count, consumer_count = await self.rabbit_mq_service.get_queue_info()
         if consumer_count < 1:
@@ -62,7 +81,11 @@ class ImageGenerationRetryService(TransactionalService):
             processor_count=consumer_count
         )
 
+        touched_generation_request_ids: Set[int] = set()
+        retried_expires_at_by_job_id: Dict[int, datetime] = {}
         for expired_job in expired_jobs:
+            touched_generation_request_ids.add(expired_job.generation_request_id)
+
             # [FAILED 처리]
             if expired_job.retry_count >= image_generation_setting.MAX_RETRIES:
                 self._mark_request_failed_and_notify_fcm(expired_job)
@@ -82,6 +105,7 @@ class ImageGenerationRetryService(TransactionalService):
                 )
             )
             retry_job = ImageGenerationJobInDB.model_validate(db_retry_job)
+            retried_expires_at_by_job_id[retry_job.id] = retry_job.expires_at
             message = MQPublishMessage(
                 **retry_job.model_dump(),
                 image_generation_job_id=retry_job.id,
@@ -93,6 +117,27 @@ class ImageGenerationRetryService(TransactionalService):
                 priority=MessagePriority.URGENT
             )
 
+        self._update_status_documents_on_commit(touched_generation_request_ids)
+        # 재발행한 job 은 새 만료 시각으로 타이머를 다시 등록한다.
+        self.unit_of_work.on_commit(lambda: self.job_expiry_schedule.schedule_sync(retried_expires_at_by_job_id))
+        return len(expired_jobs)
+
+    def _update_status_documents_on_commit(self, generation_request_ids: Set[int]):
+        """expires_at / 결과가 바뀐 요청의 상태 문서를 commit 이후에 다시 기록한다."""
+        status_documents: List[GenerationStatusDocument] = []
+        for generation_request_id in generation_request_ids:
+            generation_request: GenerationRequest = self.generation_request_repo.get(generation_request_id)
+            image_generation_job_list = self.image_generation_job_repo.get_all_by_generation_request(generation_request_id)
+            status_documents.append(GenerationStatusDocument.of(generation_request, image_generation_job_list))
+
+        def save_status_documents():
+            for status_document in status_documents:
+                self.generation_status_cache.save_sync(
+                    status_document,
+                    set_latest=status_document.generation_result == GenerationResultEnum.FAILED
+                )
+        self.unit_of_work.on_commit(save_status_documents)
+
     def _mark_request_failed_and_notify_fcm(self, expired_job: ImageGenerationJob):
         self.image_generation_job_repo.update(
             obj_id=expired_job.id,
@@ -100,18 +145,24 @@ class ImageGenerationRetryService(TransactionalService):
         )
         logger.info(f"Job ID: {expired_job.id} has exhausted all retry attempts. Marked as failed.")
 
-        # 아직 fcm 에러를 보내지 않았다면, fcm 전송 후 generation request 업데이트
-        generation_request: GenerationRequest = self.generation_request_repo.get(expired_job.generation_request_id)
+        # 아직 fcm 에러를 보내지 않았다면, fcm 알림을 outbox 에 기록하고 generation request 업데이트
+        # 같은 요청의 job 이 다른 worker 의 batch 에 있을 수 있으므로 요청 row 를 잠가 토큰 반환이 한 번만 일어나게 한다.
+        generation_request: GenerationRequest = self.generation_request_repo.get_for_update(expired_job.generation_request_id)
         if generation_request.generation_result == GenerationResultEnum.PENDING:
 
             user: User = self.user_repo.get(generation_request.user_id)
-            fcm_data = FCMGenerationResultData(generation_status=GenerationResultEnum.FAILED)
-            self.fcm_service.send_to_token(
-                token=user.fcm_token,
-                title=fcm_setting.FAILURE_TITLE,
-                body=fcm_setting.FAILURE_BODY,
-                data=fcm_data.to_fcm_data(),
-            )
+            if user.fcm_token:
+                fcm_data = FCMGenerationResultData(generation_status=GenerationResultEnum.FAILED)
+                self.notification_outbox_repo.create(
+                    obj_in=NotificationOutboxCreate(
+                        token=user.fcm_token,
+                        title=fcm_setting.FAILURE_TITLE,
+                        body=fcm_setting.FAILURE_BODY,
+                        data=fcm_data.to_fcm_data(),
+                        next_attempt_at=datetime.now(UTC),
+                        user_id=user.id,
+                    )
+                )
 
             # 유저 토큰 반환
             self.user_repo.update(obj_id=user.id, obj_in=UserUpdate(token=user.token + 1))
@@ -131,7 +182,9 @@ async def retry_expired_jobs(
             generation_request_repo = get_generation_request_repository(db),
             user_repo=get_user_repository(db),
             rabbit_mq_service=rabbit_mq_service,
-            fcm_service=FCMService(),
+            notification_outbox_repo=get_notification_outbox_repository(db),
+            generation_status_cache=get_generation_status_cache(),
+            job_expiry_schedule=get_job_expiry_schedule(),
             unit_of_work=UnitOfWork(db),
         )
         await service.retry_expired_jobs()
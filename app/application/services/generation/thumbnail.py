@@ -0,0 +1,242 @@
+import logging
+from datetime import datetime, UTC, timedelta
+from typing import Dict, List, Tuple
+
+from app.application.services.transactional_service import TransactionalService
+from app.core.config import aws_s3_setting, thumbnail_setting, image_derivative_setting
+from app.core.db.base import get_db
+from app.core.enums.image_size import ImageSizeEnum
+from app.core.enums.thumbnail_status import ThumbnailStatusEnum
+from app.core.utils import generate_unique_datatime_uuid_key
+from app.domain.generation.models.image import GeneratedImage
+from app.domain.generation.schemas.generated_image_group import GeneratedImageGroupUpdate
+from app.infrastructure.database.transaction import transactional
+from app.infrastructure.database.unit_of_work import UnitOfWork, get_unit_of_work
+from app.infrastructure.repositories.generation.generation import GeneratedImageRepository, \
+    GeneratedImageGroupRepository, get_generated_image_repository, get_generated_image_group_repository
+from app.infrastructure.image.image_processing_service import ImageProcessingService, get_image_processing_service
+from app.infrastructure.s3.s3_client import S3Client, get_s3_client
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_SOURCE_IMAGE_CNT = 3
+
+
+# 축소본 이름 -> 최대 폭 (FULL 은 원본을 그대로 사용한다.)
+DERIVATIVE_MAX_WIDTHS = {
+    ImageSizeEnum.SMALL.value: image_derivative_setting.SMALL_MAX_WIDTH,
+    ImageSizeEnum.MEDIUM.value: image_derivative_setting.MEDIUM_MAX_WIDTH,
+}
+DERIVATIVE_S3_KEY_COLUMNS = {
+    ImageSizeEnum.SMALL.value: "small_s3_key",
+    ImageSizeEnum.MEDIUM.value: "medium_s3_key",
+}
+
+
+class GroupThumbnailService(TransactionalService):
+    """
+    이미지 그룹 썸네일 / 이미지 축소본 조회 및 완료 처리
+    (DB 작업만 담당, 이미지 처리는 트랜잭션 밖에서 한다.)
+    """
+    def __init__(
+            self,
+            generated_image_repo: GeneratedImageRepository,
+            generated_image_group_repo: GeneratedImageGroupRepository,
+            unit_of_work: UnitOfWork,
+    ):
+        super().__init__(unit_of_work)
+        self.generated_image_repo = generated_image_repo
+        self.generated_image_group_repo = generated_image_group_repo
+
+    @transactional
+    def claim(self, generated_image_group_id: int) -> bool:
+        """썸네일 작업을 가져간다. 이미 다른 worker 가 처리 중이거나 끝난 그룹이면 False."""
+        now = datetime.now(UTC)
+        return self.generated_image_group_repo.claim_thumbnail(
+            generated_image_group_id,
+            now=now,
+            claimed_before=now - timedelta(seconds=thumbnail_setting.CLAIM_LEASE_SEC)
+        )
+
+    def get_source_images(self, generated_image_group_id: int) -> List[Tuple[int, str, bool]]:
+        """
+        그룹 이미지 (id, s3_key, 축소본 존재 여부) 를 job 순서대로 반환 - 앞의 THUMBNAIL_SOURCE_IMAGE_CNT 장이 썸네일에 쓰인다.
+        재시도 시 이전 시도에서 이미 만든 축소본은 다시 만들지 않는다.
+        """
+        db_generated_image_list: List[GeneratedImage] = self.generated_image_repo.get_all_by_generate_image_group(
+            generated_image_group_id
+        )
+        db_generated_image_list.sort(key=lambda x: x.image_generation_job_id)
+        return [
+            (
+                db_generated_image.id,
+                db_generated_image.s3_key,
+                all(getattr(db_generated_image, column) for column in DERIVATIVE_S3_KEY_COLUMNS.values())
+            )
+            for db_generated_image in db_generated_image_list
+        ]
+
+    @transactional
+    def complete(
+            self,
+            generated_image_group_id: int,
+            thumbnail_s3_key: str,
+            thumbnail_image_format: str,
+            derivative_s3_keys: Dict[int, Dict[str, str]],
+    ) -> None:
+        self._save_derivative_s3_keys(derivative_s3_keys)
+        self.generated_image_group_repo.update(
+            obj_id=generated_image_group_id,
+            obj_in=GeneratedImageGroupUpdate(
+                thumbnail_image_s3_key=thumbnail_s3_key,
+                thumbnail_status=ThumbnailStatusEnum.COMPLETED,
+                thumbnail_image_format=thumbnail_image_format
+            )
+        )
+
+    @transactional
+    def fail(
+            self,
+            generated_image_group_id: int,
+            derivative_s3_keys: Dict[int, Dict[str, str]],
+            retryable: bool = True,
+    ) -> None:
+        """
+        실패 전까지 업로드된 축소본은 그대로 저장한다.
+        retryable 이고 MAX_ATTEMPTS 에 도달하지 않았으면 PENDING 으로 두고 claim 을 풀어 recovery 가 다시 처리하게 하고,
+        그 외에는 FAILED 로 둔다. (FAILED 그룹은 recovery 대상이 아니며, 썸네일은 첫 번째 이미지를 그대로 사용한다.)
+        """
+        self._save_derivative_s3_keys(derivative_s3_keys)
+        db_generated_image_group = self.generated_image_group_repo.get(generated_image_group_id)
+        attempt_count = db_generated_image_group.thumbnail_attempt_count + 1
+        if retryable and attempt_count < thumbnail_setting.MAX_ATTEMPTS:
+            thumbnail_status = ThumbnailStatusEnum.PENDING
+        else:
+            thumbnail_status = ThumbnailStatusEnum.FAILED
+        self.generated_image_group_repo.update(
+            obj_id=generated_image_group_id,
+            obj_in=GeneratedImageGroupUpdate(
+                thumbnail_status=thumbnail_status,
+                thumbnail_attempt_count=attempt_count,
+                thumbnail_claimed_at=None
+            )
+        )
+
+    def _save_derivative_s3_keys(self, derivative_s3_keys: Dict[int, Dict[str, str]]) -> None:
+        for generated_image_id, s3_keys in derivative_s3_keys.items():
+            if not s3_keys:
+                continue
+            self.generated_image_repo.update(
+                obj_id=generated_image_id,
+                obj_in={DERIVATIVE_S3_KEY_COLUMNS[size]: s3_key for size, s3_key in s3_keys.items()}
+            )
+
+    def get_pending_group_ids(self, older_than_sec: int) -> List[int]:
+        now = datetime.now(UTC)
+        return self.generated_image_group_repo.get_all_id_by_thumbnail_pending(
+            created_before=now - timedelta(seconds=older_than_sec),
+            claimed_before=now - timedelta(seconds=thumbnail_setting.CLAIM_LEASE_SEC)
+        )
+
+
+def _run_with_group_thumbnail_service(func):
+    db = next(get_db())
+    try:
+        return func(
+            GroupThumbnailService(
+                generated_image_repo=get_generated_image_repository(db),
+                generated_image_group_repo=get_generated_image_group_repository(db),
+                unit_of_work=get_unit_of_work(db),
+            )
+        )
+    finally:
+        db.close()
+
+
+def _create_image_derivatives(
+        s3_client: S3Client,
+        image_processing_service: ImageProcessingService,
+        image_bytes: bytes,
+) -> Dict[str, str]:
+    """이미지 한 장의 SMALL / MEDIUM 축소본을 만들어 업로드하고, 업로드된 축소본 이름 -> s3 key 를 반환한다."""
+    derivatives = image_processing_service.create_resized_derivatives(
+        image_bytes,
+        DERIVATIVE_MAX_WIDTHS,
+        output_format=image_derivative_setting.OUTPUT_FORMAT,
+        quality=image_derivative_setting.QUALITY,
+    )
+
+    s3_keys: Dict[str, str] = {}
+    for size, (derivative_bytes, img_format) in derivatives.items():
+        derivative_key = generate_unique_datatime_uuid_key(
+            prefix=f"{aws_s3_setting.GENERATED_IMAGE_DERIVATIVE_S3KEY_PREFIX}{size.lower()}/"
+        )
+        if s3_client.upload_to_s3(derivative_key, derivative_bytes, img_format):
+            s3_keys[size] = derivative_key
+    return s3_keys
+
+
+def create_group_thumbnail(generated_image_group_id: int) -> None:
+    """
+    썸네일 파이프라인 worker 에서 호출된다.
+    그룹 이미지를 한 번만 내려받아 이미지별 축소본과 그룹 썸네일을 함께 만든다.
+    다운로드 / 합성 / 업로드 동안에는 DB 연결을 잡지 않도록 조회와 완료 처리를 각각 짧은 세션으로 나눈다.
+    여러 worker replica 의 recovery 가 같은 그룹을 넣을 수 있으므로, 처리 전에 DB 에서 그룹을 claim 한다.
+    """
+    if not _run_with_group_thumbnail_service(lambda service: service.claim(generated_image_group_id)):
+        logger.info(f"[Thumbnail] group {generated_image_group_id} is already claimed or done")
+        return
+
+    source_images = _run_with_group_thumbnail_service(lambda service: service.get_source_images(generated_image_group_id))
+    if not source_images:
+        logger.warning(f"[Thumbnail] group {generated_image_group_id} has no images")
+        _run_with_group_thumbnail_service(
+            lambda service: service.fail(generated_image_group_id, {}, retryable=False)
+        )
+        return
+
+    # 썸네일 단계에서 실패해도 이미 업로드된 축소본은 fail 에서 저장한다.
+    derivative_s3_keys: Dict[int, Dict[str, str]] = {}
+    try:
+        s3_client: S3Client = get_s3_client()
+        image_bytes_list = s3_client.get_objects_bytes([s3_key for _, s3_key, _ in source_images])
+
+        # 디코딩 / 인코딩은 process pool 에서 처리 (API thread 와 GIL 경쟁하지 않도록)
+        image_processing_service: ImageProcessingService = get_image_processing_service()
+
+        # 축소본은 실패해도 원본으로 대체할 수 있으므로 이미지 단위로 건너뛴다.
+        for (generated_image_id, s3_key, has_derivatives), image_bytes in zip(source_images, image_bytes_list):
+            if has_derivatives:
+                continue
+            try:
+                derivative_s3_keys[generated_image_id] = _create_image_derivatives(
+                    s3_client, image_processing_service, image_bytes
+                )
+            except Exception as e:
+                logger.warning(f"[Thumbnail] failed to create derivatives for {s3_key}: {e}")
+
+        compressed_bytes, img_format = image_processing_service.create_stitched_thumbnail(
+            image_bytes_list[:THUMBNAIL_SOURCE_IMAGE_CNT],
+            output_format=thumbnail_setting.OUTPUT_FORMAT,
+            quality=thumbnail_setting.QUALITY,
+            min_quality=thumbnail_setting.MIN_QUALITY,
+            target_bytes=thumbnail_setting.TARGET_BYTES,
+        )
+
+        thumbnail_key = generate_unique_datatime_uuid_key(
+            prefix=aws_s3_setting.GENERATED_IMAGE_GROUP_S3KEY_PREFIX
+        )
+        if not s3_client.upload_to_s3(thumbnail_key, compressed_bytes, img_format):
+            raise RuntimeError(f"failed to upload thumbnail {thumbnail_key}")
+    except Exception as e:
+        logger.error(f"[Thumbnail] failed to create thumbnail for group {generated_image_group_id}: {e}", exc_info=True)
+        _run_with_group_thumbnail_service(lambda service: service.fail(generated_image_group_id, derivative_s3_keys))
+        return
+
+    _run_with_group_thumbnail_service(lambda service: service.complete(
+        generated_image_group_id, thumbnail_key, img_format, derivative_s3_keys
+    ))
+
+
+def get_thumbnail_pending_group_ids(older_than_sec: int) -> List[int]:
+    return _run_with_group_thumbnail_service(lambda service: service.get_pending_group_ids(older_than_sec))
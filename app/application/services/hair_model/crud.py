@@ -26,11 +26,30 @@ from app.domain.hair_model.models.scene import Background, PostureAndClothing, I
 from app.domain.hair_model.schemas.scene.background import BackgroundInDB, BackgroundCreate
 from app.domain.hair_model.schemas.scene.image_resolution import ImageResolutionInDB, ImageResolutionCreate, ImageResolutionUpdate
 from app.domain.hair_model.schemas.scene.posture_and_clothing import PostureAndClothingInDB, PostureAndClothingCreate, PostureAndClothingUpdate
-from app.application.services.crud_service import CRUDService
+from app.application.services.crud_service import CRUDService, ModelInDB, RepositoryType
+from app.infrastructure.cache.hair_model_catalog_cache import get_hair_model_catalog_cache
+from app.infrastructure.repositories.crud_repository import ModelType, CreateSchemaType, UpdateSchemaType
 
 
+class HairModelCatalogCRUDService(CRUDService[ModelType, ModelInDB, CreateSchemaType, UpdateSchemaType, RepositoryType]):
+    """catalog 쓰기가 커밋된 뒤 option catalog 캐시 version 을 올린다."""
+    def create(self, obj_in: CreateSchemaType) -> ModelInDB:
+        result = super().create(obj_in)
+        get_hair_model_catalog_cache().invalidate()
+        return result
 
-class GenderCRUDService(CRUDService[Gender, GenderInDB, GenderCreate, GenderUpdate, GenderRepository]):
+    def update(self, obj_id: int, update_data: UpdateSchemaType) -> ModelInDB:
+        result = super().update(obj_id, update_data)
+        get_hair_model_catalog_cache().invalidate()
+        return result
+
+    def remove(self, obj_id: int) -> ModelInDB:
+        result = super().remove(obj_id)
+        get_hair_model_catalog_cache().invalidate()
+        return result
+
+
+class GenderCRUDService(HairModelCatalogCRUDService[Gender, GenderInDB, GenderCreate, GenderUpdate, GenderRepository]):
     def __init__(self, repo: GenderRepository, unit_of_work: UnitOfWork):
         super().__init__(repo, GenderInDB, unit_of_work)
 
@@ -41,7 +60,7 @@ def get_gender_crud_service(
     return GenderCRUDService(repo=repo, unit_of_work=unit_of_work)
 
 
-class LengthCRUDService(CRUDService[Length, LengthInDB, LengthCreate, LengthUpdate, LengthRepository]):
+class LengthCRUDService(HairModelCatalogCRUDService[Length, LengthInDB, LengthCreate, LengthUpdate, LengthRepository]):
     def __init__(self, repo: LengthRepository, unit_of_work: UnitOfWork):
         super().__init__(repo, LengthInDB, unit_of_work)
 
@@ -52,7 +71,7 @@ def get_length_crud_service(
     return LengthCRUDService(repo=repo, unit_of_work=unit_of_work)
 
 
-class ColorCRUDService(CRUDService[Color, ColorInDB, ColorCreate, ColorUpdate, ColorRepository]):
+class ColorCRUDService(HairModelCatalogCRUDService[Color, ColorInDB, ColorCreate, ColorUpdate, ColorRepository]):
     def __init__(self, repo: ColorRepository, unit_of_work: UnitOfWork):
         super().__init__(repo, ColorInDB, unit_of_work)
 
@@ -63,7 +82,7 @@ def get_color_crud_service(
     return ColorCRUDService(repo=repo, unit_of_work=unit_of_work)
 
 
-class LoRAModelCRUDService(CRUDService[LoRAModel, LoRAModelInDB, LoRAModelCreate, LoRAModelUpdate, LoRAModelRepository]):
+class LoRAModelCRUDService(HairModelCatalogCRUDService[LoRAModel, LoRAModelInDB, LoRAModelCreate, LoRAModelUpdate, LoRAModelRepository]):
     def __init__(self, repo: LoRAModelRepository, unit_of_work: UnitOfWork):
         super().__init__(repo, LoRAModelInDB, unit_of_work)
 
@@ -74,7 +93,7 @@ def get_lora_model_crud_service(
     return LoRAModelCRUDService(repo=repo, unit_of_work=unit_of_work)
 
 
-class SpecificColorCRUDService(CRUDService[SpecificColor, SpecificColorInDB, SpecificColorCreate, SpecificColorUpdate, SpecificColorRepository]):
+class SpecificColorCRUDService(HairModelCatalogCRUDService[SpecificColor, SpecificColorInDB, SpecificColorCreate, SpecificColorUpdate, SpecificColorRepository]):
     def __init__(self, repo: SpecificColorRepository, unit_of_work: UnitOfWork):
         super().__init__(repo, SpecificColorInDB, unit_of_work)
 
@@ -85,7 +104,7 @@ def get_specific_color_crud_service(
     return SpecificColorCRUDService(repo=repo, unit_of_work=unit_of_work)
 
 
-class HairStyleCRUDService(CRUDService[HairStyle, HairStyleInDB, HairStyleCreate, HairStyleUpdate, HairStyleRepository]):
+class HairStyleCRUDService(HairModelCatalogCRUDService[HairStyle, HairStyleInDB, HairStyleCreate, HairStyleUpdate, HairStyleRepository]):
     def __init__(self, repo: HairStyleRepository, unit_of_work: UnitOfWork):
         super().__init__(repo, HairStyleInDB, unit_of_work)
 
@@ -101,7 +120,7 @@ def get_hair_style_crud_service(
 
 
 
-class HairStyleLengthCRUDService(CRUDService[HairStyleLength, HairStyleLengthInDB, HairStyleLengthCreate, HairStyleLengthUpdate, HairStyleLengthRepository]):
+class HairStyleLengthCRUDService(HairModelCatalogCRUDService[HairStyleLength, HairStyleLengthInDB, HairStyleLengthCreate, HairStyleLengthUpdate, HairStyleLengthRepository]):
     def __init__(self, repo: HairStyleLengthRepository, unit_of_work: UnitOfWork):
         super().__init__(repo, HairStyleLengthInDB, unit_of_work)
 
@@ -124,7 +143,7 @@ def get_hair_style_length_crud_service(
     return HairStyleLengthCRUDService(repo=repo, unit_of_work=unit_of_work)
 
 
-class HairDesignCRUDService(CRUDService[HairDesign, HairDesignInDB, HairDesignCreate, HairDesignUpdate, HairDesignRepository]):
+class HairDesignCRUDService(HairModelCatalogCRUDService[HairDesign, HairDesignInDB, HairDesignCreate, HairDesignUpdate, HairDesignRepository]):
     def __init__(self, repo: HairDesignRepository, unit_of_work: UnitOfWork):
         super().__init__(repo, HairDesignInDB, unit_of_work)
 
@@ -154,7 +173,7 @@ def get_hair_design_crud_service(
 
 
 
-class HairDesignColorCRUDService(CRUDService[HairDesignColor, HairDesignColorInDB, HairDesignColorCreate, HairDesignColorUpdate, HairDesignColorRepository]):
+class HairDesignColorCRUDService(HairModelCatalogCRUDService[HairDesignColor, HairDesignColorInDB, HairDesignColorCreate, HairDesignColorUpdate, HairDesignColorRepository]):
     def __init__(self, repo: HairDesignColorRepository, unit_of_work: UnitOfWork):
         super().__init__(repo,HairDesignColorInDB, unit_of_work)
 
@@ -171,7 +190,7 @@ def get_hair_design_color_crud_service(
     return HairDesignColorCRUDService(repo=repo, unit_of_work=unit_of_work)
 
 
-class HairVariantModelCRUDService(CRUDService[HairVariantModel,HairVariantModelInDB, HairVariantModelCreate, HairVariantModelUpdate, HairVariantModelRepository]):
+class HairVariantModelCRUDService(HairModelCatalogCRUDService[HairVariantModel,HairVariantModelInDB, HairVariantModelCreate, HairVariantModelUpdate, HairVariantModelRepository]):
     def __init__(self, repo: HairVariantModelRepository, unit_of_work: UnitOfWork):
         super().__init__(repo, HairVariantModelInDB, unit_of_work)
 
@@ -191,7 +210,7 @@ def get_hair_variant_model_crud_service(
     return HairVariantModelCRUDService(repo=repo, unit_of_work=unit_of_work)
 
 
-class BackgroundCRUDService(CRUDService[Background, BackgroundInDB, BackgroundCreate, BackgroundCreate, BackgroundRepository]):
+class BackgroundCRUDService(HairModelCatalogCRUDService[Background, BackgroundInDB, BackgroundCreate, BackgroundCreate, BackgroundRepository]):
     def __init__(self, repo: BackgroundRepository, unit_of_work: UnitOfWork):
         super().__init__(repo=repo, model_in_db=BackgroundInDB, unit_of_work=unit_of_work)
 
@@ -222,7 +241,7 @@ def get_posture_and_clothing_crud_service(
 
 
 class ImageResolutionCRUDService(
-    CRUDService[ImageResolution, ImageResolutionInDB, ImageResolutionCreate, ImageResolutionUpdate, ImageResolutionRepository]
+    HairModelCatalogCRUDService[ImageResolution, ImageResolutionInDB, ImageResolutionCreate, ImageResolutionUpdate, ImageResolutionRepository]
 ):
     def __init__(self, repo: ImageResolutionRepository, unit_of_work: UnitOfWork):
         super().__init__(repo=repo, model_in_db=ImageResolutionInDB, unit_of_work=unit_of_work)
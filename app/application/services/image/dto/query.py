@@ -1,3 +1,4 @@
+from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -15,3 +16,7 @@ class GeneratedImageGroupData(BaseModel):
     title: str
     created_at: datetime
 
+class GeneratedImageGroupPage(BaseModel):
+    items: List[GeneratedImageGroupData]
+    # 다음 페이지 요청에 그대로 넘기는 값, 마지막 페이지면 None
+    next_cursor: Optional[str] = None
@@ -1,82 +1,97 @@
-from typing import List
+from typing import List, Optional, Tuple
 from fastapi import Depends
+from sqlalchemy import Row
 
-from app.application.services.image.dto.query import GeneratedImageData, GeneratedImageGroupData
-from app.core.errors.http_exceptions import ForbiddenRequestException
-from app.domain.generation.models.generation import GenerationRequest
-from app.domain.generation.models.image import GeneratedImageGroup, GeneratedImage
-from app.domain.generation.schemas.generated_image import GeneratedImageInDB
+from app.application.services.image.dto.query import GeneratedImageData, GeneratedImageGroupData, \
+    GeneratedImageGroupPage
+from app.core.config import image_derivative_setting
+from app.core.enums.image_size import ImageSizeEnum
+from app.core.errors.http_exceptions import ForbiddenRequestException, RequestValueException, \
+    ResourceNotFoundException
+from app.core.utils import encode_keyset_cursor, decode_keyset_cursor
+from app.domain.generation.models.image import GeneratedImageGroup
 from app.domain.generation.schemas.generated_image_group import GeneratedImageGroupInDB
-from app.domain.hair_model.models.scene import ImageResolution
-from app.infrastructure.repositories.hair_model.hair_model import HairStyleRepository, get_hair_style_repository, \
-    ImageResolutionRepository, get_image_resolution_repository
 from app.infrastructure.s3.s3_client import S3Client, get_s3_client
-from app.infrastructure.repositories.generation.generation import GeneratedImageRepository, \
-    GeneratedImageGroupRepository, get_generated_image_repository, get_generated_image_group_repository, \
-    GenerationRequestRepository, get_generation_request_repository, ExampleGeneratedImageRepository, \
-    ExampleGeneratedImageGroupRepository, get_example_generated_image_repository, \
-    get_example_generated_image_group_repository
+from app.infrastructure.repositories.generation.generation import AsyncGeneratedImageRepository, \
+    AsyncGeneratedImageGroupRepository, get_async_generated_image_repository, \
+    get_async_generated_image_group_repository
 
 
 class ImageQueryApplicationService:
     def __init__(
             self,
-            generated_image_repo: GeneratedImageRepository,
-            generated_image_group_repo: GeneratedImageGroupRepository,
-            example_generated_image_repo: ExampleGeneratedImageRepository,
-            example_generated_image_group_repo: ExampleGeneratedImageGroupRepository,
-            hair_style_repo: HairStyleRepository,
-            generation_request_repo: GenerationRequestRepository,
-            image_resolution_repo: ImageResolutionRepository,
+            generated_image_repo: AsyncGeneratedImageRepository,
+            generated_image_group_repo: AsyncGeneratedImageGroupRepository,
             s3_client: S3Client
     ):
         self.generated_image_repo = generated_image_repo
         self.generated_image_group_repo = generated_image_group_repo
-        self.example_generated_image_repo = example_generated_image_repo
-        self.example_generated_image_group_repo = example_generated_image_group_repo
-        self.hair_style_repo = hair_style_repo
-        self.generation_request_repo = generation_request_repo
-        self.image_resolution_repo = image_resolution_repo
         self.s3_client = s3_client
 
-    def get_generated_image_list_by_image_group(self, generated_image_group_id: int, user_id: int) -> List[GeneratedImageData]:
+    async def get_generated_image_list_by_image_group(
+            self,
+            generated_image_group_id: int,
+            user_id: int,
+            size: ImageSizeEnum = ImageSizeEnum.FULL
+    ) -> List[GeneratedImageData]:
+        rows: List[Row] = await self.generated_image_repo.get_list_rows_by_image_group(generated_image_group_id)
+        return self._to_generated_image_list(rows, user_id, size)
+
+    async def get_generated_image_list_by_generation_request(
+            self,
+            generation_request_id: int,
+            user_id: int,
+            size: ImageSizeEnum = ImageSizeEnum.FULL
+    ) -> List[GeneratedImageData]:
+        rows: List[Row] = await self.generated_image_repo.get_list_rows_by_generation_request(generation_request_id)
+        return self._to_generated_image_list(rows, user_id, size)
+
+    def _to_generated_image_list(self, rows: List[Row], user_id: int, size: ImageSizeEnum) -> List[GeneratedImageData]:
+        if not rows:
+            raise ResourceNotFoundException(context="generated_image_group")
 
         # 검증 로직 - 해당 image group이 user의 것이 맞는가?
-        db_generated_image_group: GeneratedImageGroup = self.generated_image_group_repo.get(generated_image_group_id)
-        if db_generated_image_group.user_id != user_id:
+        if rows[0].owner_user_id != user_id:
             raise ForbiddenRequestException()
 
-        db_generated_image_list: List[GeneratedImage] = self.generated_image_repo.get_all_by_generate_image_group(generated_image_group_id)
-
         generated_image_response: List[GeneratedImageData] = []
-        generation_request: GenerationRequest = self.generation_request_repo.get(db_generated_image_group.generation_request_id)
-        image_resolution: ImageResolution = self.image_resolution_repo.get(generation_request.image_resolution_id)
-
-        for db_generated_image in db_generated_image_list:
-            generated_image = GeneratedImageInDB.model_validate(db_generated_image)
+        for row in rows:
+            # 이미지가 없는 그룹
+            if row.id is None:
+                continue
+            s3_key, width, height = _select_image_size(row, size)
             generated_image_response.append(
                 GeneratedImageData(
-                    **generated_image.model_dump(),
-                    width=image_resolution.width,
-                    height=image_resolution.height,
-                    image_url=self.s3_client.create_presigned_url(s3_key=generated_image.s3_key)
+                    id=row.id,
+                    generated_image_group_id=row.generated_image_group_id,
+                    width=width,
+                    height=height,
+                    image_url=self.s3_client.create_presigned_url(s3_key=s3_key)
                 )
             )
         return generated_image_response
 
-    # TODO: 이 asset 이 user 의 소유가 맞는지 validation 하는 과정이 호출하는 위의 함수에 의존하고 있다.
-    # validation 중복을 없애기 위해서 일단은 이렇게 하지만, 개선이 필요한 구조임.
-    def get_generated_image_list_by_generation_request(self, generation_request_id: int, user_id: int) -> List[GeneratedImageData]:
-        generated_image_group: GeneratedImageGroup = self.generated_image_group_repo.get_by_generation_request(generation_request_id)
+    async def get_generated_image_group_page_by_user(
+            self,
+            user_id: int,
+            limit: Optional[int],
+            cursor: Optional[str] = None
+    ) -> GeneratedImageGroupPage:
+        """limit 이 None 이면 (페이지를 요청하지 않은 기존 client) 남은 그룹 전체를 한 페이지로 반환한다."""
+        after = None
+        if cursor is not None:
+            after = decode_keyset_cursor(cursor)
+            if after is None:
+                raise RequestValueException(context="cursor")
 
-        return self.get_generated_image_list_by_image_group(
-            generated_image_group_id=generated_image_group.id,
-            user_id=user_id
+        # 한 개 더 읽어서 다음 페이지가 있는지 확인한다.
+        db_generated_image_group_list: List[GeneratedImageGroup] = await self.generated_image_group_repo.get_page_by_user(
+            user_id=user_id,
+            limit=limit + 1 if limit is not None else None,
+            after=after
         )
-
-    # 데이터 많아지면 pagination 이 적절히 필요할수도.
-    def get_generated_image_group_list_by_user(self, user_id: int) -> List[GeneratedImageGroupData]:
-        db_generated_image_group_list: List[GeneratedImageGroup] = self.generated_image_group_repo.get_all_by_user(user_id)
+        has_next = limit is not None and len(db_generated_image_group_list) > limit
+        db_generated_image_group_list = db_generated_image_group_list[:limit]
 
         generated_image_group_response: List[GeneratedImageGroupData] = []
         for db_generated_image_group in db_generated_image_group_list:
@@ -87,27 +102,35 @@ class ImageQueryApplicationService:
                     thumbnail_image_url=self.s3_client.create_presigned_url(s3_key=generated_image_group.thumbnail_image_s3_key)
                 )
             )
-        generated_image_group_response.sort(key=lambda x: x.created_at, reverse=True)
-        return generated_image_group_response
-
-
-def get_image_query_application_service(
-        generated_image_repo: GeneratedImageRepository = Depends(get_generated_image_repository),
-        generated_image_group_repo: GeneratedImageGroupRepository = Depends(get_generated_image_group_repository),
-        example_generated_image_repo: ExampleGeneratedImageRepository = Depends(get_example_generated_image_repository),
-        example_generated_image_group_repo: ExampleGeneratedImageGroupRepository = Depends(get_example_generated_image_group_repository),
-        hair_style_repo: HairStyleRepository = Depends(get_hair_style_repository),
-        generation_request_repo: GenerationRequestRepository = Depends(get_generation_request_repository),
-        image_resolution_repo: ImageResolutionRepository = Depends(get_image_resolution_repository),
+
+        next_cursor = None
+        if has_next:
+            last = db_generated_image_group_list[-1]
+            next_cursor = encode_keyset_cursor(last.created_at, last.id)
+        return GeneratedImageGroupPage(items=generated_image_group_response, next_cursor=next_cursor)
+
+
+def _select_image_size(row: Row, size: ImageSizeEnum) -> Tuple[str, int, int]:
+    """요청한 크기의 s3 key 와 그 크기를 반환한다. 축소본이 아직 없으면 원본을 준다."""
+    if size == ImageSizeEnum.SMALL and row.small_s3_key:
+        s3_key, max_width = row.small_s3_key, image_derivative_setting.SMALL_MAX_WIDTH
+    elif size == ImageSizeEnum.MEDIUM and row.medium_s3_key:
+        s3_key, max_width = row.medium_s3_key, image_derivative_setting.MEDIUM_MAX_WIDTH
+    else:
+        return row.s3_key, row.width, row.height
+
+    if row.width <= max_width:
+        return s3_key, row.width, row.height
+    return s3_key, max_width, max(1, round(row.height * max_width / row.width))
+
+
+async def get_image_query_application_service(
+        generated_image_repo: AsyncGeneratedImageRepository = Depends(get_async_generated_image_repository),
+        generated_image_group_repo: AsyncGeneratedImageGroupRepository = Depends(get_async_generated_image_group_repository),
         s3_client: S3Client = Depends(get_s3_client)
 ) -> ImageQueryApplicationService:
     return ImageQueryApplicationService(
         generated_image_repo=generated_image_repo,
         generated_image_group_repo=generated_image_group_repo,
-        example_generated_image_repo=example_generated_image_repo,
-        example_generated_image_group_repo=example_generated_image_group_repo,
-        hair_style_repo=hair_style_repo,
-        generation_request_repo=generation_request_repo,
-        image_resolution_repo=image_resolution_repo,
         s3_client=s3_client
-     )
\ No newline at end of file
+     )
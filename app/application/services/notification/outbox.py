@@ -0,0 +1,135 @@
+import logging
+from datetime import datetime, UTC, timedelta
+from typing import List
+
+from app.application.services.transactional_service import TransactionalService
+from app.core.config import notification_outbox_setting, NotificationOutboxSetting
+from app.core.db.base import get_db
+from app.core.enums.notification_status import NotificationStatusEnum
+from app.core.errors.exceptions import FCMException
+from app.domain.notification.models.notification_outbox import NotificationOutbox
+from app.domain.notification.schemas.notification_outbox import NotificationOutboxUpdate
+from app.infrastructure.database.transaction import transactional
+from app.infrastructure.database.unit_of_work import UnitOfWork, get_unit_of_work
+from app.infrastructure.fcm.fcm_service import FCMService, FCMSendResult, get_fcm_service
+from app.infrastructure.repositories.notification.notification_outbox import NotificationOutboxRepository, \
+    get_notification_outbox_repository
+from app.infrastructure.repositories.user.user import UserRepository, get_user_repository
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationOutboxDeliveryService(TransactionalService):
+    """
+    notification_outbox 의 PENDING 알림을 배치로 FCM 전송한다.
+    - row 는 SKIP LOCKED 로 잠그고 가져오므로 여러 sender 가 동시에 돌아도 중복 전송하지 않는다.
+    - 실패한 알림은 지수 backoff 로 next_attempt_at 을 미루고, MAX_ATTEMPTS 를 넘기면 FAILED 로 남긴다.
+    - 유효하지 않은 token 은 재시도하지 않고 사용자 fcm_token 을 비운다.
+    """
+    def __init__(
+            self,
+            notification_outbox_repo: NotificationOutboxRepository,
+            user_repo: UserRepository,
+            fcm_service: FCMService,
+            unit_of_work: UnitOfWork,
+            setting: NotificationOutboxSetting = notification_outbox_setting,
+    ):
+        super().__init__(unit_of_work)
+        self.notification_outbox_repo = notification_outbox_repo
+        self.user_repo = user_repo
+        self.fcm_service = fcm_service
+        self.setting = setting
+
+    @transactional
+    def deliver_due(self) -> int:
+        """전송할 차례가 된 알림 한 배치를 처리하고, 처리한 row 수를 반환한다."""
+        now = datetime.now(UTC)
+        outbox_list: List[NotificationOutbox] = self.notification_outbox_repo.get_due_for_update(
+            now=now, limit=self.setting.BATCH_SIZE
+        )
+        if not outbox_list:
+            return 0
+
+        messages = [
+            self.fcm_service.build_message(
+                token=outbox.token,
+                title=outbox.title,
+                body=outbox.body,
+                category=outbox.category,
+                identifier=outbox.identifier,
+                data=outbox.data,
+            )
+            for outbox in outbox_list
+        ]
+        try:
+            results: List[FCMSendResult] = self.fcm_service.send_each(messages)
+        except FCMException as e:
+            # 배치 전체 실패 (네트워크 등) - 모두 재시도 대상
+            logger.warning(f"[NotificationOutbox] batch send failed: {e}")
+            results = [FCMSendResult(success=False, error=str(e)) for _ in outbox_list]
+
+        sent_count = 0
+        for outbox, result in zip(outbox_list, results):
+            if result.success:
+                sent_count += 1
+                self.notification_outbox_repo.update(
+                    obj_id=outbox.id,
+                    obj_in=NotificationOutboxUpdate(status=NotificationStatusEnum.SENT, attempt_count=outbox.attempt_count + 1)
+                )
+            elif result.invalid_token:
+                self.user_repo.clear_fcm_token(user_id=outbox.user_id, fcm_token=outbox.token)
+                self._mark_failed(outbox, result.error)
+            else:
+                self._schedule_retry(outbox, result.error, now)
+
+        logger.info(f"[NotificationOutbox] sent {sent_count}/{len(outbox_list)} notifications")
+        return len(outbox_list)
+
+    def _schedule_retry(self, outbox: NotificationOutbox, error: str, now: datetime) -> None:
+        attempt_count = outbox.attempt_count + 1
+        if attempt_count >= self.setting.MAX_ATTEMPTS:
+            self._mark_failed(outbox, error)
+            return
+
+        delay_sec = min(
+            self.setting.RETRY_BASE_DELAY_SEC * (2 ** (attempt_count - 1)),
+            self.setting.RETRY_MAX_DELAY_SEC
+        )
+        self.notification_outbox_repo.update(
+            obj_id=outbox.id,
+            obj_in=NotificationOutboxUpdate(
+                attempt_count=attempt_count,
+                next_attempt_at=now + timedelta(seconds=delay_sec),
+                last_error=self._truncate_error(error)
+            )
+        )
+
+    def _mark_failed(self, outbox: NotificationOutbox, error: str) -> None:
+        logger.warning(f"[NotificationOutbox] notification {outbox.id} failed: {error}")
+        self.notification_outbox_repo.update(
+            obj_id=outbox.id,
+            obj_in=NotificationOutboxUpdate(
+                status=NotificationStatusEnum.FAILED,
+                attempt_count=outbox.attempt_count + 1,
+                last_error=self._truncate_error(error)
+            )
+        )
+
+    @staticmethod
+    def _truncate_error(error: str) -> str:
+        return (error or "")[:1024]
+
+
+def deliver_notification_outbox_batch() -> int:
+    """sender task 에서 thread 로 호출된다."""
+    db = next(get_db())
+    try:
+        service = NotificationOutboxDeliveryService(
+            notification_outbox_repo=get_notification_outbox_repository(db),
+            user_repo=get_user_repository(db),
+            fcm_service=get_fcm_service(),
+            unit_of_work=get_unit_of_work(db),
+        )
+        return service.deliver_due()
+    finally:
+        db.close()
@@ -1,5 +1,7 @@
-from app.infrastructure.database.unit_of_work import UnitOfWork
+from typing import Union
+
+from app.infrastructure.database.unit_of_work import UnitOfWork, AsyncUnitOfWork
 
 class TransactionalService:
-    def __init__(self, unit_of_work: UnitOfWork):
-        self.unit_of_work = unit_of_work
\ No newline at end of file
+    def __init__(self, unit_of_work: Union[UnitOfWork, AsyncUnitOfWork]):
+        self.unit_of_work = unit_of_work
@@ -156,7 +156,8 @@ def get_apple_user_auth_application_service(
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 security = HTTPBearer()
 
-def validate_user_token(
+# JWT 검증은 CPU 작업뿐이므로 async 로 두어 요청마다 thread pool 을 거치지 않게 한다.
+async def validate_user_token(
         credentials: HTTPAuthorizationCredentials = Depends(security),
         auth_token_service: AuthTokenService = Depends(get_auth_token_service)
 ):
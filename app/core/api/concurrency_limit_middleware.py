@@ -0,0 +1,210 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import ConcurrencyLimitSetting
+from app.core.errors.error_messages import SERVER_BUSY_MESSAGE
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrencyLimitExceeded(Exception):
+    pass
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    route group 하나에 대한 AIMD 동시성 제한기.
+    - 요청이 latency 임계치 안에 성공하면 limit 을 천천히(+1/limit) 올리고,
+    - 임계치를 넘기거나 5xx 로 끝나면 limit 을 backoff_ratio 만큼 곱해 줄인다.
+    limit 을 넘는 요청은 대기열에서 queue_timeout_sec 만큼만 기다리고, 대기열이 가득 차면 바로 거절한다.
+    """
+    def __init__(
+            self,
+            name: str,
+            initial_limit: int,
+            min_limit: int,
+            max_limit: int,
+            latency_threshold_sec: float,
+            max_queue_size: int,
+            queue_timeout_sec: float,
+            backoff_ratio: float,
+    ):
+        self.name = name
+        self.limit: float = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold_sec = latency_threshold_sec
+        self.max_queue_size = max_queue_size
+        self.queue_timeout_sec = queue_timeout_sec
+        self.backoff_ratio = backoff_ratio
+
+        self.in_flight: int = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        self.rejected_count: int = 0
+        self.timeout_count: int = 0
+        self.last_latency_sec: Optional[float] = None
+
+    async def acquire(self) -> None:
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return
+
+        if len(self._waiters) >= self.max_queue_size:
+            self.rejected_count += 1
+            raise ConcurrencyLimitExceeded()
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # 슬롯은 release 쪽에서 in_flight 를 올린 뒤 넘겨준다.
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.queue_timeout_sec)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # timeout 과 동시에 슬롯을 넘겨받은 경우 - 받은 슬롯을 그대로 사용한다.
+                return
+            waiter.cancel()
+            self._remove_waiter(waiter)
+            self.timeout_count += 1
+            raise ConcurrencyLimitExceeded()
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release_slot()
+            else:
+                waiter.cancel()
+                self._remove_waiter(waiter)
+            raise
+
+    def release(self, latency_sec: float, succeeded: bool) -> None:
+        self.last_latency_sec = latency_sec
+        if succeeded and latency_sec <= self.latency_threshold_sec:
+            self.limit = min(float(self.max_limit), self.limit + 1.0 / max(self.limit, 1.0))
+        else:
+            self.limit = max(float(self.min_limit), self.limit * self.backoff_ratio)
+        self._release_slot()
+
+    def snapshot(self) -> dict:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queue_depth": len(self._waiters),
+            "max_queue_size": self.max_queue_size,
+            "rejected_count": self.rejected_count,
+            "timeout_count": self.timeout_count,
+            "last_latency_sec": self.last_latency_sec,
+        }
+
+    def _release_slot(self) -> None:
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    def _remove_waiter(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+
+class ConcurrencyLimiterRegistry:
+    """path prefix / suffix 로 route group 을 결정하고, group 별 limiter 를 보관한다."""
+    DEFAULT_GROUP = "default"
+
+    def __init__(self, setting: ConcurrencyLimitSetting):
+        self.setting = setting
+        self.limiters: Dict[str, AdaptiveConcurrencyLimiter] = {
+            name: AdaptiveConcurrencyLimiter(
+                name=name,
+                initial_limit=group_limit["initial_limit"],
+                min_limit=group_limit["min_limit"],
+                max_limit=group_limit["max_limit"],
+                latency_threshold_sec=group_limit["latency_threshold_sec"],
+                max_queue_size=setting.MAX_QUEUE_SIZE,
+                queue_timeout_sec=setting.QUEUE_TIMEOUT_SEC,
+                backoff_ratio=setting.BACKOFF_RATIO,
+            )
+            for name, group_limit in setting.ROUTE_GROUP_LIMITS.items()
+        }
+        # 더 구체적인 prefix 가 먼저 매칭되도록 길이 역순 정렬
+        self._prefix_groups: List[Tuple[str, str]] = sorted(
+            setting.ROUTE_GROUP_PREFIXES.items(), key=lambda item: len(item[0]), reverse=True
+        )
+
+    def resolve(self, path: str) -> Optional[AdaptiveConcurrencyLimiter]:
+        if path in self.setting.EXEMPT_PATHS or path.endswith(tuple(self.setting.EXEMPT_SUFFIXES)):
+            return None
+        for suffix, group in self.setting.ROUTE_GROUP_SUFFIXES.items():
+            if path.endswith(suffix):
+                return self.limiters[group]
+        for prefix, group in self._prefix_groups:
+            if path.startswith(prefix):
+                return self.limiters[group]
+        return self.limiters[self.DEFAULT_GROUP]
+
+    def snapshot(self) -> Dict[str, dict]:
+        return {name: limiter.snapshot() for name, limiter in self.limiters.items()}
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    route group 별 adaptive 동시성 제한 미들웨어.
+    BaseHTTPMiddleware 대신 순수 ASGI 로 구현해서 응답 body 스트리밍까지 latency 에 포함한다.
+    """
+    def __init__(self, app: ASGIApp, registry: ConcurrencyLimiterRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self.registry.resolve(scope["path"])
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await limiter.acquire()
+        except ConcurrencyLimitExceeded:
+            logger.warning(f"[ConcurrencyLimit] rejected {scope['path']} (group: {limiter.name}, {limiter.snapshot()})")
+            response = self._busy_response(limiter)
+            await response(scope, receive, send)
+            return
+
+        status_code = 500
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = time.monotonic()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            limiter.release(
+                latency_sec=time.monotonic() - started_at,
+                succeeded=status_code < 500
+            )
+
+    def _busy_response(self, limiter: AdaptiveConcurrencyLimiter) -> JSONResponse:
+        return JSONResponse(
+            status_code=503,
+            headers={"Retry-After": str(self.registry.setting.RETRY_AFTER_SEC)},
+            content={
+                "error_code": "Service Unavailable",
+                "message": SERVER_BUSY_MESSAGE,
+                "context": limiter.name
+            }
+        )
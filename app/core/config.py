@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 import os
 
@@ -23,6 +25,25 @@ class RabbitMQSetting(BaseSetting):
     RABBITMQ_PUBLISH_QUEUE: str = os.getenv('RABBITMQ_PUBLISH_QUEUE')
     RABBITMQ_CONSUME_QUEUE: str = os.getenv('RABBITMQ_CONSUME_QUEUE')
 
+    # 발행용 channel pool 크기 (publisher confirms 사용)
+    PUBLISH_CHANNEL_POOL_SIZE: int = 10
+
+    # queue 의 message / consumer 수 snapshot 갱신 주기, 이보다 오래된 snapshot 은 조회 시 직접 갱신한다.
+    QUEUE_INFO_REFRESH_INTERVAL_SEC: int = 2
+    QUEUE_INFO_MAX_AGE_SEC: int = 10
+
+    # 생성 결과 consume - 전용 worker thread 수와 prefetch (prefetch 는 worker 수 이상으로 둔다.)
+    CONSUMER_WORKER_COUNT: int = int(os.getenv('MQ_CONSUMER_WORKER_COUNT', 8))
+    CONSUMER_PREFETCH_COUNT: int = int(os.getenv('MQ_CONSUMER_PREFETCH_COUNT', 16))
+    # 종료 시 consume 을 멈춘 뒤 처리 중인 메시지의 처리 / ack 를 기다리는 최대 시간
+    CONSUMER_DRAIN_TIMEOUT_SEC: float = 30.0
+
+class WorkerSetting(BaseModel):
+    # false 면 웹 process 에서 MQ consume / retry / 알림 전송 태스크를 띄우지 않는다. (python -m app.worker 가 담당)
+    RUN_BACKGROUND_TASKS: bool = os.getenv('RUN_BACKGROUND_TASKS', 'true').lower() == 'true'
+    # worker process 의 기본 thread pool 크기 (asyncio.to_thread 로 도는 retry / 알림 전송 / 썸네일 조회)
+    THREAD_POOL_SIZE: int = int(os.getenv('WORKER_THREAD_POOL_SIZE', 32))
+
 class RedisSetting(BaseSetting):
     REDIS_HOST: str = os.getenv("REDIS_HOST")
     REDIS_PORT: str = os.getenv("REDIS_PORT")
@@ -35,8 +56,19 @@ class AWSS3Setting(BaseSetting):
 
     GENERATED_IMAGE_S3KEY_PREFIX: str = "generated_image/"
     GENERATED_IMAGE_GROUP_S3KEY_PREFIX: str = "generated_image_group_thumbnail/"
+    GENERATED_IMAGE_DERIVATIVE_S3KEY_PREFIX: str = "generated_image_derivative/"
 
     PRESIGNED_URL_EXPIRATION_SEC: int = 3600;
+    # application 전역에서 공유하는 boto3 client 의 connection pool 크기
+    MAX_POOL_CONNECTIONS: int = 50
+    # 썸네일 등에서 여러 object 를 동시에 읽을 때의 최대 병렬 수
+    OBJECT_FETCH_CONCURRENCY: int = 8
+    # 최근 읽은 생성 이미지를 보관할 로컬 디스크 캐시 (경로를 지정한 경우에만 사용)
+    OBJECT_DISK_CACHE_DIR: Optional[str] = os.getenv("S3_OBJECT_DISK_CACHE_DIR")
+    OBJECT_DISK_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    # presigned url 재사용 캐시 - 만료 REUSE_MARGIN_SEC 전까지 같은 url 을 돌려준다.
+    PRESIGNED_URL_CACHE_MAX_ENTRIES: int = 20000
+    PRESIGNED_URL_REUSE_MARGIN_SEC: int = 600
 
 class JwtSetting(BaseModel):
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY")
@@ -77,6 +109,19 @@ class ImageGenerationSetting(BaseModel):
     MESSAGE_TTL_MULTIPLIER: float = 1.0
     RETRY_MESSAGE_TTL_MULTIPLIER: float = 2.0
     MAX_RETRIES: int = 1
+    # 만료 job 스캔 - batch 마다 별도 트랜잭션으로 commit 한다.
+    RETRY_SCAN_BATCH_SIZE: int = 100
+
+class RetrySchedulerSetting(BaseModel):
+    # 만료 job retry - Redis 만료 타이머로 만료 시점에 깨어나고, DB 스캔은 타이머 누락에 대비한 안전망이다.
+    SAFETY_NET_INTERVAL_SEC: int = 300
+    # 다른 replica 가 더 이른 만료 시각을 예약했을 수 있으므로 이보다 오래 잠들지 않는다. (Redis 만 조회)
+    MAX_WAIT_SEC: float = 5.0
+    POP_BATCH_SIZE: int = 1000
+    # retry 가 실패하면 꺼낸 job 을 이 시간 뒤로 다시 예약한다.
+    FAILURE_BACKOFF_SEC: int = 30
+    # replica 중 leader 하나만 retry 를 실행한다. leader 가 죽으면 이 시간 뒤에 다른 replica 가 이어받는다.
+    LEADER_LEASE_TTL_SEC: int = 30
 
 class UserSetting(BaseModel):
     MONTHLY_RECHARGED_TOKEN: int = 15
@@ -92,13 +137,115 @@ class FCMSetting(BaseModel):
     FAILURE_TITLE: str = "AI 모델 이미지 생성에 실패했어요"
     FAILURE_BODY: str = "토큰은 반환되었으니, 잠시 후에 다시 시도해주세요"
 
+class MQOutboxSetting(BaseModel):
+    # 추론 요청 MQ outbox relay - 한 번에 잠그고 발행하는 최대 메시지 수
+    BATCH_SIZE: int = 200
+    # 요청 commit 시 relay 를 바로 깨우므로, polling 은 다른 replica 에서 기록된 메시지를 위한 것이다.
+    POLL_INTERVAL_SEC: int = 1
+
+class NotificationOutboxSetting(BaseModel):
+    # 알림 outbox sender - 한 번에 가져와 send_each 로 보내는 최대 row 수 (FCM 배치 한도 500)
+    BATCH_SIZE: int = 500
+    POLL_INTERVAL_SEC: int = 1
+    # 전송 실패 시 지수 backoff 로 재시도하고, MAX_ATTEMPTS 를 넘기면 FAILED 로 남긴다.
+    MAX_ATTEMPTS: int = 5
+    RETRY_BASE_DELAY_SEC: int = 5
+    RETRY_MAX_DELAY_SEC: int = 300
+
+class ImageProcessingSetting(BaseModel):
+    # Pillow 작업용 process pool 크기
+    WORKER_COUNT: int = int(os.getenv('IMAGE_PROCESSING_WORKER_COUNT', 2))
+
+class ThumbnailSetting(BaseModel):
+    # 이미지 그룹 썸네일 생성 파이프라인
+    WORKER_COUNT: int = int(os.getenv('THUMBNAIL_WORKER_COUNT', 2))
+    QUEUE_SIZE: int = 100
+    # 생성 후 이 시간이 지나도 PENDING 인 썸네일은 recovery task 가 다시 처리한다.
+    RECOVERY_INTERVAL_SEC: int = 300
+    RECOVERY_PENDING_AFTER_SEC: int = 600
+    # 그룹 하나를 가져간 worker 가 이 시간 안에 끝내지 못하면 (process 종료 등) 다른 worker 가 다시 가져갈 수 있다.
+    CLAIM_LEASE_SEC: int = 600
+    # 일시적인 실패 (S3 오류 등) 는 PENDING 으로 되돌려 recovery 가 다시 처리하고, 이 횟수만큼 실패하면 FAILED 로 둔다.
+    MAX_ATTEMPTS: int = 3
+
+    # 썸네일 인코딩 - AVIF 를 지원하지 않는 Pillow 빌드에서는 WEBP 로 저장된다.
+    OUTPUT_FORMAT: str = os.getenv('THUMBNAIL_OUTPUT_FORMAT', 'AVIF')
+    QUALITY: int = 80
+    MIN_QUALITY: int = 40
+    # 이 크기를 넘지 않는 가장 높은 quality 로 저장
+    TARGET_BYTES: int = 120 * 1024
+
+class ImageDerivativeSetting(BaseModel):
+    # 생성 이미지 축소본 (그리드 / 상세 화면용). 원본(FULL)은 그대로 두고 SMALL / MEDIUM 만 만든다.
+    SMALL_MAX_WIDTH: int = 256
+    MEDIUM_MAX_WIDTH: int = 768
+    OUTPUT_FORMAT: str = os.getenv('IMAGE_DERIVATIVE_OUTPUT_FORMAT', 'AVIF')
+    QUALITY: int = 80
+
+class GenerationStatusCacheSetting(BaseModel):
+    # 생성 요청 상태 조회용 Redis read model
+    TTL_SEC: int = 24 * 60 * 60
+
+class GenerationEventSetting(BaseModel):
+    # 생성 진행 상황 SSE 스트림 (Redis pub/sub fan-out)
+    HEARTBEAT_SEC: float = 15.0
+    # 이 시간이 지나면 스트림을 닫는다. (client 는 다시 연결)
+    STREAM_TIMEOUT_SEC: float = 600.0
+    SUBSCRIBER_QUEUE_SIZE: int = 16
+    RECONNECT_DELAY_SEC: float = 1.0
+
+class CatalogCacheSetting(BaseModel):
+    # hair model option catalog 2단 캐시 (process local LRU + Redis)
+    LOCAL_MAX_ENTRIES: int = 512
+    # local 에 들고 있는 catalog version 을 Redis 에서 다시 확인하는 주기
+    LOCAL_VERSION_TTL_SEC: float = 5.0
+    REDIS_TTL_SEC: int = 24 * 60 * 60
+
+class ConcurrencyLimitSetting(BaseModel):
+    # route group 별 AIMD 동시성 제한 설정
+    ROUTE_GROUP_LIMITS: dict = {
+        "generation": {"initial_limit": 10, "min_limit": 2, "max_limit": 40, "latency_threshold_sec": 3.0},
+        "image": {"initial_limit": 20, "min_limit": 4, "max_limit": 80, "latency_threshold_sec": 1.5},
+        "auth": {"initial_limit": 10, "min_limit": 2, "max_limit": 40, "latency_threshold_sec": 3.0},
+        "options": {"initial_limit": 30, "min_limit": 5, "max_limit": 100, "latency_threshold_sec": 0.5},
+        "default": {"initial_limit": 15, "min_limit": 3, "max_limit": 60, "latency_threshold_sec": 2.0},
+    }
+    # suffix 매칭이 prefix 매칭보다 먼저 적용된다. (/prod/generation/*-options 는 options group)
+    ROUTE_GROUP_SUFFIXES: dict = {
+        "-options": "options",
+    }
+    ROUTE_GROUP_PREFIXES: dict = {
+        "/api/v1/prod/generation": "generation",
+        "/api/v1/prod/image": "image",
+        "/api/v1/prod/user/auth": "auth",
+    }
+    EXEMPT_PATHS: list = ["/health", "/metrics"]
+    # 스트리밍 응답은 연결 시간이 latency 로 잡히므로 제한 대상에서 뺀다.
+    EXEMPT_SUFFIXES: list = ["/events"]
+
+    MAX_QUEUE_SIZE: int = 50
+    QUEUE_TIMEOUT_SEC: float = 2.0
+    BACKOFF_RATIO: float = 0.9
+    RETRY_AFTER_SEC: int = 1
+
 
 base_settings = BaseSetting()
 rabbit_mq_setting = RabbitMQSetting()
+worker_setting = WorkerSetting()
+mq_outbox_setting = MQOutboxSetting()
 redis_setting = RedisSetting()
 aws_s3_setting = AWSS3Setting()
 jwt_setting = JwtSetting()
 oauth_setting = OAuthSetting()
 image_generation_setting = ImageGenerationSetting()
+retry_scheduler_setting = RetrySchedulerSetting()
 user_setting = UserSetting()
 fcm_setting = FCMSetting()
+notification_outbox_setting = NotificationOutboxSetting()
+image_processing_setting = ImageProcessingSetting()
+thumbnail_setting = ThumbnailSetting()
+image_derivative_setting = ImageDerivativeSetting()
+generation_status_cache_setting = GenerationStatusCacheSetting()
+generation_event_setting = GenerationEventSetting()
+catalog_cache_setting = CatalogCacheSetting()
+concurrency_limit_setting = ConcurrencyLimitSetting()
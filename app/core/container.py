@@ -1,7 +1,7 @@
 from typing import Dict, Type, Any, Callable
 from sqlalchemy.orm import Session
 
-from app.infrastructure.s3.s3_client import S3Client
+from app.infrastructure.s3.s3_client import S3Client, get_s3_client
 from app.infrastructure.fcm.fcm_service import FCMService
 
 class DependencyContainer:
@@ -24,7 +24,7 @@ class DependencyContainer:
    @property
    def s3_client(self) -> S3Client:
        if S3Client not in self._service_instances:
-           self._service_instances[S3Client] = S3Client()
+           self._service_instances[S3Client] = get_s3_client()
        return self._service_instances[S3Client]
 
    @property
@@ -1,5 +1,9 @@
+from typing import AsyncGenerator
+
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url, URL
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 
 from app.core.config import base_settings
@@ -21,3 +25,34 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def _to_async_database_url(database_url: str) -> tuple[URL, dict]:
+    """
+    sync(psycopg2) DATABASE_URL 을 asyncpg 용 URL 로 변환
+    asyncpg 는 sslmode 쿼리 파라미터를 받지 않으므로 connect_args 의 ssl 로 옮긴다.
+    """
+    url = make_url(database_url).set(drivername="postgresql+asyncpg")
+    connect_args = {}
+    if "sslmode" in url.query:
+        connect_args["ssl"] = url.query["sslmode"]
+        url = url.difference_update_query(["sslmode"])
+    return url, connect_args
+
+_async_database_url, _async_connect_args = _to_async_database_url(base_settings.DATABASE_URL)
+
+async_engine = create_async_engine(
+    _async_database_url,
+    connect_args=_async_connect_args,
+    pool_size=20,
+    max_overflow=20,
+    pool_timeout=60,
+    pool_pre_ping=True
+)
+
+# commit 후 객체를 다시 읽으려 하면 async 에서는 암묵적 IO 가 불가능하므로 expire 하지 않는다.
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
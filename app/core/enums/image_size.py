@@ -0,0 +1,6 @@
+from enum import Enum
+
+class ImageSizeEnum(Enum):
+    SMALL = "SMALL"
+    MEDIUM = "MEDIUM"
+    FULL = "FULL"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+class NotificationStatusEnum(Enum):
+    PENDING = "PENDING"
+    SENT = "SENT"
+    FAILED = "FAILED"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+class ThumbnailStatusEnum(Enum):
+    PENDING = "PENDING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
@@ -3,3 +3,4 @@ USER_HAS_NOT_ENOUGH_TOKEN_MESSAGE: str = "토큰이 충분하지 않아\n이미
 CONCURRENT_GENERATION_REQUEST_MESSAGE: str = "현재 요청하신 이미지가 생성 중입니다.\n생성이 완료된 후 다시 요청해주세요."
 
 INTERNAL_SERVER_ERROR_MESSAGE: str = "서버 에러가 발생했습니다.\n잠시 후에 다시 시도해주세요."
+SERVER_BUSY_MESSAGE: str = "현재 요청이 많아 처리가 지연되고 있습니다.\n잠시 후에 다시 시도해주세요."
@@ -0,0 +1,210 @@
+import math
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image
+
+_FORMAT_FALLBACKS = {
+    'AVIF': ['AVIF', 'WEBP', 'JPEG'],
+    'WEBP': ['WEBP', 'JPEG'],
+}
+
+# 한 장씩 순서대로 디코딩 -> 목표 크기로 축소 -> 캔버스에 붙이기 -> 해제 하므로
+# 메모리에는 캔버스(목표 크기)와 디코딩 중인 이미지 한 장만 존재한다.
+
+
+def _open_tiles(image_bytes_list: List[bytes]) -> List[Image.Image]:
+    # Image.open 은 헤더만 읽는다. (픽셀 디코딩은 load 시점)
+    return [Image.open(BytesIO(image_bytes)) for image_bytes in image_bytes_list]
+
+
+def _calculate_tile_sizes(
+        source_sizes: List[Tuple[int, int]],
+        target_width: Optional[int],
+        target_height: Optional[int],
+        scale_factor: float,
+) -> List[Tuple[int, int]]:
+    """
+    모든 타일을 같은 높이로 맞추고 (해상도가 서로 달라도 비율 유지), 폭 제한이 있으면 전체를 한 번 더 줄인다.
+    """
+    tile_height = target_height or max(1, int(source_sizes[0][1] * scale_factor))
+    tile_widths = [max(1, round(width * tile_height / height)) for width, height in source_sizes]
+
+    if target_width is not None and sum(tile_widths) > target_width:
+        shrink = target_width / sum(tile_widths)
+        tile_height = max(1, int(tile_height * shrink))
+        tile_widths = [max(1, round(width * tile_height / height)) for width, height in source_sizes]
+
+    return [(tile_width, tile_height) for tile_width in tile_widths]
+
+
+def _load_tile(img: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    # JPEG 은 디코딩 단계에서 1/2, 1/4, 1/8 로 줄여서 읽는다.
+    if img.format == 'JPEG':
+        img.draft('RGB', size)
+
+    # 그 외 포맷은 정수 배율 box reduce 로 먼저 크게 줄인 뒤 LANCZOS 로 정확한 크기를 맞춘다.
+    reduce_factor = math.floor(min(img.width / size[0], img.height / size[1]) / 2)
+    if reduce_factor >= 2:
+        img = img.reduce(reduce_factor)
+
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    if img.size != size:
+        img = img.resize(size, Image.Resampling.LANCZOS)
+    return img
+
+
+def resolve_output_format(preferred_format: str) -> str:
+    """
+    Pillow 빌드가 저장을 지원하는 포맷으로 바꾼다. (AVIF -> WEBP -> JPEG 순으로 fallback)
+    """
+    Image.init()
+    for image_format in _FORMAT_FALLBACKS.get(preferred_format.upper(), [preferred_format.upper()]):
+        if image_format in Image.SAVE:
+            return image_format
+    return 'JPEG'
+
+
+def _save(img: Image.Image, image_format: str, quality: int) -> bytes:
+    output_buffer = BytesIO()
+    if image_format == 'PNG':
+        img.save(output_buffer, format='PNG', optimize=True)
+    elif image_format == 'WEBP':
+        img.save(output_buffer, format='WEBP', quality=quality, method=4)
+    elif image_format == 'AVIF':
+        img.save(output_buffer, format='AVIF', quality=quality)
+    else:
+        img.save(output_buffer, format='JPEG', quality=quality, optimize=True)
+    return output_buffer.getvalue()
+
+
+def encode_image(
+        img: Image.Image,
+        image_format: str,
+        quality: int,
+        target_bytes: Optional[int] = None,
+        min_quality: int = 30,
+) -> bytes:
+    """
+    target_bytes 가 있으면 [min_quality, quality] 구간에서 크기 제한을 넘지 않는 가장 높은 quality 를 이진 탐색한다.
+    min_quality 로도 넘는 경우 min_quality 결과를 반환한다. (PNG 는 quality 가 없으므로 그대로 저장)
+    """
+    if target_bytes is None or image_format == 'PNG':
+        return _save(img, image_format, quality)
+
+    encoded = _save(img, image_format, quality)
+    if len(encoded) <= target_bytes:
+        return encoded
+
+    best = None
+    low, high = min_quality, quality - 1
+    while low <= high:
+        mid = (low + high) // 2
+        candidate = _save(img, image_format, mid)
+        if len(candidate) <= target_bytes:
+            best = candidate
+            low = mid + 1
+        else:
+            high = mid - 1
+    return best if best is not None else _save(img, image_format, min_quality)
+
+
+def create_stitched_thumbnail(
+        image_bytes_list: List[bytes],
+        target_width: Optional[int] = None,
+        target_height: Optional[int] = None,
+        scale_factor: float = 0.5,
+        quality: int = 85,
+        output_format: Optional[str] = None,
+        target_bytes: Optional[int] = None,
+        min_quality: int = 30,
+) -> Optional[Tuple[bytes, str]]:
+    """
+    이미지들을 가로로 이어 붙인 썸네일을 한 번의 디코딩 / 인코딩으로 만든다.
+
+    Args:
+        image_bytes_list (List[bytes]): 원본 이미지 바이트 데이터 리스트
+        target_width (Optional[int]): 결과 이미지 최대 폭
+        target_height (Optional[int]): 결과 이미지 높이 (없으면 첫 이미지 높이 * scale_factor)
+        scale_factor (float): target_height 가 없을 때의 축소 비율
+        quality (int): 압축 품질 (1-100, 기본값 85), target_bytes 가 있으면 탐색 상한
+        output_format (Optional[str]): 'AVIF' / 'WEBP' / 'JPEG' / 'PNG', 지원하지 않으면 fallback (없으면 원본 기준 PNG / JPEG)
+        target_bytes (Optional[int]): 결과 크기 상한 - quality 를 이진 탐색한다.
+        min_quality (int): target_bytes 탐색 하한
+
+    Returns:
+        Tuple[bytes, str]: (썸네일 이미지의 바이트 데이터, 이미지 형식)
+    """
+    if not image_bytes_list:
+        return None
+
+    images = _open_tiles(image_bytes_list)
+    if output_format is None:
+        # 원본이 PNG 면 PNG 로, 그 외에는 JPEG 으로 저장한다.
+        output_format = 'PNG' if images[0].format == 'PNG' else 'JPEG'
+    else:
+        output_format = resolve_output_format(output_format)
+
+    tile_sizes = _calculate_tile_sizes(
+        source_sizes=[img.size for img in images],
+        target_width=target_width,
+        target_height=target_height,
+        scale_factor=scale_factor,
+    )
+
+    canvas = Image.new('RGB', (sum(width for width, _ in tile_sizes), tile_sizes[0][1]))
+    offset_x = 0
+    for img, size in zip(images, tile_sizes):
+        tile = _load_tile(img, size)
+        canvas.paste(tile, (offset_x, 0))
+        offset_x += size[0]
+        tile.close()
+        img.close()
+
+    encoded = encode_image(canvas, output_format, quality, target_bytes=target_bytes, min_quality=min_quality)
+    canvas.close()
+
+    return encoded, output_format
+
+
+def _fit_width(size: Tuple[int, int], max_width: int) -> Tuple[int, int]:
+    # 원본보다 크게 만들지는 않는다.
+    width, height = size
+    if width <= max_width:
+        return width, height
+    return max_width, max(1, round(height * max_width / width))
+
+
+def create_resized_derivatives(
+        image_bytes: bytes,
+        max_widths: Dict[str, int],
+        output_format: str,
+        quality: int = 80,
+) -> Dict[str, Tuple[bytes, str]]:
+    """
+    원본 한 장으로 폭 제한이 다른 축소본들을 만든다.
+    원본은 한 번만 디코딩하고, 큰 축소본부터 만든 뒤 작은 축소본은 바로 앞 축소본에서 다시 줄인다.
+
+    Args:
+        image_bytes (bytes): 원본 이미지 바이트 데이터
+        max_widths (Dict[str, int]): 축소본 이름 -> 최대 폭
+        output_format (str): 'AVIF' / 'WEBP' / 'JPEG' / 'PNG', 지원하지 않으면 fallback
+        quality (int): 압축 품질
+
+    Returns:
+        Dict[str, Tuple[bytes, str]]: 축소본 이름 -> (이미지 바이트 데이터, 이미지 형식)
+    """
+    output_format = resolve_output_format(output_format)
+    derivatives: Dict[str, Tuple[bytes, str]] = {}
+
+    source = Image.open(BytesIO(image_bytes))
+    for name, max_width in sorted(max_widths.items(), key=lambda item: item[1], reverse=True):
+        resized = _load_tile(source, _fit_width(source.size, max_width))
+        derivatives[name] = (encode_image(resized, output_format, quality), output_format)
+        if resized is not source:
+            source.close()
+        source = resized
+    source.close()
+
+    return derivatives
@@ -1,66 +1,160 @@
 import asyncio
 import logging
-from typing import Optional
+from typing import List, Optional
 
+from app.core.config import rabbit_mq_setting
+from app.infrastructure.cache.generation_event_broker import get_generation_event_broker
+from app.infrastructure.mq.ordered_dispatcher import OrderedMessageDispatcher
 from app.infrastructure.mq.rabbit_mq_service import RabbitMQService
+from app.infrastructure.image.image_processing_service import get_image_processing_service
+from app.infrastructure.s3.s3_client import get_s3_client
+from app.infrastructure.task.mq_outbox import MQOutboxRelayTaskManager
+from app.infrastructure.task.notification import NotificationOutboxSenderTaskManager
+from app.infrastructure.task.queue_info import QueueInfoPollerTaskManager
 from app.infrastructure.task.retry import RetryTaskManager
-from app.application.services.generation.handle import handle_message
+from app.infrastructure.task.thumbnail import ThumbnailPipeline, ThumbnailRecoveryTaskManager
+from app.application.services.generation.handle import handle_message, resolve_generation_request_id
 
 logger = logging.getLogger(__name__)
 
 
 class LifespanServices:
-   def __init__(self):
+   """
+   process 단위 서비스와 background 태스크.
+   - api 서비스 : SSE 이벤트 구독, 대기열 snapshot polling, 생성 요청 MQ outbox relay (웹 process)
+   - background 태스크 : 생성 결과 consume / 썸네일, 만료 job retry, 알림 outbox 전송 (python -m app.worker)
+   웹 process 에서 RUN_BACKGROUND_TASKS=false 로 두면 background 태스크는 worker process 에서만 돈다.
+   """
+   def __init__(self, run_api_services: bool = True, run_background_tasks: bool = True):
+       self.run_api_services = run_api_services
+       self.run_background_tasks = run_background_tasks
        self.mq_service: Optional[RabbitMQService] = None
+       self.message_dispatcher: Optional[OrderedMessageDispatcher] = None
+       self.mq_outbox_relay: Optional[MQOutboxRelayTaskManager] = None
+       self.mq_outbox_relay_task: Optional[asyncio.Task] = None
+       self.retry_manager: Optional[RetryTaskManager] = None
        self.retry_task: Optional[asyncio.Task] = None
        self.consume_task: Optional[asyncio.Task] = None
+       self.queue_info_task: Optional[asyncio.Task] = None
+       self.thumbnail_pipeline: Optional[ThumbnailPipeline] = None
+       self.thumbnail_recovery_task: Optional[asyncio.Task] = None
+       self.notification_sender_task: Optional[asyncio.Task] = None
 
    async def initialize(self):
        """서비스들 초기화"""
 
+       # S3 client 생성 및 warm-up (botocore 모델 로딩, 첫 연결)
+       await asyncio.to_thread(get_s3_client().warm_up)
+
        # RabbitMQ 서비스 초기화
        self.mq_service = RabbitMQService()
        await self.mq_service.connect()
 
-       # 태스크 시작
-       retry_manager = RetryTaskManager(
+       if self.run_api_services:
+           self._initialize_api_services()
+       if self.run_background_tasks:
+           self._initialize_background_tasks()
+
+   def _initialize_api_services(self):
+       # 생성 진행 상황 이벤트 구독 (SSE fan-out)
+       get_generation_event_broker().start()
+
+       # 생성 요청 MQ outbox relay - 요청 트랜잭션에서 기록된 메시지를 commit 이후 배치 발행
+       self.mq_outbox_relay = MQOutboxRelayTaskManager(
+           rabbit_mq_service=self.mq_service,
+       )
+
+       # 생성 요청의 대기 시간 추정용 대기열 snapshot
+       queue_info_manager = QueueInfoPollerTaskManager(
            rabbit_mq_service=self.mq_service,
-           check_interval=60
+       )
+
+       self.mq_outbox_relay_task = asyncio.create_task(self.mq_outbox_relay.start())
+       self.queue_info_task = asyncio.create_task(queue_info_manager.start())
+
+   def _initialize_background_tasks(self):
+       # 만료 job retry - replica 중 leader lease 를 가진 하나만 실행
+       self.retry_manager = RetryTaskManager(
+           rabbit_mq_service=self.mq_service,
+       )
+
+       # 썸네일 생성 단계 - 그룹 생성 트랜잭션이 끝난 뒤 별도 worker 에서 처리
+       self.thumbnail_pipeline = ThumbnailPipeline()
+       self.thumbnail_pipeline.start()
+
+       # 생성 결과 메시지 - generation request 단위로 순서를 보장하며 전용 thread pool 에서 처리
+       self.message_dispatcher = OrderedMessageDispatcher(
+           handler=handle_message,
+           key_resolver=resolve_generation_request_id,
+           worker_count=rabbit_mq_setting.CONSUMER_WORKER_COUNT,
+           result_callback=self.thumbnail_pipeline.submit,
        )
 
        consume_manager = ConsumeTaskManager(
            rabbit_mq_service=self.mq_service,
+           message_dispatcher=self.message_dispatcher,
        )
 
+       thumbnail_recovery_manager = ThumbnailRecoveryTaskManager(
+           thumbnail_pipeline=self.thumbnail_pipeline,
+       )
+
+       # 알림 outbox 전송 (트랜잭션 안에서 기록된 FCM 알림을 commit 이후 배치 전송)
+       notification_sender_manager = NotificationOutboxSenderTaskManager()
+
        # 코루틴 태스크 시작
-       self.retry_task = asyncio.create_task(retry_manager.start())
+       self.retry_task = asyncio.create_task(self.retry_manager.start())
        self.consume_task = asyncio.create_task(consume_manager.start())
+       self.thumbnail_recovery_task = asyncio.create_task(thumbnail_recovery_manager.start())
+       self.notification_sender_task = asyncio.create_task(notification_sender_manager.start())
 
 
    async def cleanup(self):
-       """모든 리소스 정리"""
-       # 실행 중인 태스크들 정리
-       tasks_to_cancel = [t for t in [self.retry_task, self.consume_task] if t]
+       """
+       모든 리소스 정리
+       consume 을 먼저 멈추고 처리 중인 메시지를 끝까지 처리 / ack 한 뒤 (dispatcher drain),
+       그 결과를 받는 썸네일 파이프라인을 멈추고, RabbitMQ 연결은 마지막에 닫는다.
+       """
+       # 1. 새 결과 메시지 수신 중단 및 처리 중인 메시지 drain
+       await self._cancel_tasks([self.consume_task])
+       if self.mq_service and self.run_background_tasks:
+           await self.mq_service.stop_consuming()
+
+       # 2. 나머지 태스크 정리
+       await self._cancel_tasks([self.retry_task, self.mq_outbox_relay_task, self.queue_info_task, self.thumbnail_recovery_task, self.notification_sender_task])
+
+       # 3. 서비스 정리 - RabbitMQ 연결은 마지막에 닫는다.
+       if self.message_dispatcher:
+           self.message_dispatcher.shutdown()
+       if self.thumbnail_pipeline:
+           await self.thumbnail_pipeline.stop()
+       if self.retry_manager:
+           await self.retry_manager.release_leadership()
+       if self.run_background_tasks:
+           get_image_processing_service().shutdown()
+       if self.run_api_services:
+           await get_generation_event_broker().stop()
+       if self.mq_service:
+           await self.mq_service.close()
 
-       for task in tasks_to_cancel:
+   @staticmethod
+   async def _cancel_tasks(tasks: List[Optional[asyncio.Task]]):
+       for task in [t for t in tasks if t]:
            task.cancel()
            try:
                await task
            except asyncio.CancelledError:
                pass
 
-       # 서비스 정리
-       if self.mq_service:
-           await self.mq_service.close()
-
 
 class ConsumeTaskManager:
-   def __init__(self, rabbit_mq_service: RabbitMQService):
+   def __init__(self, rabbit_mq_service: RabbitMQService, message_dispatcher: OrderedMessageDispatcher):
        self.rabbit_mq_service = rabbit_mq_service
+       self.message_dispatcher = message_dispatcher
 
    async def start(self):
        try:
-           await self.rabbit_mq_service.consume(handle_message)
+           await self.rabbit_mq_service.consume(self.message_dispatcher)
            while True:
                await asyncio.sleep(3600)
        except Exception as e:
@@ -4,4 +4,6 @@ from app.domain.hair_model.models.hair import *
 from app.domain.hair_model.models.scene import *
 from app.domain.hair_model.models.model_thumbnail import *
 from app.domain.user.models.user import *
-from app.domain.versioning.models.app_version import *
\ No newline at end of file
+from app.domain.versioning.models.app_version import *
+from app.domain.notification.models.notification_outbox import *
+from app.domain.generation.models.mq_outbox import *
\ No newline at end of file
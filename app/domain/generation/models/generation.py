@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, Float, Enum, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, Float, Enum, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 
 from app.core.enums.generation_status import GenerationStatusEnum, GenerationResultEnum
@@ -33,3 +33,12 @@ class ImageGenerationJob(TimeStampModel):
     height = Column(Integer, nullable=False)
 
     generation_request_id = Column(Integer, ForeignKey("generation_request.id"), index=True)
+
+    # retry 스캔은 처리 중인 job 의 만료 시각만 본다. (완료 / 실패 job 은 인덱스에 들어가지 않는다.)
+    __table_args__ = (
+        Index(
+            'idx_image_generation_job_active_expires_at',
+            'expires_at',
+            postgresql_where=text("status IN ('PENDING', 'PROCESSING')")
+        ),
+    )
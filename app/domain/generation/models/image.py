@@ -1,10 +1,15 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, Boolean
+from sqlalchemy import Column, String, Integer, ForeignKey, Boolean, Enum, Index, text, DateTime
+
+from app.core.enums.thumbnail_status import ThumbnailStatusEnum
 
 from app.core.db.time_stamp_model import TimeStampModel
 
 class GeneratedImage(TimeStampModel):
     __tablename__ = "generated_image"
     s3_key = Column(String(1024), nullable=False)
+    # 축소본 s3 key - 만들어지기 전이나 실패한 경우 NULL 이며, 이때는 원본(s3_key)을 사용한다.
+    small_s3_key = Column(String(1024), nullable=True)
+    medium_s3_key = Column(String(1024), nullable=True)
     webui_png_info = Column(String(2048), nullable=False)
     deleted = Column(Boolean, default=False, nullable=False)
 
@@ -18,11 +23,30 @@ class GeneratedImageGroup(TimeStampModel):
     title = Column(String(100), nullable=False)
     rating = Column(Integer, default=0, nullable=False)
     thumbnail_image_s3_key = Column(String(2048), nullable=False)
+    # PENDING 동안 thumbnail_image_s3_key 는 첫 번째 생성 이미지를 가리킨다.
+    thumbnail_status = Column(Enum(ThumbnailStatusEnum), default=ThumbnailStatusEnum.COMPLETED, nullable=False)
+    # 썸네일 이미지 포맷 (WEBP, AVIF ...), PENDING 이거나 이전에 만들어진 그룹은 NULL
+    thumbnail_image_format = Column(String(16), nullable=True)
+    # 썸네일 작업을 가져간 시각 - 여러 worker 가 같은 그룹을 동시에 처리하지 않도록 하는 lease
+    thumbnail_claimed_at = Column(DateTime(timezone=True), nullable=True)
+    # 썸네일 생성 실패 횟수 - MAX_ATTEMPTS 에 도달하면 FAILED 로 두고 더 이상 recovery 하지 않는다.
+    thumbnail_attempt_count = Column(Integer, default=0, server_default='0', nullable=False)
     deleted = Column(Boolean, default=False, nullable=False)
 
     user_id = Column(Integer, ForeignKey("user.id"), index=True)
     generation_request_id = Column(Integer, ForeignKey("generation_request.id"), index=True)
 
+    # 사용자별 그룹 목록 keyset pagination (created_at DESC, id DESC) 용
+    __table_args__ = (
+        Index(
+            'idx_generated_image_group_user_created_at_id',
+            'user_id',
+            'created_at',
+            'id',
+            postgresql_where=text('deleted = false')
+        ),
+    )
+
 
 class ExampleGeneratedImage(TimeStampModel):
     __tablename__ = "example_generated_image"
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, JSON
+
+from app.core.db.time_stamp_model import TimeStampModel
+
+class MQOutbox(TimeStampModel):
+    """
+    추론 요청 MQ 발행 outbox.
+    image_generation_job 과 같은 트랜잭션에서 기록하고, relay task 가 commit 이후 배치로 발행한 뒤 삭제한다.
+    (테이블에는 아직 발행되지 않은 메시지만 남는다.)
+    """
+    __tablename__ = "mq_outbox"
+    # MQPublishMessage
+    payload = Column(JSON, nullable=False)
+    priority = Column(Integer, nullable=False)
+    # 메시지 만료 시각 - 발행 시점에 남은 시간을 expiration 으로 사용한다.
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+    image_generation_job_id = Column(Integer, ForeignKey("image_generation_job.id"))
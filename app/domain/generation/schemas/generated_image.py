@@ -11,6 +11,8 @@ class GeneratedImageCreate(BaseModel):
 class GeneratedImageUpdate(BaseModel):
     user_id: Optional[int]
     s3_key: Optional[int]
+    small_s3_key: Optional[str] = None
+    medium_s3_key: Optional[str] = None
     webui_png_info: Optional[int]
     generated_image_group_id: Optional[int]
     image_generation_job_id: Optional[int]
@@ -19,6 +21,8 @@ class GeneratedImageInDB(BaseModel):
     id: int
     user_id: int
     s3_key: str
+    small_s3_key: Optional[str] = None
+    medium_s3_key: Optional[str] = None
     webui_png_info: str
     generated_image_group_id: int
     image_generation_job_id: int
@@ -2,10 +2,13 @@ from typing import Optional
 from pydantic import BaseModel
 from datetime import datetime
 
+from app.core.enums.thumbnail_status import ThumbnailStatusEnum
+
 class GeneratedImageGroupCreate(BaseModel):
     user_id: int
     generation_request_id: int
     thumbnail_image_s3_key: str
+    thumbnail_status: ThumbnailStatusEnum = ThumbnailStatusEnum.COMPLETED
     rating: int = 0
     title: str
 
@@ -13,6 +16,10 @@ class GeneratedImageGroupUpdate(BaseModel):
     user_id: Optional[int] = None
     generation_request_id: Optional[int] = None
     thumbnail_image_s3_key: Optional[str] = None
+    thumbnail_status: Optional[ThumbnailStatusEnum] = None
+    thumbnail_image_format: Optional[str] = None
+    thumbnail_claimed_at: Optional[datetime] = None
+    thumbnail_attempt_count: Optional[int] = None
     rating: Optional[int] = None
     title: Optional[str] = None
 
@@ -21,6 +28,8 @@ class GeneratedImageGroupInDB(BaseModel):
     user_id: int
     generation_request_id: int
     thumbnail_image_s3_key: str
+    thumbnail_status: ThumbnailStatusEnum
+    thumbnail_image_format: Optional[str] = None
     rating: int
     title: str
     created_at: datetime
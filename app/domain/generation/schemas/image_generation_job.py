@@ -6,6 +6,7 @@ from app.core.enums.generation_status import GenerationStatusEnum
 
 
 class ImageGenerationJobCreate(BaseModel):
+    status: GenerationStatusEnum = GenerationStatusEnum.PENDING
     expires_at: datetime
     retry_count: int
 
@@ -0,0 +1,24 @@
+from typing import Any, Dict, Optional
+from pydantic import BaseModel
+from datetime import datetime
+
+
+class MQOutboxCreate(BaseModel):
+    payload: Dict[str, Any]
+    priority: int
+    expires_at: datetime
+    image_generation_job_id: int
+
+class MQOutboxUpdate(BaseModel):
+    priority: Optional[int] = None
+    expires_at: Optional[datetime] = None
+
+class MQOutboxInDB(BaseModel):
+    id: int
+    payload: Dict[str, Any]
+    priority: int
+    expires_at: datetime
+    image_generation_job_id: int
+
+    class Config:
+        from_attributes=True
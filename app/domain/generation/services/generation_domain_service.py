@@ -58,12 +58,17 @@ def are_all_image_generation_jobs_complete(image_generation_job_list: List[Image
     return True
 
 def calculate_remaining_generation_sec(image_generation_job_list: List[ImageGenerationJob]) -> int:
-    print("calculating remaining sec: ")
     # 가장 늦은 expires_at 찾기
-    latest_expire = max(job.expires_at for job in image_generation_job_list)
+    return calculate_remaining_sec_until(get_latest_expires_at(image_generation_job_list))
 
-    print(f"latest_expire: {latest_expire}")
-    print(f"current time : {datetime.now(UTC)}")
+def get_latest_expires_at(image_generation_job_list: List[ImageGenerationJob]) -> Optional[datetime]:
+    if not image_generation_job_list:
+        return None
+    return max(job.expires_at for job in image_generation_job_list)
+
+def calculate_remaining_sec_until(latest_expire: Optional[datetime]) -> int:
+    if latest_expire is None:
+        return 0
 
     # 현재 UTC 시간과의 차이 계산
     time_difference = latest_expire - datetime.now(UTC)
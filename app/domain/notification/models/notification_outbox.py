@@ -0,0 +1,34 @@
+from sqlalchemy import Column, String, Integer, DateTime, Enum, ForeignKey, JSON, Index, text
+
+from app.core.db.time_stamp_model import TimeStampModel
+from app.core.enums.notification_status import NotificationStatusEnum
+
+class NotificationOutbox(TimeStampModel):
+    """
+    푸시 알림 outbox.
+    알림을 보내야 하는 트랜잭션 안에서 row 를 쓰고, 실제 FCM 전송은 commit 이후 sender task 가 배치로 처리한다.
+    """
+    __tablename__ = "notification_outbox"
+    status = Column(Enum(NotificationStatusEnum), default=NotificationStatusEnum.PENDING, nullable=False)
+
+    token = Column(String(255), nullable=False)
+    title = Column(String(255), nullable=False)
+    body = Column(String(1024), nullable=False)
+    category = Column(String(100), nullable=True)
+    identifier = Column(String(100), nullable=True)
+    data = Column(JSON, nullable=True)
+
+    attempt_count = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False)
+    last_error = Column(String(1024), nullable=True)
+
+    user_id = Column(Integer, ForeignKey("user.id"), index=True)
+
+    # sender 는 PENDING 중 next_attempt_at 이 지난 row 만 읽는다.
+    __table_args__ = (
+        Index(
+            'idx_notification_outbox_pending_next_attempt_at',
+            'next_attempt_at',
+            postgresql_where=text("status = 'PENDING'")
+        ),
+    )
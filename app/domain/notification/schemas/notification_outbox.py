@@ -0,0 +1,41 @@
+from typing import Dict, Optional
+from pydantic import BaseModel
+from datetime import datetime
+
+from app.core.enums.notification_status import NotificationStatusEnum
+
+
+class NotificationOutboxCreate(BaseModel):
+    status: NotificationStatusEnum = NotificationStatusEnum.PENDING
+    token: str
+    title: str
+    body: str
+    category: Optional[str] = None
+    identifier: Optional[str] = None
+    data: Optional[Dict[str, str]] = None
+    attempt_count: int = 0
+    next_attempt_at: datetime
+    user_id: int
+
+class NotificationOutboxUpdate(BaseModel):
+    status: Optional[NotificationStatusEnum] = None
+    attempt_count: Optional[int] = None
+    next_attempt_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+
+class NotificationOutboxInDB(BaseModel):
+    id: int
+    status: NotificationStatusEnum
+    token: str
+    title: str
+    body: str
+    category: Optional[str]
+    identifier: Optional[str]
+    data: Optional[Dict[str, str]]
+    attempt_count: int
+    next_attempt_at: datetime
+    last_error: Optional[str]
+    user_id: int
+
+    class Config:
+        from_attributes=True
@@ -53,5 +53,5 @@ class AuthTokenService:
             logger.error("Invalid token error: %s", str(e))
             raise AccessUnauthorizedException("Invalid token.")
 
-def get_auth_token_service() -> AuthTokenService:
+async def get_auth_token_service() -> AuthTokenService:
     return AuthTokenService()
\ No newline at end of file
@@ -1,8 +1,10 @@
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 from app.core.config import redis_setting
 from typing import Optional
 
 _redis_client: Optional[Redis] = None
+_async_redis_client: Optional[AsyncRedis] = None
 
 def get_redis_client() -> Redis:
     """
@@ -19,3 +21,19 @@ def get_redis_client() -> Redis:
         )
 
     return _redis_client
+
+def get_async_redis_client() -> AsyncRedis:
+    """
+    이벤트 루프에서 사용하는 asyncio Redis 클라이언트의 싱글톤 인스턴스를 반환
+    :return:
+    """
+    global _async_redis_client
+
+    if _async_redis_client is None:
+        _async_redis_client = AsyncRedis(
+            host=redis_setting.REDIS_HOST,
+            port=redis_setting.REDIS_PORT,
+            decode_responses=True
+        )
+
+    return _async_redis_client
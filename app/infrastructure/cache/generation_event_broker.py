@@ -0,0 +1,103 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Set
+
+from redis.asyncio import Redis as AsyncRedis
+
+from app.core.config import generation_event_setting, GenerationEventSetting
+from app.infrastructure.auth.redis_client import get_async_redis_client
+from app.infrastructure.cache.generation_status_cache import GenerationStatusCache, GenerationStatusDocument
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationEventBroker:
+    """
+    생성 상태 이벤트 fan-out.
+    process 당 Redis pub/sub 연결 하나로 generation_status:events:* 를 psubscribe 하고,
+    받은 상태 문서를 해당 요청을 구독 중인 local queue 들에 나눠준다. (SSE 연결 수만큼 Redis 연결을 만들지 않는다.)
+    어느 replica 의 consumer 가 publish 해도 모든 replica 의 구독자에게 전달된다.
+    """
+    def __init__(self, async_redis: AsyncRedis, setting: GenerationEventSetting):
+        self._async_redis = async_redis
+        self._setting = setting
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = {}
+        self._listen_task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._listen_task is None or self._listen_task.done():
+            self._listen_task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            try:
+                await self._listen_task
+            except asyncio.CancelledError:
+                pass
+            self._listen_task = None
+
+    @asynccontextmanager
+    async def subscribe(self, generation_request_id: int) -> AsyncIterator["asyncio.Queue[GenerationStatusDocument]"]:
+        self.start()
+        queue: asyncio.Queue[GenerationStatusDocument] = asyncio.Queue(maxsize=self._setting.SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(generation_request_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(generation_request_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[generation_request_id]
+
+    def subscriber_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self._async_redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(f"{GenerationStatusCache.EVENT_CHANNEL_PREFIX}*")
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        self._dispatch(message["channel"], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[GenerationEventBroker] pub/sub connection lost, reconnecting: {e}")
+                await asyncio.sleep(self._setting.RECONNECT_DELAY_SEC)
+            finally:
+                await pubsub.aclose()
+
+    def _dispatch(self, channel: str, data: str) -> None:
+        try:
+            generation_request_id = int(channel[len(GenerationStatusCache.EVENT_CHANNEL_PREFIX):])
+        except ValueError:
+            return
+
+        queues = self._subscribers.get(generation_request_id)
+        if not queues:
+            return
+
+        status_document = GenerationStatusDocument.model_validate_json(data)
+        for queue in queues:
+            # 느린 구독자는 오래된 문서를 버린다. (최신 상태만 의미가 있다.)
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(status_document)
+
+
+_generation_event_broker: Optional[GenerationEventBroker] = None
+
+def get_generation_event_broker() -> GenerationEventBroker:
+    global _generation_event_broker
+
+    if _generation_event_broker is None:
+        _generation_event_broker = GenerationEventBroker(
+            async_redis=get_async_redis_client(),
+            setting=generation_event_setting,
+        )
+
+    return _generation_event_broker
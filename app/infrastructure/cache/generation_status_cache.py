@@ -0,0 +1,202 @@
+import json
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+from redis import Redis, RedisError
+from redis.asyncio import Redis as AsyncRedis
+
+from app.core.config import generation_status_cache_setting, GenerationStatusCacheSetting
+from app.core.enums.generation_status import GenerationResultEnum, GenerationStatusEnum
+from app.domain.generation.models.generation import GenerationRequest, ImageGenerationJob
+from app.domain.generation.services.generation_domain_service import get_latest_expires_at
+from app.infrastructure.auth.redis_client import get_redis_client, get_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 이미 끝난(PENDING 이 아닌) 상태를 늦게 도착한 PENDING 문서로 덮어쓰지 않는다.
+# 저장은 commit 이후라 순서가 뒤바뀔 수 있으므로, completed_count 가 더 작은 PENDING 문서도 버린다.
+# (같은 값은 허용 - retry 로 바뀐 expires_at 은 반영되어야 한다.)
+# 저장된 경우에만 event channel 로 문서를 publish 한다.
+# KEYS: 1 = 상태 문서 key, 2 = event channel
+# ARGV: 1 = 문서, 2 = 문서의 generation_result, 3 = 없을 때만 저장 여부, 4 = ttl
+_SAVE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current then
+    if ARGV[3] == '1' then
+        return 0
+    end
+    if ARGV[2] == 'PENDING' then
+        local ok, doc = pcall(cjson.decode, current)
+        if ok and doc['generation_result'] ~= 'PENDING' then
+            return 0
+        end
+        local incoming_ok, incoming = pcall(cjson.decode, ARGV[1])
+        if ok and incoming_ok and (tonumber(incoming['completed_count']) or 0) < (tonumber(doc['completed_count']) or 0) then
+            return 0
+        end
+    end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[4])
+redis.call('PUBLISH', KEYS[2], ARGV[1])
+return 1
+"""
+
+
+class GenerationStatusDocument(BaseModel):
+    """상태 polling 에 필요한 값만 미리 계산해 둔 생성 요청 상태 문서"""
+    generation_request_id: int
+    user_id: int
+    generation_result: GenerationResultEnum
+    # job 중 가장 늦은 expires_at - 남은 시간은 조회 시점에 계산한다.
+    expires_at: Optional[datetime] = None
+    completed_count: int = 0
+    total_count: int = 0
+    generated_image_group_id: Optional[int] = None
+
+    @classmethod
+    def of(
+            cls,
+            generation_request: GenerationRequest,
+            image_generation_job_list: List[ImageGenerationJob],
+            generation_result: Optional[GenerationResultEnum] = None,
+            generated_image_group_id: Optional[int] = None,
+    ) -> "GenerationStatusDocument":
+        return cls(
+            generation_request_id=generation_request.id,
+            user_id=generation_request.user_id,
+            generation_result=generation_result or generation_request.generation_result,
+            expires_at=get_latest_expires_at(image_generation_job_list),
+            completed_count=sum(1 for job in image_generation_job_list if job.status == GenerationStatusEnum.COMPLETED),
+            total_count=len(image_generation_job_list),
+            generated_image_group_id=generated_image_group_id,
+        )
+
+
+class GenerationStatusCache:
+    """
+    생성 요청 상태 read model (Redis).
+    - generation_status:{request_id} : GenerationStatusDocument
+    - generation_status:latest:{user_id} : 사용자의 가장 최근 요청 id
+    - generation_status:details:{request_id} : 요청 상세 (생성 후 바뀌지 않는다.)
+    - generation_status:events:{request_id} : 상태 문서가 바뀔 때마다 publish 되는 pub/sub channel
+    쓰기는 DB commit 이후 (UnitOfWork.on_commit) 에 하고, Redis 장애 시 조회는 DB 로 대체한다.
+    worker thread 의 sync 서비스는 *_sync 메서드를 사용한다.
+    """
+    KEY_PREFIX = "generation_status"
+    EVENT_CHANNEL_PREFIX = f"{KEY_PREFIX}:events:"
+
+    def __init__(
+            self,
+            async_redis: AsyncRedis,
+            sync_redis: Redis,
+            setting: GenerationStatusCacheSetting,
+    ):
+        self._async_redis = async_redis
+        self._sync_redis = sync_redis
+        self._setting = setting
+        self._async_save_script = async_redis.register_script(_SAVE_SCRIPT)
+        self._sync_save_script = sync_redis.register_script(_SAVE_SCRIPT)
+
+    async def get(self, generation_request_id: int) -> Optional[GenerationStatusDocument]:
+        try:
+            cached = await self._async_redis.get(self._status_key(generation_request_id))
+        except RedisError as e:
+            logger.warning(f"[GenerationStatusCache] redis get failed for {generation_request_id}: {e}")
+            return None
+        return GenerationStatusDocument.model_validate_json(cached) if cached is not None else None
+
+    async def save(self, document: GenerationStatusDocument, set_latest: bool = False, only_if_absent: bool = False) -> None:
+        try:
+            await self._async_save_script(
+                keys=self._save_keys(document),
+                args=self._save_args(document, only_if_absent)
+            )
+            if set_latest:
+                await self.set_latest_request_id(document.user_id, document.generation_request_id)
+        except RedisError as e:
+            logger.warning(f"[GenerationStatusCache] redis save failed for {document.generation_request_id}: {e}")
+
+    def save_sync(self, document: GenerationStatusDocument, set_latest: bool = False) -> None:
+        try:
+            self._sync_save_script(
+                keys=self._save_keys(document),
+                args=self._save_args(document, only_if_absent=False)
+            )
+            if set_latest:
+                self._sync_redis.set(
+                    self._latest_key(document.user_id), document.generation_request_id, ex=self._setting.TTL_SEC
+                )
+        except RedisError as e:
+            logger.warning(f"[GenerationStatusCache] redis save failed for {document.generation_request_id}: {e}")
+
+    async def get_latest_request_id(self, user_id: int) -> Optional[int]:
+        try:
+            cached = await self._async_redis.get(self._latest_key(user_id))
+        except RedisError as e:
+            logger.warning(f"[GenerationStatusCache] redis get failed for latest of user {user_id}: {e}")
+            return None
+        return int(cached) if cached is not None else None
+
+    async def set_latest_request_id(self, user_id: int, generation_request_id: int, only_if_absent: bool = False) -> None:
+        try:
+            await self._async_redis.set(
+                self._latest_key(user_id), generation_request_id, ex=self._setting.TTL_SEC, nx=only_if_absent
+            )
+        except RedisError as e:
+            logger.warning(f"[GenerationStatusCache] redis set failed for latest of user {user_id}: {e}")
+
+    async def get_details(self, generation_request_id: int) -> Optional[dict]:
+        try:
+            cached = await self._async_redis.get(self._details_key(generation_request_id))
+        except RedisError as e:
+            logger.warning(f"[GenerationStatusCache] redis get failed for details {generation_request_id}: {e}")
+            return None
+        return json.loads(cached) if cached is not None else None
+
+    async def save_details(self, generation_request_id: int, details: dict) -> None:
+        try:
+            await self._async_redis.set(
+                self._details_key(generation_request_id), json.dumps(details, default=str), ex=self._setting.TTL_SEC
+            )
+        except RedisError as e:
+            logger.warning(f"[GenerationStatusCache] redis set failed for details {generation_request_id}: {e}")
+
+    def _save_keys(self, document: GenerationStatusDocument) -> list:
+        return [
+            self._status_key(document.generation_request_id),
+            f"{self.EVENT_CHANNEL_PREFIX}{document.generation_request_id}",
+        ]
+
+    def _save_args(self, document: GenerationStatusDocument, only_if_absent: bool) -> list:
+        return [
+            document.model_dump_json(),
+            document.generation_result.value,
+            '1' if only_if_absent else '0',
+            self._setting.TTL_SEC,
+        ]
+
+    def _status_key(self, generation_request_id: int) -> str:
+        return f"{self.KEY_PREFIX}:{generation_request_id}"
+
+    def _latest_key(self, user_id: int) -> str:
+        return f"{self.KEY_PREFIX}:latest:{user_id}"
+
+    def _details_key(self, generation_request_id: int) -> str:
+        return f"{self.KEY_PREFIX}:details:{generation_request_id}"
+
+
+_generation_status_cache: Optional[GenerationStatusCache] = None
+
+def get_generation_status_cache() -> GenerationStatusCache:
+    global _generation_status_cache
+
+    if _generation_status_cache is None:
+        _generation_status_cache = GenerationStatusCache(
+            async_redis=get_async_redis_client(),
+            sync_redis=get_redis_client(),
+            setting=generation_status_cache_setting,
+        )
+
+    return _generation_status_cache
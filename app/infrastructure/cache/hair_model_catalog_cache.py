@@ -0,0 +1,153 @@
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from redis import Redis, RedisError
+from redis.asyncio import Redis as AsyncRedis
+
+from app.core.config import catalog_cache_setting, CatalogCacheSetting
+from app.infrastructure.auth.redis_client import get_redis_client, get_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+CatalogRows = List[dict]
+
+
+class HairModelCatalogCache:
+    """
+    hair model option catalog 용 version 기반 2단 캐시.
+    - 1단: process local LRU. key 에 catalog version 이 포함된다.
+    - 2단: Redis. key 는 hair_model_catalog:v{version}:{name}
+    dev CRUD 에서 catalog 를 수정하면 Redis 의 version 을 올리고,
+    다른 process 들은 LOCAL_VERSION_TTL_SEC 안에 새 version 을 보게 된다.
+    presigned url 은 만료가 있으므로 캐시하지 않고 s3 key 만 저장한다.
+    """
+    VERSION_KEY = "hair_model_catalog:version"
+    KEY_PREFIX = "hair_model_catalog"
+
+    def __init__(
+            self,
+            async_redis: AsyncRedis,
+            sync_redis: Redis,
+            setting: CatalogCacheSetting,
+    ):
+        self._async_redis = async_redis
+        self._sync_redis = sync_redis
+        self._setting = setting
+
+        self._local: OrderedDict[Tuple[str, str], CatalogRows] = OrderedDict()
+        self._local_version: Optional[str] = None
+        self._local_version_checked_at: float = 0.0
+        # name 에 client 가 보낸 id 가 들어가므로, 기다리는 쪽이 없어지면 lock 을 지운다.
+        self._load_locks: Dict[str, asyncio.Lock] = {}
+        self._load_lock_waiters: Dict[str, int] = {}
+
+    async def get_or_load(self, name: str, loader: Callable[[], Awaitable[CatalogRows]]) -> CatalogRows:
+        try:
+            version = await self._get_version()
+        except RedisError as e:
+            logger.warning(f"[CatalogCache] redis unavailable, reading {name} from db: {e}")
+            return await loader()
+
+        local_key = (version, name)
+        rows = self._get_local(local_key)
+        if rows is not None:
+            return rows
+
+        # 같은 key 에 대한 동시 miss 는 하나만 DB 까지 간다.
+        lock = self._load_locks.get(name)
+        if lock is None:
+            lock = self._load_locks[name] = asyncio.Lock()
+        self._load_lock_waiters[name] = self._load_lock_waiters.get(name, 0) + 1
+        try:
+            async with lock:
+                return await self._load(local_key, version, name, loader)
+        finally:
+            self._load_lock_waiters[name] -= 1
+            if self._load_lock_waiters[name] == 0:
+                del self._load_lock_waiters[name]
+                del self._load_locks[name]
+
+    async def _load(
+            self,
+            local_key: Tuple[str, str],
+            version: str,
+            name: str,
+            loader: Callable[[], Awaitable[CatalogRows]],
+    ) -> CatalogRows:
+        rows = self._get_local(local_key)
+        if rows is not None:
+            return rows
+
+        redis_key = f"{self.KEY_PREFIX}:v{version}:{name}"
+        try:
+            cached = await self._async_redis.get(redis_key)
+        except RedisError as e:
+            logger.warning(f"[CatalogCache] redis get failed for {redis_key}: {e}")
+            cached = None
+
+        if cached is not None:
+            rows = json.loads(cached)
+        else:
+            rows = await loader()
+            # 존재하지 않는 id 에 대한 빈 결과는 Redis 에 남기지 않는다. (local LRU 에만 둔다.)
+            if rows:
+                try:
+                    await self._async_redis.set(redis_key, json.dumps(rows, default=str), ex=self._setting.REDIS_TTL_SEC)
+                except RedisError as e:
+                    logger.warning(f"[CatalogCache] redis set failed for {redis_key}: {e}")
+
+        self._put_local(local_key, rows)
+        return rows
+
+    def invalidate(self) -> None:
+        """catalog 쓰기 이후 호출. (dev CRUD 는 sync 서비스이므로 sync Redis 를 사용한다.)"""
+        self._local.clear()
+        self._local_version = None
+        try:
+            self._sync_redis.incr(self.VERSION_KEY)
+        except RedisError as e:
+            logger.warning(f"[CatalogCache] failed to bump catalog version: {e}")
+
+    async def _get_version(self) -> str:
+        now = time.monotonic()
+        if self._local_version is not None and now - self._local_version_checked_at < self._setting.LOCAL_VERSION_TTL_SEC:
+            return self._local_version
+
+        version = await self._async_redis.get(self.VERSION_KEY)
+        version = version or "0"
+        if version != self._local_version:
+            self._local.clear()
+        self._local_version = version
+        self._local_version_checked_at = now
+        return version
+
+    def _get_local(self, key: Tuple[str, str]) -> Optional[CatalogRows]:
+        rows = self._local.get(key)
+        if rows is not None:
+            self._local.move_to_end(key)
+        return rows
+
+    def _put_local(self, key: Tuple[str, str], rows: CatalogRows) -> None:
+        self._local[key] = rows
+        self._local.move_to_end(key)
+        while len(self._local) > self._setting.LOCAL_MAX_ENTRIES:
+            self._local.popitem(last=False)
+
+
+_hair_model_catalog_cache: Optional[HairModelCatalogCache] = None
+
+def get_hair_model_catalog_cache() -> HairModelCatalogCache:
+    global _hair_model_catalog_cache
+
+    if _hair_model_catalog_cache is None:
+        _hair_model_catalog_cache = HairModelCatalogCache(
+            async_redis=get_async_redis_client(),
+            sync_redis=get_redis_client(),
+            setting=catalog_cache_setting,
+        )
+
+    return _hair_model_catalog_cache
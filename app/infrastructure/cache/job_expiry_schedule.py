@@ -0,0 +1,94 @@
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from redis import Redis, RedisError
+from redis.asyncio import Redis as AsyncRedis
+
+from app.infrastructure.auth.redis_client import get_redis_client, get_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 만료 시각이 지난 member 를 최대 ARGV[2] 개 꺼내고 삭제한다. (여러 replica 가 같은 member 를 중복으로 꺼내지 않는다.)
+# KEYS: 1 = sorted set
+# ARGV: 1 = 현재 시각 (epoch sec), 2 = 최대 개수
+_POP_DUE_SCRIPT = """
+local members = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #members > 0 then
+    redis.call('ZREM', KEYS[1], unpack(members))
+end
+return members
+"""
+
+
+class JobExpirySchedule:
+    """
+    처리 중인 image_generation_job 의 만료 시각 타이머 (Redis sorted set, member = job id, score = expires_at).
+    retry task 는 가장 이른 만료 시각까지만 잠들고, 만료된 member 를 꺼내면 바로 retry 경로를 실행한다.
+    DB 가 원본이므로 Redis 장애 / 누락은 retry task 의 안전망 스캔이 처리한다.
+    """
+    KEY = "generation_job_expiry"
+
+    def __init__(self, async_redis: AsyncRedis, sync_redis: Redis):
+        self._async_redis = async_redis
+        self._sync_redis = sync_redis
+        self._async_pop_due_script = async_redis.register_script(_POP_DUE_SCRIPT)
+
+    async def schedule(self, expires_at_by_job_id: Dict[int, datetime]) -> None:
+        if not expires_at_by_job_id:
+            return
+        try:
+            await self._async_redis.zadd(self.KEY, self._to_mapping(expires_at_by_job_id))
+        except RedisError as e:
+            logger.warning(f"[JobExpirySchedule] redis zadd failed: {e}")
+
+    def schedule_sync(self, expires_at_by_job_id: Dict[int, datetime]) -> None:
+        if not expires_at_by_job_id:
+            return
+        try:
+            self._sync_redis.zadd(self.KEY, self._to_mapping(expires_at_by_job_id))
+        except RedisError as e:
+            logger.warning(f"[JobExpirySchedule] redis zadd failed: {e}")
+
+    def unschedule_sync(self, job_ids: List[int]) -> None:
+        if not job_ids:
+            return
+        try:
+            self._sync_redis.zrem(self.KEY, *job_ids)
+        except RedisError as e:
+            logger.warning(f"[JobExpirySchedule] redis zrem failed: {e}")
+
+    async def get_next_due_at(self) -> Optional[float]:
+        """가장 이른 만료 시각 (epoch sec), 예약된 job 이 없거나 Redis 를 읽지 못하면 None"""
+        try:
+            earliest = await self._async_redis.zrange(self.KEY, 0, 0, withscores=True)
+        except RedisError as e:
+            logger.warning(f"[JobExpirySchedule] redis zrange failed: {e}")
+            return None
+        return earliest[0][1] if earliest else None
+
+    async def pop_due(self, now: float, limit: int) -> List[int]:
+        try:
+            members = await self._async_pop_due_script(keys=[self.KEY], args=[now, limit])
+        except RedisError as e:
+            logger.warning(f"[JobExpirySchedule] redis pop due failed: {e}")
+            return []
+        return [int(member) for member in members]
+
+    @staticmethod
+    def _to_mapping(expires_at_by_job_id: Dict[int, datetime]) -> Dict[str, float]:
+        return {str(job_id): expires_at.timestamp() for job_id, expires_at in expires_at_by_job_id.items()}
+
+
+_job_expiry_schedule: Optional[JobExpirySchedule] = None
+
+def get_job_expiry_schedule() -> JobExpirySchedule:
+    global _job_expiry_schedule
+
+    if _job_expiry_schedule is None:
+        _job_expiry_schedule = JobExpirySchedule(
+            async_redis=get_async_redis_client(),
+            sync_redis=get_redis_client(),
+        )
+
+    return _job_expiry_schedule
@@ -0,0 +1,70 @@
+import logging
+import uuid
+
+from redis import RedisError
+from redis.asyncio import Redis as AsyncRedis
+
+logger = logging.getLogger(__name__)
+
+# 이미 내 lease 면 연장하고, 비어 있으면 가져온다.
+# KEYS: 1 = lease key
+# ARGV: 1 = owner token, 2 = ttl (ms)
+_ACQUIRE_OR_RENEW_SCRIPT = """
+local owner = redis.call('GET', KEYS[1])
+if owner == ARGV[1] then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+if not owner then
+    redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# 내 lease 인 경우에만 삭제한다.
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisLeaderLease:
+    """
+    여러 replica 중 하나만 실행해야 하는 background 작업의 leader lease.
+    leader 는 매 실행 전에 lease 를 연장하고, 연장하지 못한 채 ttl 이 지나면 다른 replica 가 가져간다.
+    Redis 를 읽지 못하면 fail_open 값에 따라 leader 로 간주할지 정한다.
+    (작업 자체가 row lock 등으로 중복 실행에 안전한 경우에만 fail_open 을 켠다.)
+    """
+    KEY_PREFIX = "leader"
+
+    def __init__(self, async_redis: AsyncRedis, name: str, ttl_sec: int, fail_open: bool = False):
+        self._async_redis = async_redis
+        self.key = f"{self.KEY_PREFIX}:{name}"
+        self.ttl_ms = ttl_sec * 1000
+        self.fail_open = fail_open
+        self.owner_token = uuid.uuid4().hex
+        self.is_leader = False
+        self._acquire_or_renew_script = async_redis.register_script(_ACQUIRE_OR_RENEW_SCRIPT)
+        self._release_script = async_redis.register_script(_RELEASE_SCRIPT)
+
+    async def acquire_or_renew(self) -> bool:
+        try:
+            is_leader = bool(await self._acquire_or_renew_script(keys=[self.key], args=[self.owner_token, self.ttl_ms]))
+        except RedisError as e:
+            logger.warning(f"[LeaderLease] {self.key} redis unavailable, fail_open={self.fail_open}: {e}")
+            is_leader = self.fail_open
+
+        if is_leader != self.is_leader:
+            logger.info(f"[LeaderLease] {self.key} leadership {'acquired' if is_leader else 'lost'}")
+        self.is_leader = is_leader
+        return is_leader
+
+    async def release(self) -> None:
+        try:
+            await self._release_script(keys=[self.key], args=[self.owner_token])
+        except RedisError as e:
+            logger.warning(f"[LeaderLease] {self.key} release failed: {e}")
+        self.is_leader = False
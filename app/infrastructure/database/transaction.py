@@ -37,4 +37,20 @@ def transactional(func: Callable[..., Union[T, Awaitable[T]]]) -> Callable[...,
             uow.rollback()
             raise
 
-    return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
\ No newline at end of file
+    return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
+
+def async_transactional(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """AsyncUnitOfWork 를 사용하는 서비스의 코루틴 메서드용 트랜잭션 데코레이터"""
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        service_instance = args[0]
+        uow = service_instance.unit_of_work
+        try:
+            result = await func(*args, **kwargs)
+            await uow.commit()
+            return result
+        except Exception:
+            await uow.rollback()
+            raise
+
+    return wrapper
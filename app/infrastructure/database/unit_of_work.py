@@ -1,16 +1,30 @@
+import logging
+from typing import Awaitable, Callable, List
+
 from fastapi import Depends
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db.base import get_db, get_async_db
 
-from app.core.db.base import get_db
+logger = logging.getLogger(__name__)
 
 class UnitOfWork:
     def __init__(self, db: Session):
         self.db = db
+        self._on_commit_callbacks: List[Callable[[], None]] = []
 
     def begin(self):
         # 트랜잭션 시작 로직
         pass
 
+    def on_commit(self, callback: Callable[[], None]):
+        """
+        commit 이 성공한 뒤 실행할 callback 을 등록한다. (Redis 같은 DB 밖의 read model 갱신용)
+        rollback 되면 실행되지 않고 버려진다.
+        """
+        self._on_commit_callbacks.append(callback)
+
     def commit(self):
         self.db.commit()
         # refresh 로직
@@ -18,10 +32,50 @@ class UnitOfWork:
             self.db.refresh(obj)
         for obj in self.db.dirty:
             self.db.refresh(obj)
+        self._run_on_commit_callbacks()
 
     def rollback(self):
         self.db.rollback()
+        self._on_commit_callbacks.clear()
+
+    def _run_on_commit_callbacks(self):
+        callbacks, self._on_commit_callbacks = self._on_commit_callbacks, []
+        for callback in callbacks:
+            # 이미 commit 되었으므로 callback 실패가 트랜잭션 결과를 바꾸지 않도록 한다.
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"[UnitOfWork] on_commit callback failed: {e}", exc_info=True)
 
 def get_unit_of_work(db: Session = Depends(get_db)):
     return UnitOfWork(db)
 
+
+class AsyncUnitOfWork:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._on_commit_callbacks: List[Callable[[], Awaitable[None]]] = []
+
+    def on_commit(self, callback: Callable[[], Awaitable[None]]):
+        """commit 이 성공한 뒤 await 할 callback 을 등록한다. rollback 되면 버려진다."""
+        self._on_commit_callbacks.append(callback)
+
+    async def commit(self):
+        # AsyncSessionLocal 은 expire_on_commit=False 이므로 commit 후 refresh 가 필요없다.
+        await self.db.commit()
+        await self._run_on_commit_callbacks()
+
+    async def rollback(self):
+        await self.db.rollback()
+        self._on_commit_callbacks.clear()
+
+    async def _run_on_commit_callbacks(self):
+        callbacks, self._on_commit_callbacks = self._on_commit_callbacks, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                logger.error(f"[AsyncUnitOfWork] on_commit callback failed: {e}", exc_info=True)
+
+async def get_async_unit_of_work(db: AsyncSession = Depends(get_async_db)) -> AsyncUnitOfWork:
+    return AsyncUnitOfWork(db)
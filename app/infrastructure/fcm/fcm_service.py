@@ -1,70 +1,137 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Protocol
 import logging
 from firebase_admin import messaging, credentials, initialize_app
 import firebase_admin
+from pydantic import BaseModel
 
 from app.core.config import oauth_setting
 from app.core.errors.exceptions import FCMException
 
 logger = logging.getLogger()
 
+# 더 이상 유효하지 않은 token - 재시도하지 않고 사용자 token 을 정리한다.
+# INVALID_ARGUMENT 는 메시지 자체가 잘못된 경우 (data / apns 필드 등) 에도 오므로 token 오류로 보지 않는다.
+_INVALID_TOKEN_ERRORS = (
+    messaging.UnregisteredError,
+    messaging.SenderIdMismatchError,
+)
+
+
+class FCMTransport(Protocol):
+    """FCM 전송 구현 - 테스트에서는 가짜 transport 로 교체한다."""
+    def send_each(self, messages: List[messaging.Message]) -> messaging.BatchResponse:
+        ...
+
+
+class FirebaseFCMTransport:
+    def send_each(self, messages: List[messaging.Message]) -> messaging.BatchResponse:
+        return messaging.send_each(messages)
+
+
+class FCMSendResult(BaseModel):
+    success: bool
+    message_id: Optional[str] = None
+    invalid_token: bool = False
+    error: Optional[str] = None
+
+
 class FCMService:
     _instance = None
+    # messaging.send_each 한 번에 보낼 수 있는 최대 메시지 수
+    MAX_BATCH_SIZE = 500
 
-    def __init__(self):
-        try:
-            cred = credentials.Certificate(oauth_setting.FIREBASE_CREDENTIALS_PATH)
-            if not firebase_admin._apps:
-                initialize_app(cred)
-        except Exception as e:
-            raise FCMException(context=f"Failed to initialize Firebase Admin: {str(e)}")
+    def __init__(self, transport: Optional[FCMTransport] = None):
+        if transport is None:
+            try:
+                cred = credentials.Certificate(oauth_setting.FIREBASE_CREDENTIALS_PATH)
+                if not firebase_admin._apps:
+                    initialize_app(cred)
+            except Exception as e:
+                raise FCMException(context=f"Failed to initialize Firebase Admin: {str(e)}")
+            transport = FirebaseFCMTransport()
+        self.transport = transport
 
-    def send_to_token(
-            self,
+    @staticmethod
+    def build_message(
             token: str,
             title: str,
             body: str,
             category: Optional[str] = None,  # 카테고리(click_action/category)
             identifier: Optional[str] = None,  # 식별자(tag/thread_id)
             data: Optional[Dict[str, str]] = None
-    ) -> dict:
-        try:
-            message = messaging.Message(
-                notification=messaging.Notification(
-                    title=title,
-                    body=body,
-                ),
-                android=messaging.AndroidConfig(
-                    priority='high',
-                    notification=messaging.AndroidNotification(
-                        click_action=category,
-                        tag=identifier,
-                        priority='max',  # 추가: 알림 우선순위
-                        visibility='public'  # 추가: 잠금화면에서도 표시
-                    ) if category or identifier else None
-                ),
-                apns=messaging.APNSConfig(
-                    headers={'apns-priority': '10'},
-                    payload=messaging.APNSPayload(
-                        aps=messaging.Aps(
-                            alert=messaging.ApsAlert(
-                                title=title,
-                                body=body,
-                            ),
-                            category=category,
-                            thread_id=identifier
+    ) -> messaging.Message:
+        return messaging.Message(
+            notification=messaging.Notification(
+                title=title,
+                body=body,
+            ),
+            android=messaging.AndroidConfig(
+                priority='high',
+                notification=messaging.AndroidNotification(
+                    click_action=category,
+                    tag=identifier,
+                    priority='max',  # 추가: 알림 우선순위
+                    visibility='public'  # 추가: 잠금화면에서도 표시
+                ) if category or identifier else None
+            ),
+            apns=messaging.APNSConfig(
+                headers={'apns-priority': '10'},
+                payload=messaging.APNSPayload(
+                    aps=messaging.Aps(
+                        alert=messaging.ApsAlert(
+                            title=title,
+                            body=body,
+                        ),
+                        category=category,
+                        thread_id=identifier
+                    )
+                )
+            ) if category or identifier else None,
+            data=data or {},
+            token=token,
+        )
+
+    def send_each(self, messages: List[messaging.Message]) -> List[FCMSendResult]:
+        """
+        메시지 목록을 MAX_BATCH_SIZE 단위로 send_each 하고, 입력 순서대로 메시지별 결과를 반환한다.
+        개별 실패는 예외 대신 결과로 돌려주며, 배치 전체 실패 (네트워크 등) 만 FCMException 으로 올린다.
+        """
+        results: List[FCMSendResult] = []
+        for start in range(0, len(messages), self.MAX_BATCH_SIZE):
+            batch = messages[start:start + self.MAX_BATCH_SIZE]
+            try:
+                batch_response = self.transport.send_each(batch)
+            except Exception as e:
+                raise FCMException(context=f"Failed to send FCM messages: {str(e)}")
+
+            for response in batch_response.responses:
+                if response.success:
+                    results.append(FCMSendResult(success=True, message_id=response.message_id))
+                else:
+                    results.append(
+                        FCMSendResult(
+                            success=False,
+                            invalid_token=isinstance(response.exception, _INVALID_TOKEN_ERRORS),
+                            error=str(response.exception)
                         )
                     )
-                ) if category or identifier else None,
-                data=data or {},
-                token=token,
-            )
+        return results
 
-            logger.info(f"sending fcm message... title: {title}, token: {token[:10]}")
-            response = messaging.send(message)
-            return {"success": True, "message_id": response}
-        except Exception as e:
-            raise FCMException(context=f"Failed to send FCM message: {str(e)}")
+    def send_to_token(
+            self,
+            token: str,
+            title: str,
+            body: str,
+            category: Optional[str] = None,  # 카테고리(click_action/category)
+            identifier: Optional[str] = None,  # 식별자(tag/thread_id)
+            data: Optional[Dict[str, str]] = None
+    ) -> dict:
+        message = self.build_message(token, title, body, category, identifier, data)
+        logger.info(f"sending fcm message... title: {title}, token: {token[:10]}")
+        result = self.send_each([message])[0]
+        if not result.success:
+            raise FCMException(context=f"Failed to send FCM message: {result.error}")
+        return {"success": True, "message_id": result.message_id}
 
     def send_to_tokens(
             self,
@@ -0,0 +1,58 @@
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import image_processing_setting
+from app.core.image.thumbnail import create_stitched_thumbnail, create_resized_derivatives
+
+logger = logging.getLogger(__name__)
+
+
+class ImageProcessingService:
+    """
+    Pillow 디코딩 / 리사이즈 / 인코딩을 별도 process pool 에서 실행한다.
+    API 와 같은 process 의 GIL 을 잡지 않도록 하기 위함이며, 인자와 결과는 bytes 로만 주고받는다.
+    (PIL.Image 같은 중간 객체는 worker process 밖으로 나오지 않는다.)
+    """
+    def __init__(self, worker_count: int):
+        self.worker_count = worker_count
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def create_stitched_thumbnail(self, image_bytes_list: List[bytes], **kwargs) -> Optional[Tuple[bytes, str]]:
+        """호출한 thread 는 결과가 나올 때까지 대기한다. (대기 중에는 GIL 을 놓는다.)"""
+        return self._get_executor().submit(create_stitched_thumbnail, image_bytes_list, **kwargs).result()
+
+    def create_resized_derivatives(self, image_bytes: bytes, max_widths: Dict[str, int], **kwargs) -> Dict[str, Tuple[bytes, str]]:
+        return self._get_executor().submit(create_resized_derivatives, image_bytes, max_widths, **kwargs).result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # 부모 process 의 thread / connection 상태를 물려받지 않도록 spawn 으로 띄운다.
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.worker_count,
+                        mp_context=multiprocessing.get_context('spawn')
+                    )
+                    logger.info(f"[ImageProcessing] started process pool with {self.worker_count} workers")
+        return self._executor
+
+
+_image_processing_service: Optional[ImageProcessingService] = None
+
+def get_image_processing_service() -> ImageProcessingService:
+    global _image_processing_service
+
+    if _image_processing_service is None:
+        _image_processing_service = ImageProcessingService(worker_count=image_processing_setting.WORKER_COUNT)
+
+    return _image_processing_service
@@ -0,0 +1,68 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class OrderedMessageDispatcher:
+    """
+    consume 한 메시지를 전용 thread pool 에서 처리한다.
+    같은 ordering key (generation_request_id) 의 메시지는 순서대로 하나씩, 서로 다른 key 는 병렬로 처리된다.
+    key 별 lock 은 대기 중인 메시지가 없어지면 정리한다.
+    result_callback 이 있으면 handler 결과를 key lock 밖에서 넘긴다. (다음 처리 단계로 전달)
+    """
+    def __init__(
+            self,
+            handler: Callable[[bytes], T],
+            key_resolver: Callable[[bytes], Awaitable[Optional[Hashable]]],
+            worker_count: int,
+            result_callback: Optional[Callable[[T], Awaitable[None]]] = None,
+    ):
+        self.handler = handler
+        self.key_resolver = key_resolver
+        self.worker_count = worker_count
+        self.result_callback = result_callback
+        self._executor = ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="mq-consumer")
+        # key -> (lock, 해당 lock 을 잡고 있거나 기다리는 메시지 수)
+        self._key_locks: Dict[Hashable, Tuple[asyncio.Lock, int]] = {}
+
+    async def dispatch(self, body: bytes) -> T:
+        key = await self.key_resolver(body)
+        if key is None:
+            result = await self._run_handler(body)
+        else:
+            lock = self._acquire_key_lock(key)
+            try:
+                async with lock:
+                    result = await self._run_handler(body)
+            finally:
+                self._release_key_lock(key)
+
+        if self.result_callback is not None:
+            await self.result_callback(result)
+        return result
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run_handler(self, body: bytes) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.handler, body)
+
+    def _acquire_key_lock(self, key: Hashable) -> asyncio.Lock:
+        lock, ref_count = self._key_locks.get(key, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self._key_locks[key] = (lock, ref_count + 1)
+        return lock
+
+    def _release_key_lock(self, key: Hashable) -> None:
+        lock, ref_count = self._key_locks[key]
+        if ref_count <= 1:
+            del self._key_locks[key]
+        else:
+            self._key_locks[key] = (lock, ref_count - 1)
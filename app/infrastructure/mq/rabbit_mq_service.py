@@ -1,16 +1,20 @@
 import asyncio
 import ssl
 import logging
+import time
 from urllib.parse import quote
 
-from typing import Optional, AsyncGenerator, Callable
+from typing import Optional, List, Tuple
 from aio_pika import connect_robust, Message, Connection, Channel
+from aio_pika.pool import Pool
+from fastapi import Request
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.application.services.generation.dto.mq import MQPublishMessage
 from app.core.decorators import log_errors
 from app.core.config import rabbit_mq_setting
 from app.core.enums.message_priority import MessagePriority
+from app.infrastructure.mq.ordered_dispatcher import OrderedMessageDispatcher
 
 logger = logging.getLogger()
 
@@ -22,12 +26,31 @@ class RabbitMQService:
             username: str = rabbit_mq_setting.RABBITMQ_USERNAME,
             password: str = rabbit_mq_setting.RABBITMQ_PASSWORD,
             publish_queue: str = rabbit_mq_setting.RABBITMQ_PUBLISH_QUEUE,
-            consume_queue: str = rabbit_mq_setting.RABBITMQ_CONSUME_QUEUE
+            consume_queue: str = rabbit_mq_setting.RABBITMQ_CONSUME_QUEUE,
+            publish_channel_pool_size: int = rabbit_mq_setting.PUBLISH_CHANNEL_POOL_SIZE,
+            consumer_prefetch_count: int = rabbit_mq_setting.CONSUMER_PREFETCH_COUNT
     ):
         self.publish_queue = publish_queue
         self.consume_queue = consume_queue
+        self.publish_channel_pool_size = publish_channel_pool_size
+        self.consumer_prefetch_count = consumer_prefetch_count
         self.connection: Optional[Connection] = None
+        # consume / queue 조회용 channel
         self.channel: Optional[Channel] = None
+        # 발행용 channel pool - 하나의 connection 위에서 publisher confirms channel 을 재사용한다.
+        self.publish_channel_pool: Optional[Pool[Channel]] = None
+
+        # consume 중인 queue / consumer tag 와 처리 중 (ack 전) 메시지 수 - 종료 시 drain 에 사용한다.
+        self._consume_queue = None
+        self._consumer_tag: Optional[str] = None
+        self._in_flight_count: int = 0
+        self._consume_idle = asyncio.Event()
+        self._consume_idle.set()
+
+        # publish queue 상태 snapshot - QueueInfoPollerTaskManager 가 주기적으로 갱신한다.
+        self.queue_message_count: int = 0
+        self.queue_consumer_count: int = 0
+        self.queue_info_refreshed_at: Optional[float] = None
 
         encoded_password = quote(password, safe='')
         encoded_vhost = quote(vhost, safe='') if vhost else ''
@@ -48,7 +71,12 @@ class RabbitMQService:
             self.connection = await connect_robust(**self.connect_kwargs)
         if not self.channel or self.channel.is_closed:
             self.channel = await self.connection.channel()
-        await self.channel.set_qos(prefetch_count=10)
+        await self.channel.set_qos(prefetch_count=self.consumer_prefetch_count)
+        if not self.publish_channel_pool or self.publish_channel_pool.is_closed:
+            self.publish_channel_pool = Pool(self._create_publish_channel, max_size=self.publish_channel_pool_size)
+
+    async def _create_publish_channel(self) -> Channel:
+        return await self.connection.channel(publisher_confirms=True)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -63,83 +91,120 @@ class RabbitMQService:
         if self.connection.is_closed or self.channel.is_closed:
             await self._reconnect()
 
-        await self.channel.default_exchange.publish(
-            Message(
-                body=message.to_json(),
-                delivery_mode=2,
-                expiration=expiration_sec,
-                priority=priority
-            ),
-            routing_key=self.publish_queue
-        )
+        # publisher confirms channel 이므로 broker ack 까지 기다린다.
+        async with self.publish_channel_pool.acquire() as channel:
+            if channel.is_closed:
+                await channel.reopen()
+            await channel.default_exchange.publish(
+                Message(
+                    body=message.to_json(),
+                    delivery_mode=2,
+                    expiration=expiration_sec,
+                    priority=priority
+                ),
+                routing_key=self.publish_queue
+            )
         logger.info(f"[MQ] Published Job ID: {message.image_generation_job_id}. DETAILS: {message.to_str()}")
 
-    async def consume(self, sync_callback: Callable):
-        while True:  # 지속적인 재시도를 위한 루프
-            try:
-                if self.connection.is_closed or self.channel.is_closed:
-                    await self._reconnect()
-
-                queue = await self.channel.declare_queue(self.consume_queue, passive=True)
-
-                async def async_wrapper(message):
-                    try:
-                        async with message.process(requeue=True):  # requeue 옵션 추가
-                            loop = asyncio.get_event_loop()
-                            await loop.run_in_executor(None, sync_callback, message.body)
-                    except Exception as e:
-                        logger.error(f"Error processing message: {e}", exc_info=True)
-                        # connection 문제면 재연결 시도
-                        if isinstance(e, (ConnectionError, TimeoutError)):
-                            await self._reconnect()
-                        raise  # 다시 throw해서 메시지가 requeue되도록 함
-
-                await queue.consume(async_wrapper)
-
-                # consume이 시작된 후 connection 상태 모니터링
-                while not (self.connection.is_closed or self.channel.is_closed):
-                    await asyncio.sleep(30)  # 30초마다 체크
-
-                logger.warning("Connection or channel closed, restarting consumer...")
+    async def publish_each(self, messages: List[Tuple[MQPublishMessage, int, int]]) -> List[bool]:
+        """
+        (메시지, expiration_sec, priority) 목록을 publish channel pool 위에서 동시에 발행한다.
+        메시지별 broker confirm 여부를 입력 순서대로 반환하며, 일부 실패가 나머지 발행을 막지 않는다.
+        """
+        if not messages:
+            return []
+        if self.connection.is_closed or self.channel.is_closed:
+            await self._reconnect()
 
-            except Exception as e:
-                logger.error(f"Consumer encountered an error: {e}", exc_info=True)
-                await asyncio.sleep(5)  # 에러 발생 시 잠시 대기 후 재시도
+        results = await asyncio.gather(
+            *[
+                self.publish(message=message, expiration_sec=expiration_sec, priority=priority)
+                for message, expiration_sec, priority in messages
+            ],
+            return_exceptions=True
+        )
+        published = [not isinstance(result, BaseException) for result in results]
+        # 다음 polling 전까지도 대기열 추정이 맞도록 snapshot 에 반영
+        self.queue_message_count += sum(published)
+        return published
 
     @log_errors("RabbitMQ consume failed")
-    async def consume(self, sync_callback: Callable):
+    async def consume(self, dispatcher: OrderedMessageDispatcher):
+        """
+        consume queue 의 메시지를 dispatcher 로 넘긴다.
+        동시에 처리되는 메시지 수는 prefetch_count, 실제 처리 병렬도는 dispatcher 의 worker 수로 제한된다.
+        """
         if self.connection.is_closed or self.channel.is_closed:
             await self._reconnect()
 
         async def async_wrapper(message):
-            async with message.process():
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, sync_callback, message.body)
+            self._in_flight_count += 1
+            self._consume_idle.clear()
+            try:
+                async with message.process():
+                    await dispatcher.dispatch(message.body)
+            finally:
+                self._in_flight_count -= 1
+                if self._in_flight_count == 0:
+                    self._consume_idle.set()
 
         queue = await self.channel.declare_queue(self.consume_queue, passive=True)
 
-        await queue.consume(async_wrapper)
+        self._consume_queue = queue
+        self._consumer_tag = await queue.consume(async_wrapper)
 
-    async def get_queue_info(self):
+    async def stop_consuming(self, drain_timeout_sec: float = rabbit_mq_setting.CONSUMER_DRAIN_TIMEOUT_SEC):
+        """
+        새 메시지 수신을 멈추고, 이미 받은 메시지의 처리와 ack 가 끝날 때까지 기다린다.
+        channel 을 닫기 전에 호출해야 처리 중인 결과가 재전달되지 않는다.
+        """
+        if self._consume_queue is not None and self._consumer_tag is not None:
+            try:
+                await self._consume_queue.cancel(self._consumer_tag)
+            except Exception as e:
+                logger.warning(f"[MQ] failed to cancel consumer: {e}")
+            self._consume_queue = None
+            self._consumer_tag = None
+
+        try:
+            await asyncio.wait_for(self._consume_idle.wait(), timeout=drain_timeout_sec)
+        except asyncio.TimeoutError:
+            logger.warning(f"[MQ] {self._in_flight_count} messages still in flight after {drain_timeout_sec}s, closing anyway")
+
+    async def get_queue_info(self, max_age_sec: int = rabbit_mq_setting.QUEUE_INFO_MAX_AGE_SEC) -> Tuple[int, int]:
+        """
+        (message_count, consumer_count) snapshot 을 반환
+        snapshot 이 없거나 max_age_sec 보다 오래된 경우에만 broker 에 직접 조회한다.
+        """
+        if (
+                self.queue_info_refreshed_at is None
+                or time.monotonic() - self.queue_info_refreshed_at > max_age_sec
+        ):
+            return await self.refresh_queue_info()
+        return self.queue_message_count, self.queue_consumer_count
+
+    async def refresh_queue_info(self) -> Tuple[int, int]:
         if self.connection.is_closed or self.channel.is_closed:
             await self._reconnect()
 
         queue = await self.channel.declare_queue(self.publish_queue, passive=True)
-        message_count = queue.declaration_result.message_count
-        consumer_count = queue.declaration_result.consumer_count
-        return message_count, consumer_count
+        self.queue_message_count = queue.declaration_result.message_count
+        self.queue_consumer_count = queue.declaration_result.consumer_count
+        self.queue_info_refreshed_at = time.monotonic()
+        return self.queue_message_count, self.queue_consumer_count
 
     async def close(self):
+        if self.publish_channel_pool and not self.publish_channel_pool.is_closed:
+            await self.publish_channel_pool.close()
         if self.channel and not self.channel.is_closed:
             await self.channel.close()
         if self.connection and not self.connection.is_closed:
             await self.connection.close()
 
 
-async def get_rabbit_mq_service() -> AsyncGenerator[RabbitMQService, None]:
-    rabbit_mq_service = RabbitMQService()
-    await rabbit_mq_service.connect()
-    try:
-        yield rabbit_mq_service
-    finally:
-        await rabbit_mq_service.close()
\ No newline at end of file
+async def get_rabbit_mq_service(request: Request) -> RabbitMQService:
+    """
+    LifespanServices 가 들고 있는 application 단위 RabbitMQService 를 반환
+    요청마다 TLS connection 을 새로 열지 않는다.
+    """
+    return request.app.state.services.mq_service
\ No newline at end of file
@@ -0,0 +1,89 @@
+from typing import Generic, Type, List, Dict, Union, Any
+
+from sqlalchemy import select, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.repositories.crud_repository import ModelType, CreateSchemaType, UpdateSchemaType
+
+class AsyncCRUDRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """CRUDRepository 의 AsyncSession 버전. 이벤트 루프를 막지 않아야 하는 요청 경로에서 사용한다."""
+    def __init__(self, model: Type[ModelType], db: AsyncSession):
+        self.model = model
+        self.db = db
+
+    async def exists(self, id: Any) -> bool:
+        return await self.db.get(self.model, id) is not None
+
+    async def get(self, obj_id: int) -> ModelType:
+        db_obj = await self.db.get(self.model, obj_id)
+        if db_obj is None:
+            raise ValueError(f"Object with id {obj_id} does not exist in the database")
+        return db_obj
+
+    async def get_all_in(self, obj_id_list: List[int]) -> List[ModelType]:
+        if not obj_id_list:
+            return []
+
+        stmt = select(self.model).where(self.model.id.in_(obj_id_list))
+        return list((await self.db.scalars(stmt)).all())
+
+    async def get_all(self) -> List[ModelType]:
+        return list((await self.db.scalars(select(self.model))).all())
+
+    async def get_multi(self, *, skip: int = 0, limit: int = 100) -> List[ModelType]:
+        stmt = select(self.model).offset(skip).limit(limit)
+        return list((await self.db.scalars(stmt)).all())
+
+    def create(self, *, obj_in: CreateSchemaType) -> ModelType:
+        db_obj = self.model(**obj_in.model_dump())
+        self.db.add(db_obj)
+        return db_obj
+
+    async def create_with_flush(self, *, obj_in: CreateSchemaType) -> ModelType:
+        db_obj = self.create(obj_in=obj_in)
+        await self.db.flush()
+        return db_obj
+
+    async def bulk_create_with_returning(self, *, obj_in_list: List[CreateSchemaType]) -> List[ModelType]:
+        """다중 행 INSERT ... RETURNING 한 번으로 생성하고, 입력 순서대로 생성된 객체를 반환"""
+        if not obj_in_list:
+            return []
+
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await self.db.scalars(stmt, [obj_in.model_dump() for obj_in in obj_in_list])
+        return list(result.all())
+
+    async def update(
+            self,
+            *,
+            obj_id: int,
+            obj_in: Union[UpdateSchemaType, Dict[str, any]],
+    ) -> ModelType:
+        db_obj = await self.get(obj_id=obj_id)
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+
+        for field in update_data:
+            setattr(db_obj, field, update_data[field])
+
+        self.db.add(db_obj)
+        return db_obj
+
+    async def update_with_flush(
+            self,
+            *,
+            obj_id: int,
+            obj_in: Union[UpdateSchemaType, Dict[str, any]],
+    ) -> ModelType:
+        db_obj = await self.update(obj_id=obj_id, obj_in=obj_in)
+        await self.db.flush()
+        return db_obj
+
+    async def remove(self, *, obj_id: int) -> ModelType:
+        db_obj = await self.get(obj_id=obj_id)
+        await self.db.delete(db_obj)
+        return db_obj
+
+    async def remove_with_flush(self, *, obj_id: int) -> ModelType:
+        db_obj = await self.remove(obj_id=obj_id)
+        await self.db.flush()
+        return db_obj
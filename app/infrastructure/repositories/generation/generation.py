@@ -1,12 +1,14 @@
-from typing import List
+from typing import List, Optional, Tuple
 
 from fastapi import Depends
-from sqlalchemy import select, update, and_
+from sqlalchemy import select, update, and_, or_, tuple_, Row, Select
 from sqlalchemy.orm import Session, joinedload
-from datetime import datetime, UTC
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
 
-from app.core.db.base import get_db
+from app.core.db.base import get_db, get_async_db
 from app.core.enums.generation_status import GenerationStatusEnum
+from app.core.enums.thumbnail_status import ThumbnailStatusEnum
 from app.domain.generation.models.generation import GenerationRequest, ImageGenerationJob
 from app.domain.generation.schemas.example_generated_image import ExampleGeneratedImageCreate, \
     ExampleGeneratedImageUpdate
@@ -14,7 +16,9 @@ from app.domain.generation.schemas.example_generated_image_group import ExampleG
     ExampleGeneratedImageGroupUpdate
 from app.domain.generation.schemas.generated_image_group import GeneratedImageGroupCreate, GeneratedImageGroupUpdate
 from app.domain.hair_model.models.hair import HairVariantModel, HairStyle
+from app.domain.hair_model.models.scene import ImageResolution
 from app.infrastructure.repositories.crud_repository import CRUDRepository
+from app.infrastructure.repositories.async_crud_repository import AsyncCRUDRepository
 from app.domain.generation.schemas.generation_request import GenerationRequestCreate, GenerationRequestUpdate
 from app.domain.generation.schemas.image_generation_job import ImageGenerationJobCreate, ImageGenerationJobUpdate
 from app.domain.generation.models.image import GeneratedImage, GeneratedImageGroup, ExampleGeneratedImageGroup, \
@@ -55,6 +59,18 @@ class GenerationRequestRepository(CRUDRepository[GenerationRequest, GenerationRe
        )
        return self.db.scalars(stmt).first()
 
+    def get_for_update(self, generation_request_id: int) -> GenerationRequest:
+        """같은 generation request 의 결과 메시지 처리를 process 간에도 직렬화하기 위한 row lock"""
+        stmt = (
+            select(GenerationRequest)
+            .where(GenerationRequest.id == generation_request_id)
+            .with_for_update()
+        )
+        db_obj = self.db.scalars(stmt).first()
+        if db_obj is None:
+            raise ValueError(f"Object with id {generation_request_id} does not exist in the database")
+        return db_obj
+
 def get_generation_request_repository(db: Session = Depends(get_db)) -> GenerationRequestRepository:
     return GenerationRequestRepository(db=db)
 
@@ -66,14 +82,23 @@ class ImageGenerationJobRepository(CRUDRepository[ImageGenerationJob, ImageGener
         stmt = select(ImageGenerationJob).where(ImageGenerationJob.generation_request_id == generation_request_id)
         return list(self.db.scalars(stmt).all())
 
-    def get_all_expired_but_to_process_jobs(self) -> List[ImageGenerationJob]:
-        stmt = select(ImageGenerationJob).where(
-            and_(
+    def get_expired_active_jobs_for_update(self, now: datetime, limit: int) -> List[ImageGenerationJob]:
+        """
+        만료됐지만 아직 처리 중 (PENDING / PROCESSING) 인 job 을 만료 순으로 최대 limit 개 잠그고 가져온다.
+        idx_image_generation_job_active_expires_at (부분 인덱스) 만 읽으므로 테이블 크기와 무관하고,
+        SKIP LOCKED 이므로 여러 retry worker 가 서로 다른 batch 를 가져간다.
+        """
+        stmt = (
+            select(ImageGenerationJob)
+            .where(
                 # 아직 처리 중인 작업
                 ImageGenerationJob.status.in_([GenerationStatusEnum.PENDING, GenerationStatusEnum.PROCESSING]),
-                ImageGenerationJob.expires_at < datetime.now(UTC),  # 만료된 작업
+                ImageGenerationJob.expires_at < now,  # 만료된 작업
             )
-        ).order_by(ImageGenerationJob.created_at)
+            .order_by(ImageGenerationJob.expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
         return list(self.db.scalars(stmt).all())
 
 def get_image_generation_job_repository(db: Session = Depends(get_db)) -> ImageGenerationJobRepository:
@@ -104,13 +129,6 @@ class GeneratedImageGroupRepository(CRUDRepository[GeneratedImageGroup, Generate
     def __init__(self, db: Session):
         super().__init__(model=GeneratedImageGroup, db=db)
 
-    def get_all_by_user(self, user_id: int) -> List[GeneratedImageGroup]:
-        stmt = select(GeneratedImageGroup).where(
-            GeneratedImageGroup.user_id == user_id,
-            GeneratedImageGroup.deleted == False
-        )
-        return list(self.db.scalars(stmt).all())
-
     def get_by_generation_request(self, generation_request_id: int) -> GeneratedImageGroup:
         stmt = select(GeneratedImageGroup).where(
             GeneratedImageGroup.generation_request_id == generation_request_id,
@@ -125,6 +143,38 @@ class GeneratedImageGroupRepository(CRUDRepository[GeneratedImageGroup, Generate
         self.db.commit()
         return True
 
+    def get_all_id_by_thumbnail_pending(self, created_before: datetime, claimed_before: datetime) -> List[int]:
+        """다른 worker 가 처리 중인 (lease 가 남아있는) 그룹은 제외한다."""
+        stmt = select(GeneratedImageGroup.id).where(
+            GeneratedImageGroup.thumbnail_status == ThumbnailStatusEnum.PENDING,
+            GeneratedImageGroup.created_at < created_before,
+            or_(
+                GeneratedImageGroup.thumbnail_claimed_at.is_(None),
+                GeneratedImageGroup.thumbnail_claimed_at < claimed_before
+            )
+        )
+        return list(self.db.scalars(stmt).all())
+
+    def claim_thumbnail(self, generated_image_group_id: int, now: datetime, claimed_before: datetime) -> bool:
+        """
+        PENDING 이고 lease 가 없거나 만료된 경우에만 thumbnail_claimed_at 을 갱신한다.
+        조건부 UPDATE 한 번으로 처리하므로 여러 replica 가 동시에 호출해도 한 곳만 True 를 받는다.
+        """
+        stmt = (
+            update(GeneratedImageGroup)
+            .where(
+                GeneratedImageGroup.id == generated_image_group_id,
+                GeneratedImageGroup.thumbnail_status == ThumbnailStatusEnum.PENDING,
+                or_(
+                    GeneratedImageGroup.thumbnail_claimed_at.is_(None),
+                    GeneratedImageGroup.thumbnail_claimed_at < claimed_before
+                )
+            )
+            .values(thumbnail_claimed_at=now)
+            .returning(GeneratedImageGroup.id)
+        )
+        return self.db.execute(stmt).scalar_one_or_none() is not None
+
 def get_generated_image_group_repository(db: Session = Depends(get_db)) -> GeneratedImageGroupRepository:
     return GeneratedImageGroupRepository(db=db)
 
@@ -151,3 +201,143 @@ class ExampleGeneratedImageRepository(CRUDRepository[ExampleGeneratedImage, Exam
 def get_example_generated_image_repository(db: Session = Depends(get_db)) -> ExampleGeneratedImageRepository:
     return ExampleGeneratedImageRepository(db=db)
 
+
+
+class AsyncGenerationRequestRepository(AsyncCRUDRepository[GenerationRequest, GenerationRequestCreate, GenerationRequestUpdate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(model=GenerationRequest, db=db)
+
+    async def get_latest_generation_request_by_user(self, user_id: int) -> GenerationRequest:
+        stmt = (
+            select(GenerationRequest)
+            .where(GenerationRequest.user_id == user_id)
+            .order_by(GenerationRequest.updated_at.desc())
+            .limit(1)
+        )
+        return (await self.db.execute(stmt)).scalar_one_or_none()
+
+    async def get_with_all_relations(self, generation_request_id: int) -> GenerationRequest:
+        stmt = (
+            select(GenerationRequest)
+            .options(
+                joinedload(GenerationRequest.hair_variant_model).options(
+                    joinedload(HairVariantModel.gender),
+                    joinedload(HairVariantModel.hair_style).options(
+                        joinedload(HairStyle.length)
+                    ),
+                    joinedload(HairVariantModel.length),
+                    joinedload(HairVariantModel.color),
+                    joinedload(HairVariantModel.lora_model)
+                ),
+                joinedload(GenerationRequest.background),
+                joinedload(GenerationRequest.image_resolution)
+            )
+            .where(GenerationRequest.id == generation_request_id)
+            # 같은 세션에서 방금 flush 한 객체도 관계를 채워야 async lazy load 가 발생하지 않는다.
+            .execution_options(populate_existing=True)
+        )
+        return (await self.db.scalars(stmt)).first()
+
+async def get_async_generation_request_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncGenerationRequestRepository:
+    return AsyncGenerationRequestRepository(db=db)
+
+
+class AsyncImageGenerationJobRepository(AsyncCRUDRepository[ImageGenerationJob, ImageGenerationJobCreate, ImageGenerationJobUpdate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(model=ImageGenerationJob, db=db)
+
+    async def get_all_by_generation_request(self, generation_request_id: int) -> List[ImageGenerationJob]:
+        stmt = select(ImageGenerationJob).where(ImageGenerationJob.generation_request_id == generation_request_id)
+        return list((await self.db.scalars(stmt)).all())
+
+    async def get_generation_request_id(self, image_generation_job_id: int) -> Optional[int]:
+        stmt = select(ImageGenerationJob.generation_request_id).where(ImageGenerationJob.id == image_generation_job_id)
+        return (await self.db.execute(stmt)).scalar_one_or_none()
+
+async def get_async_image_generation_job_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncImageGenerationJobRepository:
+    return AsyncImageGenerationJobRepository(db=db)
+
+
+class AsyncGeneratedImageRepository(AsyncCRUDRepository[GeneratedImage, GeneratedImageCreate, GeneratedImageUpdate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(model=GeneratedImage, db=db)
+
+    async def get_list_rows_by_image_group(self, generated_image_group_id: int) -> List[Row]:
+        stmt = self._list_rows_stmt().where(GeneratedImageGroup.id == generated_image_group_id)
+        return list((await self.db.execute(stmt)).all())
+
+    async def get_list_rows_by_generation_request(self, generation_request_id: int) -> List[Row]:
+        stmt = self._list_rows_stmt().where(
+            GeneratedImageGroup.generation_request_id == generation_request_id,
+            GeneratedImageGroup.deleted == False
+        )
+        return list((await self.db.execute(stmt)).all())
+
+    @staticmethod
+    def _list_rows_stmt() -> Select:
+        """
+        이미지 목록 화면용 read model - 그룹 소유자, 해상도, 이미지를 한 번의 쿼리로 읽는다.
+        ORM 객체 대신 필요한 column 만 담은 row 를 반환하며,
+        이미지가 없는 그룹도 소유자 확인을 위해 image column 이 NULL 인 row 하나로 반환된다.
+        """
+        return (
+            select(
+                GeneratedImageGroup.id.label("generated_image_group_id"),
+                GeneratedImageGroup.user_id.label("owner_user_id"),
+                ImageResolution.width,
+                ImageResolution.height,
+                GeneratedImage.id,
+                GeneratedImage.s3_key,
+                GeneratedImage.small_s3_key,
+                GeneratedImage.medium_s3_key,
+            )
+            .select_from(GeneratedImageGroup)
+            .join(GenerationRequest, GenerationRequest.id == GeneratedImageGroup.generation_request_id)
+            .join(ImageResolution, ImageResolution.id == GenerationRequest.image_resolution_id)
+            .outerjoin(
+                GeneratedImage,
+                and_(
+                    GeneratedImage.generated_image_group_id == GeneratedImageGroup.id,
+                    GeneratedImage.deleted == False
+                )
+            )
+            .order_by(GeneratedImage.id)
+        )
+
+async def get_async_generated_image_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncGeneratedImageRepository:
+    return AsyncGeneratedImageRepository(db=db)
+
+
+class AsyncGeneratedImageGroupRepository(AsyncCRUDRepository[GeneratedImageGroup, GeneratedImageGroupCreate, GeneratedImageGroupUpdate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(model=GeneratedImageGroup, db=db)
+
+    async def get_page_by_user(
+            self,
+            user_id: int,
+            limit: Optional[int],
+            after: Optional[Tuple[datetime, int]] = None
+    ) -> List[GeneratedImageGroup]:
+        """
+        최신순 (created_at DESC, id DESC) keyset pagination.
+        after 는 이전 페이지 마지막 그룹의 (created_at, id) 이며, idx_generated_image_group_user_created_at_id 를 탄다.
+        limit 이 None 이면 after 이후 전체를 반환한다.
+        """
+        stmt = select(GeneratedImageGroup).where(
+            GeneratedImageGroup.user_id == user_id,
+            GeneratedImageGroup.deleted == False
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(GeneratedImageGroup.created_at, GeneratedImageGroup.id) < tuple_(*after))
+        stmt = stmt.order_by(GeneratedImageGroup.created_at.desc(), GeneratedImageGroup.id.desc()).limit(limit)
+        return list((await self.db.scalars(stmt)).all())
+
+    async def get_by_generation_request(self, generation_request_id: int) -> GeneratedImageGroup:
+        stmt = select(GeneratedImageGroup).where(
+            GeneratedImageGroup.generation_request_id == generation_request_id,
+            GeneratedImageGroup.deleted == False
+        )
+        return (await self.db.execute(stmt)).scalar_one()
+
+async def get_async_generated_image_group_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncGeneratedImageGroupRepository:
+    return AsyncGeneratedImageGroupRepository(db=db)
@@ -0,0 +1,37 @@
+from typing import List
+
+from fastapi import Depends
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db.base import get_async_db
+from app.domain.generation.models.mq_outbox import MQOutbox
+from app.domain.generation.schemas.mq_outbox import MQOutboxCreate, MQOutboxUpdate
+from app.infrastructure.repositories.async_crud_repository import AsyncCRUDRepository
+
+
+class AsyncMQOutboxRepository(AsyncCRUDRepository[MQOutbox, MQOutboxCreate, MQOutboxUpdate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(model=MQOutbox, db=db)
+
+    async def get_pending_for_update(self, limit: int) -> List[MQOutbox]:
+        """
+        발행 대기 중인 메시지를 기록 순서대로 잠그고 가져온다.
+        SKIP LOCKED 이므로 여러 relay (replica) 가 같은 메시지를 중복 발행하지 않는다.
+        """
+        stmt = (
+            select(MQOutbox)
+            .order_by(MQOutbox.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list((await self.db.scalars(stmt)).all())
+
+    async def delete_all_in(self, obj_id_list: List[int]) -> None:
+        if not obj_id_list:
+            return
+        await self.db.execute(delete(MQOutbox).where(MQOutbox.id.in_(obj_id_list)))
+
+
+async def get_async_mq_outbox_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncMQOutboxRepository:
+    return AsyncMQOutboxRepository(db=db)
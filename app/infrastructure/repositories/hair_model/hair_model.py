@@ -1,16 +1,18 @@
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import update, select, func, and_
 from typing import List, Tuple
 from collections import defaultdict
 from fastapi import Depends
 
-from app.core.db.base import get_db
+from app.core.db.base import get_db, get_async_db
 from app.domain.hair_model.models.scene import Background, PostureAndClothing, ImageResolution
 from app.domain.hair_model.schemas.scene.background import BackgroundCreate, BackgroundUpdate
 from app.domain.hair_model.schemas.scene.image_resolution import ImageResolutionCreate, ImageResolutionUpdate
 from app.domain.hair_model.schemas.scene.posture_and_clothing import PostureAndClothingUpdate, PostureAndClothingCreate
 from app.infrastructure.repositories.crud_repository import CRUDRepository
+from app.infrastructure.repositories.async_crud_repository import AsyncCRUDRepository
 from app.domain.hair_model.schemas.hair.color import ColorCreate, ColorUpdate, SpecificColorCreate, SpecificColorUpdate
 from app.domain.hair_model.schemas.hair.gender import *
 from app.domain.hair_model.models.hair import Gender, HairStyle, Length, Color, SpecificColor, LoRAModel, HairStyleLength, HairDesign, \
@@ -277,3 +279,136 @@ class ImageResolutionRepository(CRUDRepository[ImageResolution, ImageResolutionC
 
 def get_image_resolution_repository(db: Session = Depends(get_db)) -> ImageResolutionRepository:
     return ImageResolutionRepository(db=db)
+
+
+class AsyncGenderRepository(AsyncCRUDRepository[Gender, GenderCreate, GenderUpdate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(model=Gender, db=db)
+
+async def get_async_gender_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncGenderRepository:
+    return AsyncGenderRepository(db=db)
+
+
+class AsyncHairStyleRepository(AsyncCRUDRepository[HairStyle, HairStyleCreate, HairStyleUpdate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(model=HairStyle, db=db)
+
+    async def get_all_by_gender(self, gender_id: int) -> List[HairStyle]:
+        stmt = select(HairStyle).where(HairStyle.gender_id == gender_id)
+        return list((await self.db.scalars(stmt)).all())
+
+async def get_async_hair_style_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncHairStyleRepository:
+    return AsyncHairStyleRepository(db=db)
+
+
+class AsyncSpecificColorRepository(AsyncCRUDRepository[SpecificColor, SpecificColorCreate, SpecificColorUpdate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(model=SpecificColor, db=db)
+
+    async def get_all_by_color_limit(self, color_id: int, limit: int = 10) -> List[SpecificColor]:
+        stmt = select(SpecificColor).where(SpecificColor.color_id == color_id).limit(limit)
+        return list((await self.db.scalars(stmt)).all())
+
+async def get_async_specific_color_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncSpecificColorRepository:
+    return AsyncSpecificColorRepository(db=db)
+
+
+class AsyncHairStyleLengthRepository(AsyncCRUDRepository[HairStyleLength, HairStyleLengthCreate, HairStyleLengthUpdate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(model=HairStyleLength, db=db)
+
+    async def get_all_by_hair_style_with_length(self, hair_style_id: int) -> List[HairStyleLength]:
+        stmt = (
+            select(HairStyleLength)
+            .options(joinedload(HairStyleLength.length))
+            .where(HairStyleLength.hair_style_id == hair_style_id)
+        )
+        return list((await self.db.scalars(stmt)).all())
+
+async def get_async_hair_style_length_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncHairStyleLengthRepository:
+    return AsyncHairStyleLengthRepository(db=db)
+
+
+class AsyncHairDesignRepository(AsyncCRUDRepository[HairDesign, HairDesignCreate, HairDesignUpdate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(model=HairDesign, db=db)
+
+    async def get_by_hair_style_and_length(self, hair_style_id: int, length_id: int) -> HairDesign:
+        stmt = select(HairDesign).where(
+            and_(
+                HairDesign.hair_style_id == hair_style_id,
+                HairDesign.length_id == length_id
+            )
+        )
+
+        try:
+            return (await self.db.execute(stmt)).scalar_one()
+        except NoResultFound:
+            raise ValueError(f"HairDesign with hairstyle id: {hair_style_id}, length_id: {length_id} does not exist in the database")
+
+async def get_async_hair_design_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncHairDesignRepository:
+    return AsyncHairDesignRepository(db=db)
+
+
+class AsyncHairDesignColorRepository(AsyncCRUDRepository[HairDesignColor, HairDesignColorCreate, HairDesignColorUpdate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(model=HairDesignColor, db=db)
+
+    async def get_all_by_hair_design_with_color(self, hair_design_id: int) -> List[HairDesignColor]:
+        stmt = (
+            select(HairDesignColor)
+            .options(joinedload(HairDesignColor.color))
+            .where(HairDesignColor.hair_design_id == hair_design_id)
+        )
+        return list((await self.db.scalars(stmt)).all())
+
+async def get_async_hair_design_color_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncHairDesignColorRepository:
+    return AsyncHairDesignColorRepository(db=db)
+
+
+class AsyncHairVariantModelRepository(AsyncCRUDRepository[HairVariantModel, HairVariantModelCreate, HairVariantModelUpdate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(model=HairVariantModel, db=db)
+
+    async def get_by_hair_style_length_color(self, hair_style_id: int, length_id: Optional[int], color_id: int) -> HairVariantModel:
+        stmt = select(HairVariantModel).filter_by(
+            hair_style_id=hair_style_id,
+            length_id=length_id,
+            color_id=color_id
+        )
+        result = (await self.db.execute(stmt)).scalar_one_or_none()
+        if not result:
+            raise ValueError(
+                f"There is no corresponding HairVariantModel with hs_id: {hair_style_id}, length_id: {length_id}, color_id: {color_id}")
+        return result
+
+async def get_async_hair_variant_model_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncHairVariantModelRepository:
+    return AsyncHairVariantModelRepository(db=db)
+
+
+class AsyncBackgroundRepository(AsyncCRUDRepository[Background, BackgroundCreate, BackgroundUpdate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(model=Background, db=db)
+
+async def get_async_background_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncBackgroundRepository:
+    return AsyncBackgroundRepository(db=db)
+
+
+class AsyncPostureAndClothingRepository(AsyncCRUDRepository[PostureAndClothing, PostureAndClothingCreate, PostureAndClothingUpdate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(model=PostureAndClothing, db=db)
+
+    async def get_random_records_in_gender(self, gender_id: int, limit: int = 10) -> List[PostureAndClothing]:
+        stmt = select(PostureAndClothing).where(PostureAndClothing.gender_id == gender_id).order_by(func.random()).limit(limit)
+        return list((await self.db.scalars(stmt)).all())
+
+async def get_async_posture_and_clothing_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncPostureAndClothingRepository:
+    return AsyncPostureAndClothingRepository(db=db)
+
+
+class AsyncImageResolutionRepository(AsyncCRUDRepository[ImageResolution, ImageResolutionCreate, ImageResolutionUpdate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(model=ImageResolution, db=db)
+
+async def get_async_image_resolution_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncImageResolutionRepository:
+    return AsyncImageResolutionRepository(db=db)
@@ -0,0 +1,38 @@
+from typing import List
+from datetime import datetime
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.db.base import get_db
+from app.core.enums.notification_status import NotificationStatusEnum
+from app.domain.notification.models.notification_outbox import NotificationOutbox
+from app.domain.notification.schemas.notification_outbox import NotificationOutboxCreate, NotificationOutboxUpdate
+from app.infrastructure.repositories.crud_repository import CRUDRepository
+
+
+class NotificationOutboxRepository(CRUDRepository[NotificationOutbox, NotificationOutboxCreate, NotificationOutboxUpdate]):
+    def __init__(self, db: Session):
+        super().__init__(model=NotificationOutbox, db=db)
+
+    def get_due_for_update(self, now: datetime, limit: int) -> List[NotificationOutbox]:
+        """
+        전송할 차례가 된 PENDING 알림을 잠그고 가져온다.
+        SKIP LOCKED 이므로 여러 sender (replica) 가 같은 row 를 중복 전송하지 않는다.
+        """
+        stmt = (
+            select(NotificationOutbox)
+            .where(
+                NotificationOutbox.status == NotificationStatusEnum.PENDING,
+                NotificationOutbox.next_attempt_at <= now
+            )
+            .order_by(NotificationOutbox.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(self.db.scalars(stmt).all())
+
+
+def get_notification_outbox_repository(db: Session = Depends(get_db)) -> NotificationOutboxRepository:
+    return NotificationOutboxRepository(db=db)
@@ -1,9 +1,11 @@
 from fastapi import Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
 
-from app.core.db.base import get_db
+from app.core.db.base import get_db, get_async_db
 from app.infrastructure.repositories.crud_repository import CRUDRepository
+from app.infrastructure.repositories.async_crud_repository import AsyncCRUDRepository
 from app.domain.user.models.user import User
 from app.domain.user.schemas.user import UserCreate, UserUpdate
 
@@ -16,5 +18,18 @@ class UserRepository(CRUDRepository[User, UserCreate, UserUpdate]):
         stmt = select(User).filter_by(provider=provider, social_id=social_id, deleted=False)
         return self.db.execute(stmt).scalar_one()
 
+    def clear_fcm_token(self, user_id: int, fcm_token: str) -> None:
+        """만료된 fcm token 정리 - 그 사이 새 token 으로 바뀌었으면 건드리지 않는다."""
+        stmt = update(User).where(User.id == user_id, User.fcm_token == fcm_token).values(fcm_token=None)
+        self.db.execute(stmt)
+
 def get_user_repository(db: Session = Depends(get_db)):
-    return UserRepository(db=db)
\ No newline at end of file
+    return UserRepository(db=db)
+
+
+class AsyncUserRepository(AsyncCRUDRepository[User, UserCreate, UserUpdate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(model=User, db=db)
+
+async def get_async_user_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncUserRepository:
+    return AsyncUserRepository(db=db)
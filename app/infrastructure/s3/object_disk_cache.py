@@ -0,0 +1,116 @@
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+# 한 번 scan 할 때 max_bytes 의 이 비율까지 지워서, 가득 찬 뒤에도 put 마다 scan 하지 않도록 한다.
+EVICT_TARGET_RATIO = 0.9
+# 이 시간보다 오래된 임시 파일은 쓰다가 죽은 process 가 남긴 것으로 보고 지운다.
+STALE_TMP_FILE_SEC = 60 * 60
+
+
+class S3ObjectDiskCache:
+    """
+    최근에 읽은 s3 object 를 로컬 디스크에 보관하는 캐시.
+    파일 이름은 s3 key 의 sha256 이고, 전체 크기가 max_bytes 를 넘으면 접근 시각이 오래된 파일부터 지운다.
+    쓰기는 임시 파일 + os.replace 로 처리해서 다른 thread / process 가 반쯤 쓰인 파일을 읽지 않도록 한다.
+    전체 크기는 put 마다 누적해두고, max_bytes 를 넘을 때만 디렉토리를 scan 해서 (다른 process 가 쓴 파일 포함) 다시 맞춘다.
+    """
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        with self._lock:
+            self._scan_and_evict()
+
+    def get(self, s3_key: str) -> Optional[bytes]:
+        path = self._path(s3_key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"[S3DiskCache] failed to read {s3_key}: {e}")
+            return None
+
+    def put(self, s3_key: str, data: bytes) -> None:
+        path = self._path(s3_key)
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            replaced_size = self._file_size(path)
+            os.replace(tmp_path, path)
+            tmp_path = None
+        except OSError as e:
+            logger.warning(f"[S3DiskCache] failed to write {s3_key}: {e}")
+            return
+        finally:
+            if tmp_path is not None:
+                self._remove(tmp_path)
+
+        with self._lock:
+            self._total_bytes += len(data) - replaced_size
+            if self._total_bytes > self.max_bytes:
+                self._scan_and_evict()
+
+    def _scan_and_evict(self) -> None:
+        """lock 을 잡은 상태에서 호출한다. 남은 임시 파일을 정리하고, 실제 크기를 다시 계산해 오래된 파일부터 지운다."""
+        try:
+            entries = [entry for entry in os.scandir(self.cache_dir) if entry.is_file()]
+        except OSError as e:
+            logger.warning(f"[S3DiskCache] failed to scan {self.cache_dir}: {e}")
+            return
+
+        now = time.time()
+        stats = []
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            if entry.name.endswith(".tmp"):
+                if now - stat.st_mtime > STALE_TMP_FILE_SEC:
+                    self._remove(entry.path)
+                continue
+            stats.append((entry.path, stat))
+
+        total = sum(stat.st_size for _, stat in stats)
+        if total > self.max_bytes:
+            target = self.max_bytes * EVICT_TARGET_RATIO
+            for path, stat in sorted(stats, key=lambda item: item[1].st_mtime):
+                if self._remove(path):
+                    total -= stat.st_size
+                if total <= target:
+                    break
+        self._total_bytes = total
+
+    @staticmethod
+    def _file_size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+    def _path(self, s3_key: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(s3_key.encode('utf-8')).hexdigest())
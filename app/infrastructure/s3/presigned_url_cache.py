@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.core.config import aws_s3_setting
+
+PresignedUrlCacheKey = Tuple[str, str, int]
+
+
+class PresignedUrlCache:
+    """
+    (s3_key, http_method, expiration) 단위로 presigned url 을 재사용하는 LRU 캐시.
+    서명 시각 + expiration - reuse_margin_sec 이 지나기 전까지는 같은 url 을 돌려준다.
+    url 이 안정적으로 유지되므로 클라이언트 쪽 http 캐시도 적중한다.
+    process 단위 싱글톤인 S3Client 가 가지고 있어 process 전체에서 공유되며, 여러 thread 에서 동시에 호출되므로 lock 을 사용한다.
+    """
+    def __init__(self, max_entries: int, reuse_margin_sec: int):
+        self.max_entries = max_entries
+        self.reuse_margin_sec = reuse_margin_sec
+
+        self._entries: OrderedDict[PresignedUrlCacheKey, Tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hit_count: int = 0
+        self.miss_count: int = 0
+
+    def get(self, key: PresignedUrlCacheKey) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.miss_count += 1
+                return None
+
+            url, reusable_until = entry
+            if now >= reusable_until:
+                del self._entries[key]
+                self.miss_count += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hit_count += 1
+            return url
+
+    def put(self, key: PresignedUrlCacheKey, url: str, signed_at: float) -> None:
+        _, _, expiration = key
+        # 만료가 margin 보다 짧은 url 은 재사용할 구간이 없다.
+        if expiration <= self.reuse_margin_sec:
+            return
+
+        with self._lock:
+            self._entries[key] = (url, signed_at + expiration - self.reuse_margin_sec)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            size = len(self._entries)
+        total = self.hit_count + self.miss_count
+        return {
+            "size": size,
+            "max_entries": self.max_entries,
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "hit_ratio": round(self.hit_count / total, 4) if total else None,
+        }
+
+
+presigned_url_cache = PresignedUrlCache(
+    max_entries=aws_s3_setting.PRESIGNED_URL_CACHE_MAX_ENTRIES,
+    reuse_margin_sec=aws_s3_setting.PRESIGNED_URL_REUSE_MARGIN_SEC,
+)
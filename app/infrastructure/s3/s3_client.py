@@ -1,10 +1,15 @@
 import logging
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List
 import boto3
 from botocore.exceptions import ClientError
 from botocore.client import Config
 
 from app.core.config import aws_s3_setting
+from app.infrastructure.s3.object_disk_cache import S3ObjectDiskCache
+from app.infrastructure.s3.presigned_url_cache import PresignedUrlCache, presigned_url_cache
 
 
 class S3Client:
@@ -13,28 +18,60 @@ class S3Client:
             aws_access_key_id: str = aws_s3_setting.AWS_ACCESS_KEY_ID,
             aws_secret_access_key: str = aws_s3_setting.AWS_SECRET_ACCESS_KEY,
             region_name: str = aws_s3_setting.REGION_NAME,
-            bucket_name: str = aws_s3_setting.BUCKET_NAME
+            bucket_name: str = aws_s3_setting.BUCKET_NAME,
+            max_pool_connections: int = aws_s3_setting.MAX_POOL_CONNECTIONS,
+            url_cache: PresignedUrlCache = presigned_url_cache,
+            object_fetch_concurrency: int = aws_s3_setting.OBJECT_FETCH_CONCURRENCY,
+            object_disk_cache: Optional[S3ObjectDiskCache] = None
     ):
         self.aws_access_key_id = aws_access_key_id
         self.aws_secret_access_key = aws_secret_access_key
         self.region_name = region_name
         self.bucket_name = bucket_name
+        self.url_cache = url_cache
+        self.object_disk_cache = object_disk_cache
+        self._fetch_executor = ThreadPoolExecutor(max_workers=object_fetch_concurrency, thread_name_prefix="s3-fetch")
 
-        self.s3_client = boto3.client(
+        # boto3 기본 session 은 thread-safe 하지 않으므로 전용 session 으로 client 를 만든다.
+        self.s3_client = boto3.session.Session().client(
             's3',
             aws_access_key_id=self.aws_access_key_id,
             aws_secret_access_key=self.aws_secret_access_key,
             region_name=self.region_name,
-            config=Config(signature_version='s3v4')  # SigV4 서명 사용
+            config=Config(
+                signature_version='s3v4',  # SigV4 서명 사용
+                max_pool_connections=max_pool_connections
+            )
         )
 
+    def warm_up(self) -> None:
+        """
+        서명기 초기화 및 connection pool 에 첫 연결을 미리 만들어 둔다.
+        실패해도 서비스 기동은 계속한다.
+        """
+        try:
+            self.s3_client.generate_presigned_url(
+                'get_object',
+                Params={'Bucket': self.bucket_name, 'Key': 'warm-up'},
+                ExpiresIn=60
+            )
+            self.s3_client.head_bucket(Bucket=self.bucket_name)
+        except Exception as e:
+            logging.warning(f"S3 warm-up request failed: {e}")
+
     def create_presigned_url(
             self,
             s3_key: str,
             expiration: int = aws_s3_setting.PRESIGNED_URL_EXPIRATION_SEC,
             http_method: str = 'GET'
     ) -> Optional[str]:
+        cache_key = (s3_key, http_method, expiration)
+        cached_url = self.url_cache.get(cache_key)
+        if cached_url is not None:
+            return cached_url
+
         try:
+            signed_at = time.time()
             response = self.s3_client.generate_presigned_url(
                 'get_object',
                 Params={
@@ -44,11 +81,36 @@ class S3Client:
                 ExpiresIn=expiration,
                 HttpMethod=http_method
             )
+            self.url_cache.put(cache_key, response, signed_at)
             return response
         except ClientError as e:
             logging.error(f"Error creating presigned URL: {e}")
             return None
 
+    def get_object_bytes(self, s3_key: str) -> bytes:
+        """
+        presigned url 을 거치지 않고 pool 된 client 로 object 를 직접 읽는다.
+        disk cache 가 설정된 경우 먼저 확인하고, 읽은 결과를 저장한다.
+        """
+        if self.object_disk_cache is not None:
+            cached = self.object_disk_cache.get(s3_key)
+            if cached is not None:
+                return cached
+
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
+        with response['Body'] as body:
+            data = body.read()
+
+        if self.object_disk_cache is not None:
+            self.object_disk_cache.put(s3_key, data)
+        return data
+
+    def get_objects_bytes(self, s3_keys: List[str]) -> List[bytes]:
+        """여러 object 를 동시에 읽어 입력 순서대로 반환 (전체 소요 시간은 가장 느린 object 기준)"""
+        if len(s3_keys) <= 1:
+            return [self.get_object_bytes(s3_key) for s3_key in s3_keys]
+        return list(self._fetch_executor.map(self.get_object_bytes, s3_keys))
+
     def upload_to_s3(self, key, image_data, image_format='JPEG'):
         """
         이미지 데이터를 S3에 업로드
@@ -74,5 +136,27 @@ class S3Client:
             logging.error(e)
             return False
 
+_s3_client: Optional[S3Client] = None
+_s3_client_lock = threading.Lock()
+
 def get_s3_client() -> S3Client:
-    return S3Client()
+    """
+    S3Client 의 싱글톤 인스턴스를 반환
+    API handler, MQ consumer, retry task 가 같은 boto3 client 와 connection pool 을 공유한다.
+    """
+    global _s3_client
+
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                _s3_client = S3Client(
+                    object_disk_cache=(
+                        S3ObjectDiskCache(
+                            cache_dir=aws_s3_setting.OBJECT_DISK_CACHE_DIR,
+                            max_bytes=aws_s3_setting.OBJECT_DISK_CACHE_MAX_BYTES
+                        )
+                        if aws_s3_setting.OBJECT_DISK_CACHE_DIR else None
+                    )
+                )
+
+    return _s3_client
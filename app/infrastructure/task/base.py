@@ -26,7 +26,11 @@ class AsyncTaskManager(ABC):
             except Exception as e:
                 logger.error(f"Task execution error: {e}")
             finally:
-                await asyncio.sleep(self.check_interval)
+                await self.wait_next()
+
+    async def wait_next(self):
+        """다음 execute 까지 대기 - 외부 신호로 깨워야 하는 태스크는 재정의한다."""
+        await asyncio.sleep(self.check_interval)
 
     async def stop(self):
         self.is_running = False
\ No newline at end of file
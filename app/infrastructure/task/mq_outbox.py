@@ -0,0 +1,49 @@
+import asyncio
+import logging
+from typing import Optional
+
+from fastapi import Request
+
+from app.application.services.generation.mq_outbox import relay_mq_outbox_batch
+from app.core.config import mq_outbox_setting
+from app.infrastructure.mq.rabbit_mq_service import RabbitMQService
+from app.infrastructure.task.base import AsyncTaskManager
+
+logger = logging.getLogger(__name__)
+
+
+class MQOutboxRelayTaskManager(AsyncTaskManager):
+    """
+    mq_outbox 를 RabbitMQ 로 발행하는 relay.
+    같은 process 의 요청이 commit 되면 notify 로 바로 깨어나고, 그 외에는 POLL_INTERVAL_SEC 마다 확인한다.
+    """
+    def __init__(
+            self,
+            rabbit_mq_service: RabbitMQService,
+            check_interval: int = mq_outbox_setting.POLL_INTERVAL_SEC
+    ):
+        super().__init__(check_interval)
+        self.rabbit_mq_service = rabbit_mq_service
+        self._wakeup = asyncio.Event()
+
+    async def notify(self):
+        self._wakeup.set()
+
+    async def execute(self):
+        # 배치가 가득 찼다면 밀린 메시지가 더 있으므로 바로 다음 배치를 발행한다.
+        while True:
+            relayed_count = await relay_mq_outbox_batch(self.rabbit_mq_service)
+            if relayed_count < mq_outbox_setting.BATCH_SIZE:
+                return
+
+    async def wait_next(self):
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.check_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+
+async def get_mq_outbox_relay(request: Request) -> Optional[MQOutboxRelayTaskManager]:
+    """LifespanServices 가 들고 있는 relay 를 반환 (relay 를 돌리지 않는 process 에서는 None)"""
+    return request.app.state.services.mq_outbox_relay
@@ -0,0 +1,21 @@
+import asyncio
+import logging
+
+from app.application.services.notification.outbox import deliver_notification_outbox_batch
+from app.core.config import notification_outbox_setting
+from app.infrastructure.task.base import AsyncTaskManager
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationOutboxSenderTaskManager(AsyncTaskManager):
+    """notification outbox 의 PENDING 알림을 주기적으로 FCM 전송한다."""
+    def __init__(self, check_interval: int = notification_outbox_setting.POLL_INTERVAL_SEC):
+        super().__init__(check_interval)
+
+    async def execute(self):
+        # 배치가 가득 찼다면 밀린 알림이 더 있으므로 바로 다음 배치를 보낸다.
+        while True:
+            delivered_count = await asyncio.to_thread(deliver_notification_outbox_batch)
+            if delivered_count < notification_outbox_setting.BATCH_SIZE:
+                return
@@ -0,0 +1,17 @@
+from app.core.config import rabbit_mq_setting
+from app.infrastructure.mq.rabbit_mq_service import RabbitMQService
+from app.infrastructure.task.base import AsyncTaskManager
+
+
+class QueueInfoPollerTaskManager(AsyncTaskManager):
+    """publish queue 의 message / consumer 수 snapshot 을 주기적으로 갱신한다."""
+    def __init__(
+            self,
+            rabbit_mq_service: RabbitMQService,
+            check_interval: int = rabbit_mq_setting.QUEUE_INFO_REFRESH_INTERVAL_SEC
+    ):
+        super().__init__(check_interval)
+        self.rabbit_mq_service = rabbit_mq_service
+
+    async def execute(self):
+        await self.rabbit_mq_service.refresh_queue_info()
@@ -1,16 +1,86 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, UTC, timedelta
+from typing import Optional
+
 from app.application.services.generation.retry import retry_expired_jobs
+from app.core.config import retry_scheduler_setting
+from app.infrastructure.auth.redis_client import get_async_redis_client
+from app.infrastructure.cache.job_expiry_schedule import JobExpirySchedule, get_job_expiry_schedule
+from app.infrastructure.cache.leader_lease import RedisLeaderLease
 from app.infrastructure.mq.rabbit_mq_service import RabbitMQService
 from app.infrastructure.task.base import AsyncTaskManager
 
+logger = logging.getLogger(__name__)
+
 
 class RetryTaskManager(AsyncTaskManager):
+    """
+    만료 job retry.
+    job 만료 타이머 (Redis sorted set) 의 가장 이른 만료 시각까지만 잠들었다가, 만료된 job 이 있으면 바로 retry 경로를 실행한다.
+    타이머 누락 (Redis 장애 등) 에 대비해 SAFETY_NET_INTERVAL_SEC 마다 한 번은 만료 job 이 없어도 DB 를 스캔한다.
+    replica 가 여러 개여도 leader lease 를 가진 replica 하나만 실행한다.
+    만료 job 은 SKIP LOCKED 로 잠그고 처리하므로, Redis 장애로 lease 를 확인하지 못할 때는 모든 replica 가 실행해도 중복 재발행되지 않는다.
+    """
+    LEADER_LEASE_NAME = "generation_retry"
+
     def __init__(
             self,
             rabbit_mq_service: RabbitMQService,
-            check_interval: int = 60
+            job_expiry_schedule: Optional[JobExpirySchedule] = None,
+            leader_lease: Optional[RedisLeaderLease] = None,
+            check_interval: float = retry_scheduler_setting.MAX_WAIT_SEC
     ):
         super().__init__(check_interval)
         self.rabbit_mq_service = rabbit_mq_service
+        self.job_expiry_schedule = job_expiry_schedule or get_job_expiry_schedule()
+        self.leader_lease = leader_lease or RedisLeaderLease(
+            async_redis=get_async_redis_client(),
+            name=self.LEADER_LEASE_NAME,
+            ttl_sec=retry_scheduler_setting.LEADER_LEASE_TTL_SEC,
+            fail_open=True,
+        )
+        self._last_scanned_at: Optional[float] = None
 
     async def execute(self):
-        await retry_expired_jobs(rabbit_mq_service=self.rabbit_mq_service)
\ No newline at end of file
+        if not await self.leader_lease.acquire_or_renew():
+            return
+
+        due_job_ids = await self.job_expiry_schedule.pop_due(
+            now=time.time(), limit=retry_scheduler_setting.POP_BATCH_SIZE
+        )
+        if not due_job_ids and not self._is_safety_net_scan_due():
+            return
+
+        if due_job_ids:
+            logger.info(f"[Retry] {len(due_job_ids)} jobs reached expires_at")
+        try:
+            await retry_expired_jobs(rabbit_mq_service=self.rabbit_mq_service)
+        except Exception:
+            # 꺼낸 타이머를 잃지 않도록 잠시 뒤로 다시 예약한다.
+            retry_at = datetime.now(UTC) + timedelta(seconds=retry_scheduler_setting.FAILURE_BACKOFF_SEC)
+            await self.job_expiry_schedule.schedule({job_id: retry_at for job_id in due_job_ids})
+            raise
+        self._last_scanned_at = time.monotonic()
+
+    async def wait_next(self):
+        wait_sec = self.check_interval
+        if not self.leader_lease.is_leader:
+            # follower 는 타이머를 보지 않고 leader 자리만 주기적으로 확인한다.
+            await asyncio.sleep(wait_sec)
+            return
+        next_due_at = await self.job_expiry_schedule.get_next_due_at()
+        if next_due_at is not None:
+            wait_sec = min(wait_sec, max(0.0, next_due_at - time.time()))
+        await asyncio.sleep(wait_sec)
+
+    async def release_leadership(self) -> None:
+        """종료 시 lease 를 바로 넘겨 다른 replica 가 ttl 만큼 기다리지 않게 한다."""
+        await self.leader_lease.release()
+
+    def _is_safety_net_scan_due(self) -> bool:
+        return (
+                self._last_scanned_at is None
+                or time.monotonic() - self._last_scanned_at >= retry_scheduler_setting.SAFETY_NET_INTERVAL_SEC
+        )
@@ -0,0 +1,80 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Set
+
+from app.application.services.generation.thumbnail import create_group_thumbnail, get_thumbnail_pending_group_ids
+from app.core.config import thumbnail_setting
+from app.infrastructure.task.base import AsyncTaskManager
+
+logger = logging.getLogger(__name__)
+
+
+class ThumbnailPipeline:
+    """
+    이미지 그룹 썸네일 / 이미지 축소본 생성 단계.
+    생성 결과 consume 트랜잭션이 끝난 뒤 group id 를 받아, 전용 worker pool 에서 다운로드 / 합성 / 업로드를 처리한다.
+    queue 가 가득 차면 submit 이 대기하므로 consume 쪽에 backpressure 가 걸린다.
+    """
+    def __init__(
+            self,
+            worker_count: int = thumbnail_setting.WORKER_COUNT,
+            queue_size: int = thumbnail_setting.QUEUE_SIZE,
+    ):
+        self.worker_count = worker_count
+        self._queue: asyncio.Queue[int] = asyncio.Queue(maxsize=queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="thumbnail")
+        self._workers: List[asyncio.Task] = []
+        # queue 에 들어있거나 처리 중인 group - 같은 process 안에서 recovery 와 중복으로 queue 에 넣지 않도록 한다.
+        # (replica 간 중복 처리는 create_group_thumbnail 의 DB claim 이 막는다.)
+        self._in_progress: Set[int] = set()
+
+    def start(self) -> None:
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.worker_count)]
+
+    async def submit(self, generated_image_group_id: Optional[int]) -> None:
+        if generated_image_group_id is None or generated_image_group_id in self._in_progress:
+            return
+        self._in_progress.add(generated_image_group_id)
+        await self._queue.put(generated_image_group_id)
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _work(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            generated_image_group_id = await self._queue.get()
+            try:
+                await loop.run_in_executor(self._executor, create_group_thumbnail, generated_image_group_id)
+            except Exception as e:
+                logger.error(f"[Thumbnail] group {generated_image_group_id} failed: {e}", exc_info=True)
+            finally:
+                self._in_progress.discard(generated_image_group_id)
+                self._queue.task_done()
+
+
+class ThumbnailRecoveryTaskManager(AsyncTaskManager):
+    """
+    process 종료 등으로 PENDING 에 남은 썸네일을 다시 파이프라인에 넣는다.
+    다른 worker 가 claim 해 처리 중인 그룹은 lease 가 만료되기 전까지 대상에서 제외된다.
+    """
+    def __init__(
+            self,
+            thumbnail_pipeline: ThumbnailPipeline,
+            check_interval: int = thumbnail_setting.RECOVERY_INTERVAL_SEC
+    ):
+        super().__init__(check_interval)
+        self.thumbnail_pipeline = thumbnail_pipeline
+
+    async def execute(self):
+        pending_group_ids = await asyncio.to_thread(
+            get_thumbnail_pending_group_ids, thumbnail_setting.RECOVERY_PENDING_AFTER_SEC
+        )
+        if pending_group_ids:
+            logger.info(f"[Thumbnail] recovering {len(pending_group_ids)} pending thumbnails")
+        for generated_image_group_id in pending_group_ids:
+            await self.thumbnail_pipeline.submit(generated_image_group_id)
@@ -1,18 +1,20 @@
 from fastapi import FastAPI
 
-from app.core.api.concurrent_request_middleware import ConcurrentRequestMiddleware
+from app.core.api.concurrency_limit_middleware import ConcurrencyLimitMiddleware, ConcurrencyLimiterRegistry
 from app.core.db.base import Base, engine
-from app.core.config import base_settings
+from app.core.config import base_settings, concurrency_limit_setting, worker_setting
 from app.api.v1.api import router
 from app.core.errors.handlers import handle_general_exception
 from app.core.lifecycle import LifespanServices
+from app.infrastructure.s3.presigned_url_cache import presigned_url_cache
+from app.infrastructure.cache.generation_event_broker import get_generation_event_broker
 from contextlib import asynccontextmanager
 
 Base.metadata.create_all(bind=engine)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    services = LifespanServices()
+    services = LifespanServices(run_background_tasks=worker_setting.RUN_BACKGROUND_TASKS)
     await services.initialize()
 
     app.state.services = services
@@ -28,7 +30,8 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-app.add_middleware(ConcurrentRequestMiddleware, max_concurrent=15)
+concurrency_limiter_registry = ConcurrencyLimiterRegistry(concurrency_limit_setting)
+app.add_middleware(ConcurrencyLimitMiddleware, registry=concurrency_limiter_registry)
 app.add_exception_handler(Exception, handle_general_exception)
 app.include_router(router, prefix=base_settings.API_V1_STR)
 
@@ -36,6 +39,14 @@ app.include_router(router, prefix=base_settings.API_V1_STR)
 def health_check():
     return {"status" : "ok"}
 
+@app.get("/metrics")
+async def metrics():
+    return {
+        "concurrency_limits": concurrency_limiter_registry.snapshot(),
+        "presigned_url_cache": presigned_url_cache.snapshot(),
+        "generation_event_subscribers": get_generation_event_broker().subscriber_count()
+    }
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -0,0 +1,38 @@
+import asyncio
+import logging
+import signal
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.config import worker_setting
+from app.core.lifecycle import LifespanServices
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker():
+    """
+    background 태스크 전용 process (python -m app.worker).
+    생성 결과 consume / 썸네일, 만료 job retry, 알림 outbox 전송을 웹 process 와 다른 event loop / thread pool 에서 돌린다.
+    웹은 RUN_BACKGROUND_TASKS=false 로 띄우고, 웹 / worker replica 수는 따로 조정한다.
+    """
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=worker_setting.THREAD_POOL_SIZE, thread_name_prefix="worker")
+    )
+
+    stop_event = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    services = LifespanServices(run_api_services=False, run_background_tasks=True)
+    await services.initialize()
+    logger.info("[Worker] background tasks started")
+    try:
+        await stop_event.wait()
+    finally:
+        logger.info("[Worker] shutting down")
+        await services.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_worker())